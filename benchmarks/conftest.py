@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.data import make_query_response_bytes
+
+
+"""
+The benchmark suite, run with pytest-benchmark.
+
+Run it from the project root with `pytest benchmarks`. See the README for
+saving and comparing baselines.
+"""
+
+# The mock response, a typical page and the biggest one a single query gets
+LISTING_COUNTS = [1, 100, 10_000]
+
+
+@pytest.fixture(scope="session", params=LISTING_COUNTS, ids=lambda count: f"{count}")
+def query_response(request: pytest.FixtureRequest) -> bytes:
+    count: int = request.param
+    return make_query_response_bytes(count)
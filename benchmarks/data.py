@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import copy
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from typing_extensions import override
+
+from marktplaats.cache import CachedResponse
+from marktplaats.transport import Transport
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+    from requests import Response
+
+    from marktplaats.api_types import QueryResponse
+
+
+MOCK_DIR = Path(__file__).resolve().parent.parent / "tests" / "mock"
+
+_CITIES = ["Amsterdam", "Rotterdam", "Utrecht", "Den Haag", "Eindhoven", "Groningen"]
+_DATES = ["Vandaag", "Gisteren", "Eergisteren", "10 mrt 24", "3 okt 23", "28 dec 22"]
+_PRICE_TYPES = ["FIXED", "FIXED", "FIXED", "MIN_BID", "FAST_BID", "SEE_DESCRIPTION"]
+
+
+def read_mock(name: str) -> str:
+    return (MOCK_DIR / name).read_text(encoding="utf-8")
+
+
+def make_query_response(count: int) -> QueryResponse:
+    """
+    Build a search response with `count` listings, based on the mock response.
+
+    The listings differ in the fields that vary in real responses (IDs, prices,
+    dates, cities, sellers), while the rest is copied from the mock listing.
+
+    Returns:
+        The decoded search response.
+
+    """
+    body: QueryResponse = json.loads(read_mock("query_response.json"))
+    (template,) = body["listings"]
+    listings = []
+    for i in range(count):
+        listing = copy.deepcopy(template)
+        listing["itemId"] = f"m{2_000_000_000 + i}"
+        listing["title"] = f"{template['title']} {i}"
+        listing["priceInfo"]["priceCents"] = 1000 + i * 50
+        listing["priceInfo"]["priceType"] = _PRICE_TYPES[i % len(_PRICE_TYPES)]
+        listing["date"] = _DATES[i % len(_DATES)]
+        listing["location"]["cityName"] = _CITIES[i % len(_CITIES)]
+        listing["location"]["distanceMeters"] = (i % 100) * 1000
+        listing["sellerInformation"]["sellerId"] = 1_000_000 + i % 250
+        listings.append(listing)
+    body["listings"] = listings
+    body["totalResultCount"] = count
+    return body
+
+
+def make_query_response_bytes(count: int) -> bytes:
+    return json.dumps(make_query_response(count)).encode()
+
+
+def report_throughput(benchmark: BenchmarkFixture, listings: int) -> None:
+    """Add the listings per second of a finished benchmark to its results."""
+    metadata = benchmark.stats
+    if metadata is not None:  # None when benchmarks are disabled
+        benchmark.extra_info["listings_per_second"] = listings / metadata.stats.mean
+
+
+def make_pages(count: int, limit: int) -> dict[int, bytes]:
+    """
+    Split a search response with `count` listings into pages of `limit`.
+
+    Returns:
+        The encoded response for every page, by offset.
+
+    """
+    body = make_query_response(count)
+    listings = body["listings"]
+    pages = {}
+    for offset in range(0, count, limit):
+        body["listings"] = listings[offset : offset + limit]
+        pages[offset] = json.dumps(body).encode()
+    return pages
+
+
+class MockTransport(Transport):
+    """
+    A transport that answers every request with a body, without any I/O.
+
+    respond gets the URL and the parameters of a request, and returns the
+    body to answer it with. Everything else a transport does, like caching or
+    instrumentation, still happens.
+    """
+
+    def __init__(  # type: ignore[explicit-any] # Like Transport.get
+        self,
+        respond: Callable[[str, Mapping[str, Any] | None], bytes],
+    ) -> None:
+        super().__init__()
+        self.respond = respond
+
+    @override
+    def _send_once(  # type: ignore[explicit-any] # Like Transport.get
+        self,
+        url: str,
+        params: Mapping[str, Any] | None,
+        *,
+        stream: bool = False,
+    ) -> Response:
+        content = self.respond(url, params)
+        return CachedResponse(url, 200, (), content, "utf-8").to_response()
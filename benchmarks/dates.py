@@ -0,0 +1,67 @@
+"""
+Compare parsing listing dates with strptime and with parse_date.
+
+Run it from the project root with `python -m benchmarks.dates`.
+"""
+
+from __future__ import annotations
+
+import timeit
+from datetime import date, datetime, timedelta
+
+from benchmarks.data import make_query_response
+from marktplaats.parsing import parse_date, replace_dutch_months
+
+
+LISTING_COUNT = 100
+
+
+def parse_date_strptime(date_str: str) -> date:
+    """
+    Parse a date the way parse_date used to.
+
+    Returns:
+        The parsed date.
+
+    """
+    if date_str == "Eergisteren":
+        result = datetime.now() - timedelta(days=2)
+    elif date_str == "Gisteren":
+        result = datetime.now() - timedelta(days=1)
+    elif date_str == "Vandaag":
+        result = datetime.now()
+    else:
+        result = datetime.strptime(replace_dutch_months(date_str), "%d %b %y")
+    return result.date()
+
+
+def main() -> None:
+    dates = [
+        listing["date"] for listing in make_query_response(LISTING_COUNT)["listings"]
+    ]
+    if [parse_date(date_str) for date_str in dates] != [
+        parse_date_strptime(date_str) for date_str in dates
+    ]:
+        msg = "parse_date and strptime disagree"
+        raise AssertionError(msg)
+
+    def strptime_page() -> None:
+        for date_str in dates:
+            parse_date_strptime(date_str)
+
+    def parse_date_page() -> None:
+        today = date.today()  # Once per page, like parse_listings() does
+        for date_str in dates:
+            parse_date(date_str, today=today)
+
+    number = 200
+    old = min(timeit.repeat(strptime_page, number=number, repeat=5)) / number
+    new = min(timeit.repeat(parse_date_page, number=number, repeat=5)) / number
+    print(
+        f"{LISTING_COUNT} dates: strptime {old * 1e6:.0f} us, "
+        f"parse_date {new * 1e6:.0f} us ({old / new:.0f}x faster)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Compare scanning a listing page for its images with parsing it with BeautifulSoup.
+
+Run it from the project root with `python -m benchmarks.images`.
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import TYPE_CHECKING
+
+from benchmarks.data import read_mock
+from marktplaats.models.listing_image import scan_listing_images, soup_listing_images
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+# Real listing pages are a lot bigger than the mock, mostly because of markup
+#  that has nothing to do with the images.
+_FILLER = (
+    '<div class="hz-Card"><a href="/v/fietsen/m123">Fiets</a><span>€ 100</span></div>\n'
+)
+PADDED_SIZE = 500_000
+
+
+def time_per_call(parse: Callable[[bytes], object], html: bytes) -> float:
+    """
+    Time parsing a page, taking the best of a few rounds.
+
+    Returns:
+        The number of milliseconds per parsed page.
+
+    """
+    number = 20
+    best = min(timeit.repeat(lambda: parse(html), number=number, repeat=5))
+    return best / number * 1000
+
+
+def main() -> None:
+    mock = read_mock("image_response.html")
+    head, _, tail = mock.rpartition("</body>")
+    filler = _FILLER * (PADDED_SIZE // len(_FILLER))
+    pages = {
+        "mock page": mock.encode(),
+        "mock page, padded": f"{head}{filler}</body>{tail}".encode(),
+    }
+
+    for page, html in pages.items():
+        if scan_listing_images(html) != soup_listing_images(html):
+            msg = f"Scanning and BeautifulSoup disagree on the {page}"
+            raise AssertionError(msg)
+        soup = time_per_call(soup_listing_images, html)
+        scan = time_per_call(scan_listing_images, html)
+        print(
+            f"{page} ({len(html) // 1000} kB): BeautifulSoup {soup:.2f} ms, "
+            f"scan {scan:.3f} ms ({soup / scan:.0f}x faster)"
+        )
+
+
+if __name__ == "__main__":
+    main()
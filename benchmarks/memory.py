@@ -0,0 +1,81 @@
+"""
+Compare the memory used per listing by Listing and CompactListing.
+
+Run it from the project root with `python -m benchmarks.memory`.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from benchmarks.data import make_query_response_bytes
+from marktplaats.models import CompactListing
+from marktplaats.query import parse_listings
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+LISTING_COUNT = 10_000
+
+
+def measure(build: Callable[[], list[object]]) -> float:
+    """
+    Measure the memory that stays allocated by the result of `build`.
+
+    Returns:
+        The number of bytes per built object.
+
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(result)
+
+
+def main() -> None:
+    # Decoded again for every measurement, so each result only holds on to
+    #  the strings it actually keeps, like it would after a real request.
+    content = make_query_response_bytes(LISTING_COUNT)
+
+    def listings() -> list[object]:
+        return list(parse_listings(json.loads(content), LISTING_COUNT))
+
+    def compact_listings() -> list[object]:
+        parsed = parse_listings(json.loads(content), LISTING_COUNT)
+        return [CompactListing.from_listing(listing) for listing in parsed]
+
+    def compact_listings_with_attributes() -> list[object]:
+        parsed = parse_listings(json.loads(content), LISTING_COUNT)
+        return [
+            CompactListing.from_listing(
+                listing,
+                first_image_only=False,
+                keep_attributes=True,
+            )
+            for listing in parsed
+        ]
+
+    full = measure(listings)
+    print(f"{'Listing':<40} {full:6.0f} bytes per listing")
+    for name, build in [
+        ("CompactListing", compact_listings),
+        ("CompactListing (all images, attributes)", compact_listings_with_attributes),
+    ]:
+        compact = measure(build)
+        print(
+            f"{name:<40} {compact:6.0f} bytes per listing "
+            f"({full - compact:.0f} saved, {compact / full:.0%} of Listing)"
+        )
+
+
+if __name__ == "__main__":
+    main()
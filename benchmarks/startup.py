@@ -0,0 +1,77 @@
+"""
+Measure the cold start of the library, and the first category lookup.
+
+Every measurement runs in a fresh interpreter, with bytecode caching enabled.
+Parsing the JSON files the categories used to be loaded from is measured as
+well, for comparison. Run it from the project root with
+`python -m benchmarks.startup`.
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import subprocess
+import sys
+
+
+RUNS = 20
+
+STARTUP = """
+import time
+started = time.perf_counter()
+import marktplaats
+imported = time.perf_counter()
+marktplaats.category_from_name("Fietsen en Brommers")
+print(imported - started, time.perf_counter() - imported)
+"""
+
+JSON = """
+import json, time
+from pathlib import Path
+import marktplaats
+started = time.perf_counter()
+for name in ("l1_categories.json", "l2_categories.json"):
+    with (Path(marktplaats.__file__).parent / name).open() as file:
+        json.load(file)
+print(time.perf_counter() - started)
+"""
+
+
+def run(code: str) -> list[float]:
+    """
+    Run code in a fresh interpreter.
+
+    Returns:
+        The timings it printed.
+
+    """
+    # Deployments write bytecode caches, so this measures a cached import
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    output = subprocess.run(  # ruff:ignore[subprocess-without-shell-equals-true] Our own code
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+        env=env,
+    ).stdout
+    return [float(value) for value in output.split()]
+
+
+def main() -> None:
+    run(STARTUP)  # Writes the bytecode caches
+    imports, lookups = zip(*(run(STARTUP) for _ in range(RUNS)), strict=True)
+    json_loads = [run(JSON)[0] for _ in range(RUNS)]
+
+    timings = {
+        "import marktplaats": imports,
+        "First category_from_name()": lookups,
+        "json.load() of the JSON files": json_loads,
+    }
+    print(f"Median of {RUNS} fresh interpreters:")
+    for name, values in timings.items():
+        print(f"{name:30} {statistics.median(values) * 1e3:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
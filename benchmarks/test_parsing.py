@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+from typing import TYPE_CHECKING
+
+from benchmarks.data import make_query_response, report_throughput
+from benchmarks.memory import measure
+from marktplaats import L2Category, category_from_name
+from marktplaats.columnar import ListingColumns
+from marktplaats.decoding import decode_json
+from marktplaats.models import ListingLocation
+from marktplaats.parsing import parse_date
+from marktplaats.query import parse_listings
+
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+"""Benchmarks for turning search responses into listings."""
+
+
+def _listing_count(content: bytes) -> int:
+    return len(json.loads(content)["listings"])
+
+
+def test_parse_listings(benchmark: BenchmarkFixture, query_response: bytes) -> None:
+    count = _listing_count(query_response)
+
+    listings = benchmark(lambda: parse_listings(decode_json(query_response), count))
+
+    assert len(listings) == count
+    report_throughput(benchmark, count)
+
+
+def test_listing_columns(benchmark: BenchmarkFixture, query_response: bytes) -> None:
+    count = _listing_count(query_response)
+
+    def build() -> ListingColumns:
+        columns = ListingColumns()
+        columns.add(decode_json(query_response)["listings"])
+        return columns
+
+    assert len(benchmark(build)) == count
+    report_throughput(benchmark, count)
+
+
+def test_memory_per_listing(
+    benchmark: BenchmarkFixture,
+    query_response: bytes,
+) -> None:
+    count = _listing_count(query_response)
+
+    def parse() -> list[object]:
+        return list(parse_listings(decode_json(query_response), count))
+
+    # Measured once, outside of the timed rounds, as tracing slows them down
+    benchmark.extra_info["bytes_per_listing"] = measure(parse)
+    benchmark.pedantic(parse, rounds=5)
+
+
+def test_parse_date(benchmark: BenchmarkFixture) -> None:
+    dates = [listing["date"] for listing in make_query_response(100)["listings"]]
+    today = date.today()
+
+    benchmark(lambda: [parse_date(date_str, today=today) for date_str in dates])
+
+
+def test_parse_location(benchmark: BenchmarkFixture) -> None:
+    locations = [
+        listing["location"] for listing in make_query_response(100)["listings"]
+    ]
+
+    benchmark(lambda: [ListingLocation.parse(location) for location in locations])
+
+
+def test_category_from_name(benchmark: BenchmarkFixture) -> None:
+    # An L2 category, which is only found after the L1 categories
+    benchmark(category_from_name, "Fietsen | Bakfietsen")
+
+
+def test_l2_category_from_id(benchmark: BenchmarkFixture) -> None:
+    category = L2Category.from_name("Fietsen | Bakfietsen")
+
+    assert benchmark(L2Category.from_id, category.id, category.parent) == category
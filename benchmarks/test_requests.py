@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from benchmarks.data import MockTransport, make_pages, read_mock, report_throughput
+from marktplaats import SearchQuery
+from marktplaats.models.listing_image import fetch_listing_images, parse_listing_images
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+"""
+Benchmarks for whole requests, with a transport that answers from memory.
+
+They measure everything between calling the library and getting its result,
+except for the network.
+"""
+
+PAGE_SIZE = 100
+PAGES = 10
+
+
+def _paged_transport() -> MockTransport:
+    pages = make_pages(PAGE_SIZE * PAGES, PAGE_SIZE)
+
+    def respond(_url: str, params: Mapping[str, Any] | None) -> bytes:  # type: ignore[explicit-any] # Like Transport.get
+        assert params is not None
+        return pages[int(params["offset"])]
+
+    return MockTransport(respond)
+
+
+def test_get_listings(benchmark: BenchmarkFixture) -> None:
+    transport = _paged_transport()
+
+    def search() -> int:
+        query = SearchQuery("fiets", limit=PAGE_SIZE, transport=transport)
+        return len(query.get_listings())
+
+    assert benchmark(search) == PAGE_SIZE
+
+
+def test_iter_listings(benchmark: BenchmarkFixture) -> None:
+    transport = _paged_transport()
+
+    def search() -> int:
+        query = SearchQuery("fiets", limit=PAGE_SIZE, transport=transport)
+        return sum(1 for _ in query.iter_listings())
+
+    assert benchmark(search) == PAGE_SIZE * PAGES
+    report_throughput(benchmark, PAGE_SIZE * PAGES)
+
+
+def test_fetch_all(benchmark: BenchmarkFixture) -> None:
+    transport = _paged_transport()
+
+    def search() -> int:
+        query = SearchQuery("fiets", limit=PAGE_SIZE, transport=transport)
+        return len(query.fetch_all())
+
+    assert benchmark(search) == PAGE_SIZE * PAGES
+
+
+def test_parse_listing_images(benchmark: BenchmarkFixture) -> None:
+    html = read_mock("image_response.html").encode()
+
+    assert benchmark(parse_listing_images, html)
+
+
+def test_fetch_listing_images(benchmark: BenchmarkFixture) -> None:
+    html = read_mock("image_response.html").encode()
+    transport = MockTransport(lambda _url, _params: html)
+
+    assert benchmark(fetch_listing_images, "m2000000000", transport=transport)
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from benchmarks.startup import run
+
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+"""
+Benchmarks for the cold start of the library, each round in a fresh interpreter.
+
+Starting the interpreter is measured on its own as well, so it can be
+subtracted from the others.
+"""
+
+ROUNDS = 10
+
+
+def test_interpreter(benchmark: BenchmarkFixture) -> None:
+    benchmark.pedantic(run, ("pass",), rounds=ROUNDS, warmup_rounds=1)
+
+
+def test_import(benchmark: BenchmarkFixture) -> None:
+    benchmark.pedantic(run, ("import marktplaats",), rounds=ROUNDS, warmup_rounds=1)
+
+
+def test_first_category_lookup(benchmark: BenchmarkFixture) -> None:
+    code = "import marktplaats; marktplaats.category_from_name('Fietsen en Brommers')"
+    benchmark.pedantic(run, (code,), rounds=ROUNDS, warmup_rounds=1)
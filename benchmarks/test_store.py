@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from benchmarks.data import make_query_response, report_throughput
+from marktplaats.store import ListingStore
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from marktplaats.api_types.search import Listing as ListingResponse
+
+
+"""Benchmarks for ingesting listings into a ListingStore."""
+
+LISTING_COUNT = 10_000
+
+
+def test_ingest(benchmark: BenchmarkFixture, tmp_path: Path) -> None:
+    listings = make_query_response(LISTING_COUNT)["listings"]
+    stores: list[ListingStore] = []
+
+    def setup() -> tuple[tuple[ListingStore, list[ListingResponse]], dict[str, object]]:
+        # A new database every round, so every listing is new
+        store = ListingStore(tmp_path / f"listings-{len(stores)}.db")
+        stores.append(store)
+        return (store, listings), {}
+
+    benchmark.pedantic(ListingStore.ingest, setup=setup, rounds=5)
+
+    report_throughput(benchmark, LISTING_COUNT)
+    for store in stores:
+        store.close()
+
+
+def test_ingest_changes(benchmark: BenchmarkFixture, tmp_path: Path) -> None:
+    listings = make_query_response(LISTING_COUNT)["listings"]
+    with ListingStore(tmp_path / "listings.db") as store:
+        store.ingest(listings)
+
+        # Half of the listings changed their price every round
+        def change_prices() -> None:
+            for listing in listings[::2]:
+                listing["priceInfo"]["priceCents"] += 1
+            store.ingest(listings)
+
+        benchmark.pedantic(change_prices, rounds=5)
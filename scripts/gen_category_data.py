@@ -0,0 +1,89 @@
+# please execute this script from the project root directory
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+
+HEADER = '''"""
+All known categories, generated from l1_categories.json and l2_categories.json.
+
+Do not edit, run `python -m scripts.gen_category_data` instead. Importing this
+module is much faster than parsing the JSON files, since Python caches it as
+bytecode.
+"""
+
+from __future__ import annotations
+
+
+'''
+
+LINE_LENGTH = 88
+
+
+def _tuple_lines(values: tuple[int | str, ...]) -> list[str]:
+    # Formatted the way ruff would format it
+    items = [json.dumps(value, ensure_ascii=False) for value in values]
+    line = f"    ({', '.join(items)}),"
+    if len(line) <= LINE_LENGTH:
+        return [line]
+    return ["    (", *(f"        {item}," for item in items), "    ),"]
+
+
+def generate(
+    l1_categories: dict[str, dict[str, int | str]],
+    l2_categories: dict[str, dict[str, int | str]],
+) -> str:
+    """
+    Generate the source of the category data module.
+
+    Returns:
+        The source code.
+
+    """
+    l1_ids = {category["name"]: category["id"] for category in l1_categories.values()}
+
+    lines = [
+        "# The ID and name of every L1 category",
+        "L1_CATEGORIES: tuple[tuple[int, str], ...] = (",
+    ]
+    for category in l1_categories.values():
+        lines += _tuple_lines((category["id"], category["name"]))
+    lines += [
+        ")",
+        "",
+        "# The ID, name and the ID of the parent of every L2 category",
+        "L2_CATEGORIES: tuple[tuple[int, str, int], ...] = (",
+    ]
+    for category in l2_categories.values():
+        parent_id = l1_ids[category["parent"]]
+        lines += _tuple_lines((category["id"], category["name"], parent_id))
+    lines.append(")")
+    return HEADER + "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    try:
+        l1_categories = json.loads(
+            Path("src/marktplaats/l1_categories.json").read_text(encoding="utf-8")
+        )
+        l2_categories = json.loads(
+            Path("src/marktplaats/l2_categories.json").read_text(encoding="utf-8")
+        )
+    except OSError:
+        print(
+            "Category files not found! "
+            "Are you executing this script from the project root?"
+        )
+        return
+
+    Path("src/marktplaats/category_data.py").write_text(
+        generate(l1_categories, l2_categories),
+        encoding="utf-8",
+    )
+
+    print("Success!")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ import shutil
 import subprocess
 from pathlib import Path
 
-from scripts import scrape_categories
+from scripts import gen_category_data, scrape_categories
 
 
 def check(new: Path) -> None:
@@ -32,6 +32,8 @@ def main() -> None:
     check(Path("l1_categories.json"))
     check(Path("l2_categories.json"))
 
+    gen_category_data.main()
+
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,12 @@
 from __future__ import annotations
 
+from marktplaats.cache import (
+    CacheStats as CacheStats,
+    MemoryResponseCache as MemoryResponseCache,
+    ResponseCache as ResponseCache,
+    SQLiteResponseCache as SQLiteResponseCache,
+    TTLCache as TTLCache,
+)
 from marktplaats.categories import (
     L1Category as L1Category,
     L2Category as L2Category,
@@ -9,19 +16,72 @@ from marktplaats.categories import (
     get_l2_categories_by_parent as get_l2_categories_by_parent,
     get_subcategories as get_subcategories,
 )
+from marktplaats.coalesce import (
+    SpecGroup as SpecGroup,
+    group_specs as group_specs,
+    search_coalesced as search_coalesced,
+    spec_matches as spec_matches,
+)
+from marktplaats.decoding import (
+    available_json_backends as available_json_backends,
+    get_json_backend as get_json_backend,
+    set_json_backend as set_json_backend,
+)
+from marktplaats.endpoints import Endpoint as Endpoint
+from marktplaats.instrumentation import (
+    Instrumentation as Instrumentation,
+    RequestEvent as RequestEvent,
+    get_instrumentation as get_instrumentation,
+    set_instrumentation as set_instrumentation,
+)
 from marktplaats.models import (
+    CompactListing as CompactListing,
     Listing as Listing,
     ListingFirstImage as ListingFirstImage,
+    ListingImagesResult as ListingImagesResult,
     ListingLocation as ListingLocation,
     ListingSeller as ListingSeller,
     PriceType as PriceType,
+    Seller as Seller,
+    SellerCache as SellerCache,
+    SellersResult as SellersResult,
+    enrich_sellers as enrich_sellers,
+    fetch_listing_images_many as fetch_listing_images_many,
+    get_default_seller_cache as get_default_seller_cache,
 )
 from marktplaats.query import (
     BadStatusCodeError as BadStatusCodeError,
     Condition as Condition,
     JSONDecodeError as JSONDecodeError,
+    LazyListing as LazyListing,
+    ListingStream as ListingStream,
+    ListingsView as ListingsView,
     SearchQuery as SearchQuery,
+    SearchSpec as SearchSpec,
     SortBy as SortBy,
     SortOrder as SortOrder,
 )
+from marktplaats.ratelimit import (
+    RateLimiter as RateLimiter,
+    TokenBucket as TokenBucket,
+)
+from marktplaats.retry import (
+    RetryEvent as RetryEvent,
+    RetryPolicy as RetryPolicy,
+)
+from marktplaats.scheduler import (
+    ScheduledSearch as ScheduledSearch,
+    ScheduledSearchStats as ScheduledSearchStats,
+    SearchScheduler as SearchScheduler,
+)
 from marktplaats.seller_query import SellerQuery as SellerQuery
+from marktplaats.streaming import ListingsParser as ListingsParser
+from marktplaats.transport import (
+    Transport as Transport,
+    get_default_transport as get_default_transport,
+    set_default_transport as set_default_transport,
+)
+from marktplaats.watcher import (
+    SearchWatcher as SearchWatcher,
+    WatcherState as WatcherState,
+)
@@ -0,0 +1,572 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from marktplaats.cache import CachedResponse, cache_key
+from marktplaats.endpoints import (
+    LISTING_PAGE_URL,
+    SEARCH_URL,
+    SELLER_LISTINGS_URL,
+    SELLER_PROFILE_URL,
+    Endpoint,
+    endpoint_for_url,
+)
+from marktplaats.instrumentation import (
+    RequestEvent,
+    active_instrumentation,
+    timed_decode_json,
+)
+from marktplaats.models.listing_image import ListingImagesResult, parse_listing_images
+from marktplaats.query import (
+    BadStatusCodeError,
+    JSONDecodeError,
+    ListingsView,
+    SearchSpec,
+    SortBy,
+    SortOrder,
+    parse_listings,
+    warn_distance_deprecated,
+)
+from marktplaats.retry import RetryCount
+from marktplaats.seller_query import seller_listings_params
+from marktplaats.transport import DEFAULT_TIMEOUT, REQUEST_HEADERS
+
+
+try:
+    import httpx
+except ImportError as err:  # pragma: no cover
+    msg = (
+        "marktplaats.aio requires httpx. "
+        "Install it with `pip install marktplaats[async]`."
+    )
+    raise ImportError(msg) from err
+
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable, Mapping
+    from datetime import datetime
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from marktplaats.api_types import (
+        QueryResponse,
+        SellerDetailsResponse,
+        SellerListingsResponse,
+    )
+    from marktplaats.cache import ResponseCache
+    from marktplaats.categories import L1Category, L2Category
+    from marktplaats.models import Listing, ListingSeller
+    from marktplaats.models.listing_seller import Seller
+    from marktplaats.query import Condition
+    from marktplaats.ratelimit import RateLimiter
+    from marktplaats.retry import RetryPolicy
+
+
+class AsyncTransport:
+    """
+    A pooled asyncio HTTP transport for all requests to Marktplaats.
+
+    Wraps a single httpx.AsyncClient, so all queries sharing a transport
+    share its connection pool. A client is bound to the event loop it is first
+    used in, so use one transport per event loop.
+
+    max_connections caps the number of requests in flight,
+    max_keepalive_connections the number of idle connections kept open.
+
+    A cache, rate limiter and retry policy work like they do for Transport,
+    and can be shared with one. Retries wait with asyncio.sleep(), instead of
+    the retry policy's sleep function.
+    """
+
+    def __init__(  # ruff:ignore[too-many-arguments] All configuration is keyword-only
+        self,
+        *,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keep_alive: bool = True,
+        headers: Mapping[str, str] | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        client: httpx.AsyncClient | None = None,  # Use a preconfigured client instead
+        cache: ResponseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+    ) -> None:
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections if keep_alive else 0
+        self.headers = dict(REQUEST_HEADERS if headers is None else headers)
+        self.timeout = timeout
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self._client = client
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # Created lazily, so building a transport never does any I/O.
+        #  No lock needed: this never awaits, so it can't interleave.
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                ),
+            )
+        return self._client
+
+    async def get(  # type: ignore[explicit-any] # This is Any to avoid replicating the actual type of the `params` parameter
+        self,
+        url: str,
+        params: Mapping[str, Any] | None = None,
+    ) -> httpx.Response:
+        instrumentation = active_instrumentation()
+        if instrumentation is None:
+            return (await self._get(url, params))[0]
+
+        endpoint = endpoint_for_url(url)
+        instrumentation.request_started(endpoint, url)
+        started = time.perf_counter()
+        count = RetryCount()
+        try:
+            response, from_cache = await self._get(url, params, count=count)
+        except BaseException as error:
+            # Cancellation too, so every started request is finished
+            instrumentation.request_finished(
+                RequestEvent(
+                    endpoint,
+                    url,
+                    time.perf_counter() - started,
+                    error=error,
+                    retries=count.retries,
+                ),
+            )
+            raise
+        instrumentation.request_finished(
+            RequestEvent(
+                endpoint,
+                url,
+                time.perf_counter() - started,
+                status_code=response.status_code,
+                size=len(response.content),
+                from_cache=from_cache,
+                retries=count.retries,
+            ),
+        )
+        return response
+
+    async def _get(  # type: ignore[explicit-any] # This is Any to avoid replicating the actual type of the `params` parameter
+        self,
+        url: str,
+        params: Mapping[str, Any] | None,
+        *,
+        count: RetryCount | None = None,
+    ) -> tuple[httpx.Response, bool]:
+        # Also returns whether the response came from the cache
+        ttl = self.cache.ttl_for(url) if self.cache is not None else 0
+        if self.cache is None or ttl <= 0:
+            return await self._send(url, params, count=count), False
+
+        key = cache_key(url, params)
+        cached = self.cache.get(key)
+        if cached is not None:
+            response = httpx.Response(
+                cached.status_code,
+                headers=cached.headers,
+                content=cached.content,
+                request=httpx.Request("GET", cached.url),
+            )
+            return response, True
+
+        response = await self._send(url, params, count=count)
+        if response.status_code == 200:  # ruff:ignore[magic-value-comparison] HTTP status codes are a universal constant
+            cached = CachedResponse(
+                str(response.url),
+                response.status_code,
+                tuple(response.headers.items()),
+                response.content,
+                response.encoding,
+            )
+            self.cache.set(key, cached, ttl)
+        return response, False
+
+    async def _send(  # type: ignore[explicit-any] # This is Any to avoid replicating the actual type of the `params` parameter
+        self,
+        url: str,
+        params: Mapping[str, Any] | None,
+        *,
+        count: RetryCount | None = None,  # Counts the retries, for instrumentation
+    ) -> httpx.Response:
+        policy = self.retry
+        if policy is None:
+            return await self._send_once(url, params)
+
+        # TransportError covers connection errors and timeouts
+        exceptions = policy.exceptions or (httpx.TransportError,)
+        started = policy.clock()
+        attempt = 1
+        while True:
+            try:
+                response = await self._send_once(url, params)
+            except exceptions as error:
+                delay = policy.next_delay(url, attempt, started, error=error)
+                if delay is None:
+                    raise
+            else:
+                if response.status_code not in policy.status_codes:
+                    return response
+                delay = policy.next_delay(
+                    url,
+                    attempt,
+                    started,
+                    status_code=response.status_code,
+                    retry_after=response.headers.get("Retry-After"),
+                )
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
+            attempt += 1
+            if count is not None:
+                count.retries += 1
+
+    async def _send_once(  # type: ignore[explicit-any] # This is Any to avoid replicating the actual type of the `params` parameter
+        self,
+        url: str,
+        params: Mapping[str, Any] | None,
+    ) -> httpx.Response:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(url)
+        response = await self.client.get(
+            url,
+            params=params,
+            # Some headers to make the request look legit
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        if self.rate_limiter is not None:
+            self.rate_limiter.record(
+                url,
+                response.status_code,
+                response.headers.get("Retry-After"),
+            )
+        return response
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+
+# One per event loop, as a client can't be used in any other loop than its first
+_default_transports: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop,
+    AsyncTransport,
+] = weakref.WeakKeyDictionary()
+
+
+def get_default_async_transport() -> AsyncTransport:
+    """
+    Get the async transport of the running event loop, creating it on first use.
+
+    Every event loop gets a default transport of its own, so a script can call
+    asyncio.run() more than once. It has to be called from a coroutine.
+
+    Returns:
+        The async transport used when none is passed explicitly.
+
+    """
+    loop = asyncio.get_running_loop()
+    transport = _default_transports.get(loop)
+    if transport is None:
+        transport = _default_transports[loop] = AsyncTransport()
+    return transport
+
+
+def set_default_async_transport(transport: AsyncTransport) -> None:
+    """
+    Replace the async transport used when none is passed explicitly.
+
+    It's only the default of the running event loop, so call it from a coroutine.
+    """
+    _default_transports[asyncio.get_running_loop()] = transport
+
+
+async def get_async_request(  # type: ignore[explicit-any] # This is Any to avoid replicating the actual type of the `params` parameter
+    url: str,
+    params: Mapping[str, Any] | None = None,
+    *,
+    transport: AsyncTransport | None = None,
+) -> httpx.Response:
+    if transport is None:
+        transport = get_default_async_transport()
+    return await transport.get(url, params)
+
+
+class AsyncSearchQuery:
+    """
+    An asyncio search query for Marktplaats.
+
+    Takes the same arguments as SearchQuery, but constructing it doesn't send
+    the request yet: await the query (or its fetch() method) to do so.
+
+    Raises an httpx.HTTPStatusError if the request fails.
+    """
+
+    def __init__(  # ruff:ignore[too-many-arguments] too many arguments
+        self,
+        query: str = "",
+        *,
+        zip_code: str = "",
+        distance: int | None = None,  # In meters, deprecated
+        distance_km: int | None = None,  # In kilometers
+        price_from: int | None = None,
+        price_to: int | None = None,
+        limit: int = 1,
+        offset: int = 0,
+        sort_by: SortBy = SortBy.OPTIMIZED,
+        sort_order: SortOrder = SortOrder.ASC,
+        condition: Condition | None = None,
+        offered_since: datetime | None = None,  # A datetime object
+        category: L1Category | L2Category | None = None,
+        extra_attributes: Iterable[int]
+        | None = None,  # EXPERIMENTAL: list of integers, just like Condition
+        transport: AsyncTransport | None = None,  # Defaults to the shared transport
+    ) -> None:
+        if distance is not None:
+            warn_distance_deprecated()
+
+        spec = SearchSpec(
+            query,
+            zip_code=zip_code,
+            distance=distance,
+            distance_km=distance_km,
+            price_from=price_from,
+            price_to=price_to,
+            limit=limit,
+            offset=offset,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            condition=condition,
+            offered_since=offered_since,
+            category=category,
+            extra_attributes=tuple(extra_attributes or ()),
+        )
+        self._set_spec(spec, transport)
+
+    @classmethod
+    def from_spec(
+        cls,
+        spec: SearchSpec,
+        *,
+        transport: AsyncTransport | None = None,
+    ) -> Self:
+        """
+        Prepare the search query described by a spec, without sending it yet.
+
+        Returns:
+            The query, to be awaited.
+
+        """
+        query = cls.__new__(cls)
+        query._set_spec(spec, transport)  # ruff:ignore[private-member-access] Same class
+        return query
+
+    def _set_spec(self, spec: SearchSpec, transport: AsyncTransport | None) -> None:
+        self.spec = spec
+        self.params = spec.to_params()
+        # Kept around because the API can return more listings than requested
+        self.limit = spec.limit
+        self.transport = transport
+
+    async def fetch(self) -> Self:
+        self.response = await get_async_request(
+            SEARCH_URL,
+            params=self.params,
+            transport=self.transport,
+        )
+
+        # This catches HTTP 4xx and 5xx errors
+        self.response.raise_for_status()
+
+        # But if it's something else non-200, still fail fast.
+        if self.response.status_code != 200:  # ruff:ignore[magic-value-comparison] HTTP status codes are a universal constant
+            msg = "Received non-200 status code:"
+            raise BadStatusCodeError(msg, self.response)
+
+        try:
+            self.body_json: QueryResponse = timed_decode_json(
+                self.response.content,
+                Endpoint.SEARCH,
+            )
+        except ValueError as err:
+            msg = "Received invalid (non-json) response:"
+            raise JSONDecodeError(msg, self.response.text) from err
+
+        self.total_result_count = self.body_json.get("totalResultCount")
+        return self
+
+    def __await__(self) -> Generator[object, None, Self]:
+        return self.fetch().__await__()
+
+    @cached_property
+    def listings(self) -> ListingsView:
+        """The listings on this page, parsed only when they're accessed."""
+        return ListingsView(self.body_json["listings"][: self.limit])
+
+    @cached_property
+    def _parsed_listings(self) -> list[Listing]:
+        return parse_listings(self.body_json, self.limit)
+
+    def get_listings(self) -> list[Listing]:
+        # Parsed once; a copy is returned so changes don't leak into the cache
+        return list(self._parsed_listings)
+
+
+class AsyncSellerQuery:
+    """Query a seller, the asyncio version of SellerQuery."""
+
+    def __init__(
+        self,
+        seller_id: int,
+        *,
+        transport: AsyncTransport | None = None,
+    ) -> None:
+        self.seller_id = seller_id
+        self.transport = transport
+        self._listings_raw: SellerListingsResponse | None = None
+        self._details_raw: SellerDetailsResponse | None = None
+
+    async def fetch_details(self) -> SellerDetailsResponse:
+        """
+        Fetch the seller details from the API.
+
+        Returns:
+            Response body as an unparsed dictionary.
+
+        """
+        if self._details_raw is None:
+            url = SELLER_PROFILE_URL.format(seller_id=self.seller_id)
+            res = await get_async_request(url, transport=self.transport)
+            res.raise_for_status()
+            payload = timed_decode_json(res.content, Endpoint.SELLER_PROFILE)
+            self._details_raw = payload
+        return self._details_raw
+
+    async def fetch_listings(self) -> SellerListingsResponse:
+        """
+        Fetch all listings for this seller from the API.
+
+        Returns:
+            Response body as an unparsed dictionary.
+
+        """
+        if self._listings_raw is None:
+            params = seller_listings_params(self.seller_id)
+            res = await get_async_request(
+                SELLER_LISTINGS_URL,
+                params,
+                transport=self.transport,
+            )
+            res.raise_for_status()
+            payload = timed_decode_json(res.content, Endpoint.SELLER_LISTINGS)
+            self._listings_raw = payload
+        return self._listings_raw
+
+
+async def get_seller(
+    listing_seller: ListingSeller,
+    *,
+    transport: AsyncTransport | None = None,
+) -> Seller:
+    """
+    Fetch the full seller of a listing.
+
+    This is the asyncio version of ListingSeller.get_seller().
+
+    Returns:
+        The full seller.
+
+    """
+    res = await get_async_request(
+        SELLER_PROFILE_URL.format(seller_id=listing_seller.id),
+        transport=transport,
+    )
+    return listing_seller.parse_seller(
+        timed_decode_json(res.content, Endpoint.SELLER_PROFILE),
+    )
+
+
+async def fetch_listing_images(
+    listing_id: str,
+    *,
+    transport: AsyncTransport | None = None,
+) -> list[str]:
+    """
+    Return a list of image URLs for a given listing.
+
+    This is the asyncio version of Listing.get_images().
+
+    :param listing_id: The listing ID to get images for.
+    :param transport: The transport to send the request with.
+        Defaults to the process-wide async transport.
+    :return: A list of image URLs (https).
+    """  # ruff:ignore[docstring-missing-returns] Same style as the sync version
+    r = await get_async_request(
+        LISTING_PAGE_URL.format(listing_id=listing_id),
+        transport=transport,
+    )
+    r.raise_for_status()  # raises so we can stop the fetching on a higher level
+
+    return parse_listing_images(r.content)
+
+
+async def fetch_listing_images_many(
+    listing_ids: Iterable[str],
+    *,
+    max_concurrency: int = 8,
+    transport: AsyncTransport | None = None,
+) -> ListingImagesResult:
+    """
+    Fetch the images of many listings concurrently.
+
+    This is the asyncio version of marktplaats.models.fetch_listing_images_many().
+    At most max_concurrency pages are fetched at once.
+    A listing that fails doesn't stop the others; its error is collected.
+
+    Returns:
+        The image URLs by listing ID, in the order of listing_ids,
+        and the errors by listing ID.
+
+    """
+    listing_ids = list(dict.fromkeys(listing_ids))
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(listing_id: str) -> list[str]:
+        async with semaphore:
+            return await fetch_listing_images(listing_id, transport=transport)
+
+    results = await asyncio.gather(
+        *(fetch(listing_id) for listing_id in listing_ids),
+        return_exceptions=True,
+    )
+    result = ListingImagesResult()
+    for listing_id, images in zip(listing_ids, results, strict=True):
+        if isinstance(images, BaseException):
+            result.errors[listing_id] = images
+        else:
+            result.images[listing_id] = images
+    return result
@@ -20,7 +20,7 @@ class QueryResponse(TypedDict):
     # topBlock: list[Any]  # ruff:ignore[commented-out-code]
     facets: list[Facet]
     totalResultCount: int
-    maxAllowedPageNumber: int
+    maxAllowedPageNumber: NotRequired[int]
     correlationId: UUID
     originalQuery: str
     sortOptions: list[SortOption]
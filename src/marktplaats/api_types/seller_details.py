@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import TypedDict
 
+from typing_extensions import NotRequired
+
 
 class PaymentMethod(TypedDict):
     name: str
@@ -16,7 +18,9 @@ class ProfilePictures(TypedDict):
 
 class Review(TypedDict):
     numberOfReviews: int
-    rating: float
+    # Newer responses use averageScore, older ones used rating
+    averageScore: NotRequired[float]
+    rating: NotRequired[float]
     reviewSystem: str
 
 
@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from urllib.parse import urlencode
+
+from requests import Response  # ruff:ignore[banned-api] Not doing any requests
+from requests.structures import CaseInsensitiveDict  # ruff:ignore[banned-api] Not doing any requests
+
+from marktplaats.endpoints import Endpoint, endpoint_for_url
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from pathlib import Path
+
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+
+# Search results change all the time, sellers and listing pages hardly do
+DEFAULT_TTLS: Mapping[Endpoint, float] = {
+    Endpoint.SEARCH: MINUTE,
+    Endpoint.SELLER_PROFILE: 24 * HOUR,
+    Endpoint.SELLER_LISTINGS: 5 * MINUTE,
+    Endpoint.LISTING_PAGE: 24 * HOUR,
+    Endpoint.OTHER: 0,
+}
+
+
+def cache_key(  # type: ignore[explicit-any] # This is Any to avoid replicating the actual type of the `params` parameter
+    url: str,
+    params: Mapping[str, Any] | None = None,
+) -> str:
+    """
+    Build a key for a request, that doesn't depend on the order of the params.
+
+    Returns:
+        The URL with its params in a normalized query string.
+
+    """
+    pairs: list[tuple[str, str]] = []
+    for key, value in sorted((params or {}).items()):
+        values = value if isinstance(value, (list, tuple)) else [value]
+        # None is left out of the query string by requests as well
+        pairs.extend((key, str(item)) for item in values if item is not None)
+    return f"{url}?{urlencode(pairs)}"
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """The parts of a response that are kept in the cache."""
+
+    url: str
+    status_code: int
+    headers: tuple[tuple[str, str], ...]
+    content: bytes
+    encoding: str | None
+
+    @classmethod
+    def from_response(cls, response: Response) -> CachedResponse:
+        return cls(
+            response.url,
+            response.status_code,
+            tuple(response.headers.items()),
+            response.content,
+            response.encoding,
+        )
+
+    def to_response(self) -> Response:
+        # A fresh Response every time, so callers can't change the cached one
+        response = Response()
+        response.url = self.url
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(dict(self.headers))
+        response._content = self.content  # ruff:ignore[private-member-access] The only way to build a Response with a body
+        response.encoding = self.encoding
+        return response
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+KT = TypeVar("KT")
+VT = TypeVar("VT")
+
+
+class TTLCache(Generic[KT, VT]):
+    """
+    A thread-safe, size-bounded LRU mapping whose entries expire.
+
+    When it is full, the least recently used entry is evicted.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._clock = clock
+        self._data: OrderedDict[KT, tuple[float, VT]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: KT) -> VT | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                del self._data[key]
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1]
+
+    def set(self, key: KT, value: VT, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (self._clock() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ResponseCache(ABC):
+    """
+    A cache for responses, used by a Transport to skip repeated requests.
+
+    Only successful (200) responses are cached. How long they're kept is set
+    per endpoint through ttls; endpoints without a TTL aren't cached.
+    """
+
+    def __init__(self, ttls: Mapping[Endpoint, float] | None = None) -> None:
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+
+    def ttl_for(self, url: str) -> float:
+        return self.ttls.get(endpoint_for_url(url), 0)
+
+    @property
+    @abstractmethod
+    def stats(self) -> CacheStats: ...
+
+    @abstractmethod
+    def get(self, key: str) -> CachedResponse | None: ...
+
+    @abstractmethod
+    def set(self, key: str, response: CachedResponse, ttl: float) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+
+class MemoryResponseCache(ResponseCache):
+    """An in-memory LRU response cache, shared by all threads of a process."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        *,
+        ttls: Mapping[Endpoint, float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(ttls)
+        self._cache: TTLCache[str, CachedResponse] = TTLCache(max_entries, clock=clock)
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    def get(self, key: str) -> CachedResponse | None:
+        return self._cache.get(key)
+
+    def set(self, key: str, response: CachedResponse, ttl: float) -> None:
+        self._cache.set(key, response, ttl)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    A response cache in an SQLite database, which survives restarts.
+
+    Several processes can share the same database file.
+    When there are more than max_entries responses,
+    the least recently used ones are evicted.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int = 100_000,
+        *,
+        ttls: Mapping[Endpoint, float] | None = None,
+        clock: Callable[[], float] = time.time,  # Wall clock, to survive restarts
+    ) -> None:
+        super().__init__(ttls)
+        self.max_entries = max_entries
+        self._stats = CacheStats()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, "
+                "expires_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL, "
+                "url TEXT NOT NULL, "
+                "status_code INTEGER NOT NULL, "
+                "headers TEXT NOT NULL, "
+                "content BLOB NOT NULL, "
+                "encoding TEXT)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+                "ON responses (accessed_at)"
+            )
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._stats
+
+    def get(self, key: str) -> CachedResponse | None:
+        now = self._clock()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT url, status_code, headers, content, encoding "
+                "FROM responses WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                self._stats.misses += 1
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                (now, key),
+            )
+            self._stats.hits += 1
+        url, status_code, headers, content, encoding = row
+        return CachedResponse(
+            url,
+            status_code,
+            tuple(tuple(header) for header in json.loads(headers)),
+            content,
+            encoding,
+        )
+
+    def set(self, key: str, response: CachedResponse, ttl: float) -> None:
+        now = self._clock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    now + ttl,
+                    now,
+                    response.url,
+                    response.status_code,
+                    json.dumps(response.headers),
+                    response.content,
+                    response.encoding,
+                ),
+            )
+            # Expired entries go first, then the least recently used ones
+            self._connection.execute(
+                "DELETE FROM responses WHERE expires_at <= ?",
+                (now,),
+            )
+            self._connection.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?"
+                ")",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
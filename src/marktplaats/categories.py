@@ -1,38 +1,51 @@
 from __future__ import annotations
 
-import json
-from collections import defaultdict
-from pathlib import Path
-from typing import TYPE_CHECKING, Generic, TypedDict, TypeVar
-
-from typing_extensions import Self
+import threading
+from typing import TYPE_CHECKING, NoReturn
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator, Mapping
+    from collections.abc import Iterator, Mapping, Sequence
     from types import NotImplementedType
 
 
 class L1Category:
+    """
+    A top level category.
+
+    Categories are immutable. The ones that are looked up are shared, so
+    looking up the same category twice returns the same object.
+    """
+
+    __slots__ = ("id", "name")
+
+    id: int
+    name: str
+
     def __init__(self, id_: int, name: str) -> None:
-        self.id = id_
-        self.name = name
+        object.__setattr__(self, "id", id_)
+        object.__setattr__(self, "name", name)
 
     @classmethod
-    def from_name(cls, name: str) -> Self:
-        orig_name = name
-        name = name.lower()
+    def from_name(cls, name: str) -> L1Category:
         try:
-            l1_category = _l1_categories_raw.get_data()[name]
+            return _get_index().l1_by_name[name.lower()]
         except KeyError as err:
-            msg = f"Unknown L1 category name: {orig_name}"
+            msg = f"Unknown L1 category name: {name}"
             raise ValueError(msg) from err
-        id_, name = l1_category["id"], l1_category["name"]
-        return cls(id_, name)
 
     @classmethod
-    def from_id(cls, id_: int, name: str = "Unknown") -> None:
-        cls(id_, name)
+    def from_id(cls, id_: int, name: str = "Unknown") -> L1Category:
+        """
+        Get a category by its ID.
+
+        Returns:
+            The known category, or a new one with the given name if the ID is
+            unknown.
+
+        """
+        category = _get_index().l1_by_id.get(id_)
+        return cls(id_, name) if category is None else category
 
     def __str__(self) -> str:
         return self.name
@@ -45,31 +58,62 @@ class L1Category:
     def __hash__(self) -> int:
         return hash(self.id)
 
+    def __setattr__(self, name: str, value: object) -> NoReturn:
+        msg = f"{type(self).__name__} is immutable"
+        raise AttributeError(msg)
+
+    def __delattr__(self, name: str) -> NoReturn:
+        msg = f"{type(self).__name__} is immutable"
+        raise AttributeError(msg)
+
+    def __reduce__(self) -> tuple[type[L1Category], tuple[int, str]]:
+        return type(self), (self.id, self.name)
+
 
 class L2Category:
+    """
+    A subcategory of an L1Category.
+
+    Like L1Category, categories are immutable and the ones that are looked up
+    are shared.
+    """
+
+    __slots__ = ("id", "name", "parent")
+
+    id: int
+    name: str
+    parent: L1Category
+
     def __init__(self, id_: int, name: str, parent: L1Category) -> None:
-        self.id = id_
-        self.name = name
-        self.parent = parent
+        object.__setattr__(self, "id", id_)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "parent", parent)
 
     @classmethod
-    def from_name(cls, name: str) -> Self:
-        orig_name = name
-        name = name.lower()
-        try:
-            l2_category = _l2_categories_raw.get_data()[name]
-        except KeyError as err:
-            msg = f"Unknown L2 category name: {orig_name}"
-            raise ValueError(msg) from err
-        return cls(
-            id_=l2_category["id"],
-            name=l2_category["name"],
-            parent=L1Category.from_name(l2_category["parent"]),
-        )
+    def from_name(cls, name: str) -> L2Category:
+        category = _get_index().l2_by_name(name)
+        if category is None:
+            msg = f"Unknown L2 category name: {name}"
+            raise ValueError(msg)
+        return category
 
     @classmethod
-    def from_id(cls, id_: int, parent: L1Category, name: str = "Unknown") -> None:
-        cls(id_, name, parent)
+    def from_id(
+        cls,
+        id_: int,
+        parent: L1Category,
+        name: str = "Unknown",
+    ) -> L2Category:
+        """
+        Get a subcategory by its ID.
+
+        Returns:
+            The known subcategory, or a new one with the given name and parent if
+            the ID is unknown.
+
+        """
+        category = _get_index().l2_by_id(id_)
+        return cls(id_, name, parent) if category is None else category
 
     def __str__(self) -> str:
         return self.name
@@ -82,68 +126,124 @@ class L2Category:
     def __hash__(self) -> int:
         return hash(self.id)
 
+    def __setattr__(self, name: str, value: object) -> NoReturn:
+        msg = f"{type(self).__name__} is immutable"
+        raise AttributeError(msg)
 
-def category_from_name(name: str) -> L1Category | L2Category:
-    try:
-        return L1Category.from_name(name)
-    except ValueError:
-        return L2Category.from_name(name)
-
+    def __delattr__(self, name: str) -> NoReturn:
+        msg = f"{type(self).__name__} is immutable"
+        raise AttributeError(msg)
 
-KT = TypeVar("KT")
-VT = TypeVar("VT")
+    def __reduce__(
+        self,
+    ) -> tuple[type[L2Category], tuple[int, str, L1Category]]:
+        return type(self), (self.id, self.name, self.parent)
 
 
-class LazyWrapper(Generic[KT, VT]):
-    def __init__(self, filename: Path) -> None:
-        self.filename = filename
-        self._data: Mapping[KT, VT] | None = None
-
-    def get_data(self) -> Mapping[KT, VT]:
-        if self._data is None:
-            self._build_data()
-            assert self._data is not None  # ruff:ignore[assert] Assert for typechecker
-        return self._data
-
-    def _build_data(self) -> None:
-        with self.filename.open() as file:
-            self._data = json.load(file)
+def category_from_name(name: str) -> L1Category | L2Category:
+    index = _get_index()
+    category = index.l1_by_name.get(name.lower()) or index.l2_by_name(name)
+    if category is None:
+        msg = f"Unknown L2 category name: {name}"
+        raise ValueError(msg)
+    return category
+
+
+class _CategoryIndex:
+    """
+    Every known category, by ID, by lowercase name and by parent.
+
+    L2 categories are only created once they're needed, so the first lookup
+    doesn't have to wait for all of them.
+    """
+
+    def __init__(
+        self,
+        l1_categories: Sequence[tuple[int, str]],
+        l2_categories: Sequence[tuple[int, str, int]],
+    ) -> None:
+        self.l1_by_id = {id_: L1Category(id_, name) for id_, name in l1_categories}
+        self.l1_by_name = {
+            category.name.lower(): category for category in self.l1_by_id.values()
+        }
+        self._l2_rows = {
+            id_: (name, parent_id) for id_, name, parent_id in l2_categories
+        }
+        self._l2_ids = {name.lower(): id_ for id_, name, _ in l2_categories}
+        self._l2: dict[int, L2Category] = {}
+        self._children: dict[L1Category, tuple[L2Category, ...]] | None = None
+
+    def l2_by_id(self, id_: int) -> L2Category | None:
+        category = self._l2.get(id_)
+        if category is None:
+            row = self._l2_rows.get(id_)
+            if row is None:
+                return None
+            name, parent_id = row
+            # Threads that create the same category at once all get the first one
+            category = self._l2.setdefault(
+                id_,
+                L2Category(id_, name, self.l1_by_id[parent_id]),
+            )
+        return category
+
+    def l2_by_name(self, name: str) -> L2Category | None:
+        id_ = self._l2_ids.get(name.lower())
+        return None if id_ is None else self.l2_by_id(id_)
+
+    def l2_categories(self) -> Iterator[L2Category]:
+        for id_ in self._l2_rows:
+            category = self.l2_by_id(id_)
+            assert category is not None  # ruff:ignore[assert] Assert for typechecker
+            yield category
+
+    @property
+    def children(self) -> Mapping[L1Category, tuple[L2Category, ...]]:
+        if self._children is None:
+            children: dict[L1Category, list[L2Category]] = {
+                category: [] for category in self.l1_by_id.values()
+            }
+            for category in self.l2_categories():
+                children[category.parent].append(category)
+            self._children = {
+                parent: tuple(categories) for parent, categories in children.items()
+            }
+        return self._children
+
+
+_index: _CategoryIndex | None = None
+_index_lock = threading.Lock()
+
+
+def _get_index() -> _CategoryIndex:
+    global _index  # ruff:ignore[global-statement] Built once, on first use
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                from marktplaats import category_data  # ruff:ignore[import-outside-top-level] Only loaded by processes that use categories
+
+                _index = _CategoryIndex(
+                    category_data.L1_CATEGORIES,
+                    category_data.L2_CATEGORIES,
+                )
+    return _index
 
 
 def get_l1_categories() -> Iterator[L1Category]:
-    for category in _l1_categories_raw.get_data().values():
-        yield L1Category(category["id"], category["name"])
+    return iter(_get_index().l1_by_id.values())
 
 
 def get_l2_categories() -> Iterator[L2Category]:
-    for category in _l2_categories_raw.get_data().values():
-        parent = L1Category.from_name(category["parent"])
-        yield L2Category(category["id"], category["name"], parent)
+    return _get_index().l2_categories()
 
 
 def get_subcategories(l1_category: L1Category) -> Iterator[L2Category]:
-    return (cat for cat in get_l2_categories() if cat.parent == l1_category)
+    return iter(_get_index().children.get(l1_category, ()))
 
 
 def get_l2_categories_by_parent() -> Mapping[L1Category, list[L2Category]]:
-    categories = defaultdict(list)
-    for category in get_l2_categories():
-        categories[category.parent].append(category)
-    return categories
-
-
-class _L1CategoryData(TypedDict):
-    id: int
-    name: str
-
-
-class _L2CategoryData(TypedDict):
-    id: int
-    name: str
-    parent: str
-
-
-_l1_categories_file = (Path(__file__).parent / "l1_categories.json").resolve()
-_l1_categories_raw: LazyWrapper[str, _L1CategoryData] = LazyWrapper(_l1_categories_file)
-_l2_categories_file = (Path(__file__).parent / "l2_categories.json").resolve()
-_l2_categories_raw: LazyWrapper[str, _L2CategoryData] = LazyWrapper(_l2_categories_file)
+    return {
+        parent: list(categories)
+        for parent, categories in _get_index().children.items()
+        if categories
+    }
@@ -0,0 +1,1983 @@
+"""
+All known categories, generated from l1_categories.json and l2_categories.json.
+
+Do not edit, run `python -m scripts.gen_category_data` instead. Importing this
+module is much faster than parsing the JSON files, since Python caches it as
+bytecode.
+"""
+
+from __future__ import annotations
+
+
+# The ID and name of every L1 category
+L1_CATEGORIES: tuple[tuple[int, str], ...] = (
+    (1, "Antiek en Kunst"),
+    (31, "Audio, Tv en Foto"),
+    (91, "Auto's"),
+    (2600, "Auto-onderdelen"),
+    (48, "Auto diversen"),
+    (201, "Boeken"),
+    (289, "Caravans en Kamperen"),
+    (1744, "Cd's en Dvd's"),
+    (322, "Computers en Software"),
+    (378, "Contacten en Berichten"),
+    (1098, "Diensten en Vakmensen"),
+    (395, "Dieren en Toebehoren"),
+    (239, "Doe-het-zelf en Verbouw"),
+    (445, "Fietsen en Brommers"),
+    (1099, "Hobby en Vrije tijd"),
+    (504, "Huis en Inrichting"),
+    (1032, "Huizen en Kamers"),
+    (565, "Kinderen en Baby's"),
+    (621, "Kleding | Dames"),
+    (1776, "Kleding | Heren"),
+    (678, "Motoren"),
+    (728, "Muziek en Instrumenten"),
+    (1784, "Postzegels en Munten"),
+    (1826, "Sieraden, Tassen en Uiterlijk"),
+    (356, "Spelcomputers en Games"),
+    (784, "Sport en Fitness"),
+    (820, "Telecommunicatie"),
+    (1984, "Tickets en Kaartjes"),
+    (1847, "Tuin en Terras"),
+    (167, "Vacatures"),
+    (856, "Vakantie"),
+    (895, "Verzamelen"),
+    (976, "Watersport en Boten"),
+    (537, "Witgoed en Apparatuur"),
+    (1085, "Zakelijke goederen"),
+    (428, "Diversen"),
+)
+
+# The ID, name and the ID of the parent of every L2 category
+L2_CATEGORIES: tuple[tuple[int, str, int], ...] = (
+    (2, "Antiek | Bestek", 1),
+    (3, "Antiek | Boeken en Bijbels", 1),
+    (1100, "Antiek | Emaille", 1),
+    (1501, "Antiek | Gereedschap en Instrumenten", 1),
+    (1648, "Antiek | Glas en Kristal", 1),
+    (2614, "Antiek | Goud en Zilver", 1),
+    (2661, "Antiek | Kandelaars", 1),
+    (1841, "Antiek | Kantoor en Zakelijk", 1),
+    (1502, "Antiek | Keramiek en Aardewerk", 1),
+    (1842, "Antiek | Keukenbenodigdheden", 1),
+    (2118, "Antiek | Kleden en Textiel", 1),
+    (1503, "Antiek | Kleding en Accessoires", 1),
+    (6, "Antiek | Klokken", 1),
+    (1647, "Antiek | Koper en Brons", 1),
+    (7, "Antiek | Lampen", 1),
+    (1504, "Antiek | Meubels | Bedden", 1),
+    (5, "Antiek | Meubels | Kasten", 1),
+    (1505, "Antiek | Meubels | Stoelen en Banken", 1),
+    (1506, "Antiek | Meubels | Tafels", 1),
+    (1101, "Antiek | Naaimachines", 1),
+    (10, "Antiek | Porselein", 1),
+    (1102, "Antiek | Religie", 1),
+    (1103, "Antiek | Schalen", 1),
+    (2662, "Antiek | Schoolplaten", 1),
+    (1843, "Antiek | Servies compleet", 1),
+    (12, "Antiek | Servies los", 1),
+    (1507, "Antiek | Speelgoed", 1),
+    (2663, "Antiek | Spiegels", 1),
+    (2664, "Antiek | Tin", 1),
+    (11, "Antiek | Tv's en Audio", 1),
+    (14, "Antiek | Vazen", 1),
+    (1104, "Antiek | Wandborden en Tegels", 1),
+    (1500, "Antiek | Woonaccessoires", 1),
+    (9, "Antiek | Overige Antiek", 1),
+    (15, "Curiosa en Brocante", 1),
+    (23, "Kunst | Beelden en Houtsnijwerken", 1),
+    (1508, "Kunst | Designobjecten", 1),
+    (1105, "Kunst | Etsen en Gravures", 1),
+    (27, "Kunst | Litho's en Zeefdrukken", 1),
+    (1844, "Kunst | Niet-Westerse kunst", 1),
+    (1846, "Kunst | Schilderijen | Abstract", 1),
+    (25, "Kunst | Schilderijen | Klassiek", 1),
+    (1845, "Kunst | Schilderijen | Modern", 1),
+    (26, "Kunst | Tekeningen en Foto's", 1),
+    (24, "Kunst | Overige Kunst", 1),
+    (2724, "Accu's en Batterijen", 322),
+    (2834, "Actiecamera's", 31),
+    (2617, "Afstandsbedieningen", 31),
+    (1106, "Audiokabels en Televisiekabels", 31),
+    (32, "Bandrecorders", 31),
+    (3056, "Beamer-accessoires", 31),
+    (1132, "Beamers", 31),
+    (2665, "Blu-ray-spelers", 31),
+    (33, "Buizenversterkers", 31),
+    (2036, "Cassettedecks", 31),
+    (35, "Cd-spelers", 31),
+    (3052, "Converters", 31),
+    (1722, "Decoders en Harddiskrecorders", 31),
+    (2666, "Diaprojectors", 31),
+    (3057, "Drones", 31),
+    (1114, "Dvd-spelers", 31),
+    (1115, "Filmrollen", 31),
+    (3059, "Fotoalbums en Accessoires", 31),
+    (480, "Fotocamera's Analoog", 31),
+    (487, "Fotocamera's Digitaal", 31),
+    (1360, "Fotografie | Accu's en Batterijen", 31),
+    (2667, "Fotografie | Digitale fotolijsten", 31),
+    (488, "Fotografie | Doka Toebehoren", 31),
+    (1720, "Fotografie | Filters", 31),
+    (489, "Fotografie | Flitsers", 31),
+    (1483, "Fotografie | Fotolijsten", 31),
+    (1721, "Fotografie | Fotopapier", 31),
+    (1400, "Fotografie | Fotostudio en Toebehoren", 31),
+    (1484, "Fotografie | Fototassen", 31),
+    (493, "Fotografie | Geheugenkaarten", 31),
+    (495, "Fotografie | Lenzen en Objectieven", 31),
+    (497, "Fotografie | Onderwatercamera's", 31),
+    (501, "Fotografie | Professionele apparatuur", 31),
+    (500, "Fotografie | Statieven en Balhoofden", 31),
+    (1116, "Home Cinema-sets", 31),
+    (2833, "Karaoke-apparatuur", 31),
+    (37, "Koptelefoons", 31),
+    (38, "Luidsprekers", 31),
+    (2668, "Mediaspelers", 31),
+    (1723, "Mp3-spelers | Accessoires | Apple iPod", 31),
+    (1452, "Mp3-spelers | Accessoires | Overige merken", 31),
+    (40, "Mp3-spelers | Apple iPod", 31),
+    (1649, "Mp3-spelers | Overige merken", 31),
+    (2615, "Mp4-spelers", 31),
+    (1724, "Opladers", 31),
+    (496, "Optische apparatuur | Microscopen", 31),
+    (502, "Optische apparatuur | Telescopen", 31),
+    (503, "Optische apparatuur | Verrekijkers", 31),
+    (42, "Platenspelers", 31),
+    (1117, "Professionele Audio-, Tv- en Video-apparatuur", 31),
+    (3055, "Projectieschermen", 31),
+    (43, "Radio's", 31),
+    (1118, "Schotelantennes", 31),
+    (3053, "Soundbars", 31),
+    (36, "Stereo-sets", 31),
+    (3058, "Televisie-accessoires", 31),
+    (1453, "Televisiebeugels", 31),
+    (1120, "Televisies", 31),
+    (45, "Tuners", 31),
+    (46, "Versterkers en Receivers", 31),
+    (1129, "Videobewaking", 31),
+    (1130, "Videocamera's Analoog", 31),
+    (1131, "Videocamera's Digitaal", 31),
+    (1133, "Videospelers", 31),
+    (1121, "Vintage Televisies", 31),
+    (47, "Walkmans, Discmans en Minidiscspelers", 31),
+    (1725, "Weerstations en Barometers", 31),
+    (41, "Overige Audio, Tv en Foto", 31),
+    (2932, "Abarth", 91),
+    (3217, "Aiways", 91),
+    (2152, "Aixam", 91),
+    (92, "Alfa Romeo", 91),
+    (2937, "Alpina", 91),
+    (2153, "Aston Martin", 91),
+    (2936, "Alpine", 91),
+    (93, "Audi", 91),
+    (2154, "Austin", 91),
+    (2148, "Bentley", 91),
+    (95, "Bestelauto's", 91),
+    (96, "BMW", 91),
+    (2938, "Bugatti", 91),
+    (97, "Buick", 91),
+    (3213, "BYD", 91),
+    (98, "Cadillac", 91),
+    (99, "Chevrolet", 91),
+    (100, "Chrysler", 91),
+    (101, "Citroën", 91),
+    (3051, "Cupra", 91),
+    (2660, "Dacia", 91),
+    (103, "Daewoo", 91),
+    (105, "Daihatsu", 91),
+    (108, "Dodge", 91),
+    (3227, "Dongfeng", 91),
+    (109, "Donkervoort", 91),
+    (2933, "DS", 91),
+    (110, "Ferrari", 91),
+    (111, "Fiat", 91),
+    (2829, "Fisker", 91),
+    (112, "Ford", 91),
+    (113, "Ford Usa", 91),
+    (3223, "Genesis", 91),
+    (2949, "GMC", 91),
+    (114, "Honda", 91),
+    (2149, "Hummer", 91),
+    (3221, "Hongqi", 91),
+    (115, "Hyundai", 91),
+    (2659, "Infiniti", 91),
+    (3212, "Isuzu", 91),
+    (117, "Jaguar", 91),
+    (118, "Jeep", 91),
+    (119, "Kia", 91),
+    (2155, "Lada", 91),
+    (122, "Lamborghini", 91),
+    (123, "Lancia", 91),
+    (124, "Land Rover", 91),
+    (2831, "Landwind", 91),
+    (3226, "Leapmotor", 91),
+    (125, "Lexus", 91),
+    (2150, "Lincoln", 91),
+    (127, "Lotus", 91),
+    (3218, "Lucid", 91),
+    (3211, "Lynk & Co", 91),
+    (128, "Maserati", 91),
+    (129, "Mazda", 91),
+    (2935, "McLaren", 91),
+    (130, "Mercedes-Benz", 91),
+    (131, "Mercury", 91),
+    (132, "MG", 91),
+    (133, "Mini", 91),
+    (134, "Mitsubishi", 91),
+    (3214, "NIO", 91),
+    (135, "Nissan", 91),
+    (136, "Oldsmobile", 91),
+    (137, "Oldtimers", 91),
+    (138, "Opel", 91),
+    (140, "Peugeot", 91),
+    (2934, "Polestar", 91),
+    (143, "Pontiac", 91),
+    (144, "Porsche", 91),
+    (146, "Renault", 91),
+    (2156, "Rolls-Royce", 91),
+    (147, "Rover", 91),
+    (148, "Saab", 91),
+    (150, "Seat", 91),
+    (3220, "Seres", 91),
+    (151, "Skoda", 91),
+    (152, "Smart", 91),
+    (2939, "Spyker", 91),
+    (2151, "SsangYong", 91),
+    (153, "Subaru", 91),
+    (154, "Suzuki", 91),
+    (2830, "Tesla", 91),
+    (155, "Toyota", 91),
+    (156, "Triumph", 91),
+    (3216, "Vinfast", 91),
+    (157, "Volkswagen", 91),
+    (158, "Volvo", 91),
+    (3225, "Voyah", 91),
+    (159, "Vrachtwagens", 91),
+    (3215, "XPENG", 91),
+    (3224, "ZEEKR", 91),
+    (139, "Overige Auto's", 91),
+    (2905, "Accu's en Toebehoren", 2600),
+    (2906, "Airco en Verwarming", 2600),
+    (65, "Banden en Velgen", 2600),
+    (2907, "Besturing", 2600),
+    (3060, "Brandstofpompen", 2600),
+    (2908, "Brandstofsystemen", 2600),
+    (2909, "Carrosserie en Plaatwerk", 2600),
+    (2910, "Dashboard en Schakelaars", 2600),
+    (2911, "Elektronica en Kabels", 2600),
+    (2912, "Filters", 2600),
+    (2913, "Interieur en Bekleding", 2600),
+    (2914, "Klein materiaal", 2600),
+    (2915, "Motor en Toebehoren", 2600),
+    (2923, "Ophanging en Onderstel", 2600),
+    (2916, "Remmen en Aandrijving", 2600),
+    (2917, "Ruiten en Toebehoren", 2600),
+    (3061, "Sidebars", 2600),
+    (2918, "Spiegels", 2600),
+    (2919, "Transmissie en Toebehoren", 2600),
+    (3062, "Trekhaken", 2600),
+    (2920, "Uitlaatsystemen", 2600),
+    (2921, "Verlichting", 2600),
+    (88, "Vrachtwagen-onderdelen", 2600),
+    (2922, "Overige Auto-onderdelen", 2600),
+    (49, "Aanhangers en Bagagewagens", 48),
+    (1134, "Aanhangwagen-onderdelen", 48),
+    (3063, "Achteruitrijcamera's", 48),
+    (50, "Anti-diefstal", 48),
+    (1641, "Auto Inkoop", 48),
+    (54, "Auto-accessoires", 48),
+    (60, "Autogereedschap", 48),
+    (3067, "Autohoezen", 48),
+    (3070, "Automatten", 48),
+    (53, "Autonavigatie", 48),
+    (55, "Autoradio's", 48),
+    (56, "Autospeakers", 48),
+    (1651, "Autosport-onderdelen", 48),
+    (58, "Autostallingen en Garages", 48),
+    (2646, "Autostickers", 48),
+    (3066, "Bagagerekken", 48),
+    (825, "Carkits", 820),
+    (452, "Dakdragers", 48),
+    (52, "Dakkoffers", 48),
+    (3068, "Dashcams", 48),
+    (3065, "Fietsendragers", 48),
+    (688, "Handleidingen en Instructieboekjes", 678),
+    (3048, "Hondenrekken", 48),
+    (3075, "Jumpstarters", 48),
+    (3064, "Kentekenplaathouders", 48),
+    (120, "Kitcars", 48),
+    (3069, "Kofferbakmatten", 48),
+    (3074, "Krikken", 48),
+    (3071, "Laadpalen", 48),
+    (2644, "Onderhoudsmiddelen", 48),
+    (102, "Raceauto's", 48),
+    (149, "Schadeauto's", 48),
+    (1619, "Sneeuwkettingen", 48),
+    (1434, "Tuning en Styling", 678),
+    (3073, "Velgenbomen", 48),
+    (2645, "Wieldoppen", 48),
+    (89, "Overige Auto diversen", 48),
+    (2835, "Advies, Hulp en Training", 201),
+    (202, "Atlassen en Landkaarten", 201),
+    (203, "Auto's | Boeken", 201),
+    (2692, "Auto's | Folders en Tijdschriften", 201),
+    (204, "Avontuur en Actie", 201),
+    (205, "Biografieën", 201),
+    (1877, "Boekenweekgeschenken", 201),
+    (206, "Catalogussen en Folders", 201),
+    (1878, "Chicklit", 201),
+    (207, "Detectives", 201),
+    (1879, "Dieren en Huisdieren", 201),
+    (2690, "E-books", 201),
+    (1460, "Economie, Management en Marketing", 201),
+    (209, "Encyclopedieën", 201),
+    (210, "Esoterie en Spiritualiteit", 201),
+    (1880, "Essays, Columns en Interviews", 201),
+    (225, "Fantasy", 201),
+    (1461, "Film, Tv en Media", 201),
+    (1462, "Filosofie", 201),
+    (1463, "Gedichten en Poëzie", 201),
+    (1881, "Geschiedenis | Stad en Regio", 201),
+    (211, "Geschiedenis | Vaderland", 201),
+    (1882, "Geschiedenis | Wereld", 201),
+    (219, "Gezondheid, Dieet en Voeding", 201),
+    (212, "Godsdienst en Theologie", 201),
+    (1883, "Historische romans", 201),
+    (213, "Hobby en Vrije tijd", 201),
+    (1620, "Humor", 201),
+    (214, "Informatica en Computer", 201),
+    (1464, "Kinderboeken | Baby's en Peuters", 201),
+    (1465, "Kinderboeken | Kleuters", 201),
+    (215, "Kinderboeken | Jeugd | onder 10 jaar", 201),
+    (1884, "Kinderboeken | Jeugd | 10 tot 12 jaar", 201),
+    (1885, "Kinderboeken | Jeugd | 13 jaar en ouder", 201),
+    (216, "Kookboeken", 201),
+    (1886, "Kunst en Cultuur | Architectuur", 201),
+    (1887, "Kunst en Cultuur | Beeldend", 201),
+    (1888, "Kunst en Cultuur | Dans en Theater", 201),
+    (217, "Kunst en Cultuur | Fotografie en Design", 201),
+    (218, "Literatuur", 201),
+    (1889, "Luisterboeken", 201),
+    (2618, "Mode", 201),
+    (1350, "Motoren", 239),
+    (220, "Muziek", 201),
+    (208, "Natuur", 201),
+    (2119, "Oorlog en Militair", 201),
+    (2694, "Partijen en Verzamelingen", 201),
+    (1466, "Politiek en Maatschappij", 201),
+    (2693, "Prentenboeken en Plaatjesalbums", 201),
+    (222, "Psychologie", 201),
+    (223, "Reisgidsen", 201),
+    (1890, "Reisverhalen", 201),
+    (224, "Romans", 201),
+    (2688, "Science fiction", 201),
+    (226, "Sportboeken", 201),
+    (2687, "Sprookjes en Fabels", 201),
+    (1467, "Streekboeken en Streekromans", 201),
+    (227, "Stripboeken", 201),
+    (1459, "Strips | Comics", 201),
+    (1652, "Schoolboeken", 201),
+    (228, "Studieboeken en Cursussen", 201),
+    (229, "Taal | Duits", 201),
+    (230, "Taal | Engels", 201),
+    (231, "Taal | Frans", 201),
+    (233, "Taal | Spaans", 201),
+    (232, "Taal | Overige Talen", 201),
+    (235, "Techniek", 201),
+    (236, "Thrillers", 201),
+    (237, "Tijdschriften en Kranten", 201),
+    (2689, "Vervoer en Transport", 201),
+    (1468, "Wetenschap", 201),
+    (1891, "Wonen en Tuinieren", 201),
+    (238, "Woordenboeken", 201),
+    (1892, "Zwangerschap en Opvoeding", 201),
+    (221, "Overige Boeken", 201),
+    (3083, "Bolderkarren", 289),
+    (2710, "Camper Inkoop", 289),
+    (1352, "Camper-accessoires", 289),
+    (2925, "Campers", 289),
+    (292, "Caravan accessoires", 289),
+    (2713, "Caravan Inkoop", 289),
+    (293, "Caravancentra", 289),
+    (2924, "Caravans", 289),
+    (314, "Caravanstallingen", 289),
+    (315, "Kampeeraccessoires", 289),
+    (1922, "Kampeergereedschap", 289),
+    (3077, "Kampeermeubelen", 289),
+    (3081, "Koelboxen", 289),
+    (3079, "Luchtbedden", 289),
+    (3080, "Luchtpompen", 289),
+    (3076, "Regenkleding", 289),
+    (3082, "Slaapmatten", 289),
+    (1923, "Slaapzakken", 289),
+    (317, "Stacaravans", 289),
+    (290, "Tentaccessoires", 289),
+    (318, "Tenten", 289),
+    (319, "Verhuur", 289),
+    (320, "Voortenten en Luifels", 289),
+    (321, "Vouwwagens", 289),
+    (3078, "Windschermen", 289),
+    (3084, "Zaklampen", 289),
+    (316, "Overige Caravans en Kamperen", 289),
+    (1745, "Blu-ray", 1744),
+    (1715, "Cassettebandjes", 1744),
+    (2717, "Cd's | Schlagers", 1744),
+    (1336, "Cd's | Klassiek", 1744),
+    (1342, "Cd's | Verzamelalbums", 1744),
+    (1681, "Cd's | Country en Western", 1744),
+    (1332, "Cd's | Dance en House", 1744),
+    (1747, "Cd's | Kinderen en Jeugd", 1744),
+    (3085, "Cd's | Franstalig", 1744),
+    (1340, "Cd Singles", 1744),
+    (1333, "Cd's | Filmmuziek en Soundtracks", 1744),
+    (2714, "Cd's | Hardrock en Metal", 1744),
+    (1334, "Cd's | Hiphop en Rap", 1744),
+    (1746, "Cd's | Humor en Cabaret", 1744),
+    (2716, "Cd's | Instrumentaal", 1744),
+    (1335, "Cd's | Jazz en Blues", 1744),
+    (2718, "Cd's | Kerst en Sinterklaas", 1744),
+    (1748, "Cd's | Latin en Salsa", 1744),
+    (2121, "Cd's | Meditatie en Spiritualiteit", 1744),
+    (1337, "Cd's | Nederlandstalig", 1744),
+    (1338, "Cd's | Pop", 1744),
+    (1749, "Cd's | R&B en Soul", 1744),
+    (2715, "Cd's | Reggae en Ska", 1744),
+    (2120, "Cd's | Religie en Gospel", 1744),
+    (1339, "Cd's | Rock", 1744),
+    (1343, "Cd's | Wereldmuziek", 1744),
+    (1349, "Cd's | Overige Cd's", 1744),
+    (1107, "Dvd's | Actie", 1744),
+    (2619, "Dvd's | Avontuur", 1744),
+    (2720, "Dvd's | Cabaret en Sketches", 1744),
+    (1450, "Dvd's | Documentaire en Educatief", 1744),
+    (1451, "Dvd's | Drama", 1744),
+    (1750, "Dvd's | Filmhuis", 1744),
+    (1751, "Dvd's | Horror", 1744),
+    (602, "Dvd's | Kinderen en Jeugd", 1744),
+    (1754, "Dvd's | Klassiekers", 1744),
+    (1108, "Dvd's | Komedie", 1744),
+    (1109, "Dvd's | Muziek en Concerten", 1744),
+    (1752, "Dvd's | Nederlandstalig", 1744),
+    (2122, "Dvd's | Religie en Gospel", 1744),
+    (1753, "Dvd's | Science Fiction en Fantasy", 1744),
+    (810, "Dvd's | Sport en Fitness", 1744),
+    (1110, "Dvd's | Tekenfilms en Animatie", 1744),
+    (1111, "Dvd's | Thrillers en Misdaad", 1744),
+    (1112, "Dvd's | Tv en Series", 1744),
+    (1113, "Dvd's | Overige Dvd's", 1744),
+    (1124, "VHS | Documentaire, Tv en Muziek", 1744),
+    (1122, "VHS | Film", 1744),
+    (1125, "VHS | Kinderen en Jeugd", 1744),
+    (1682, "Vinyl | Country en Western", 1744),
+    (1372, "Vinyl | Dance en House", 1744),
+    (1373, "Vinyl | Filmmuziek en Soundtracks", 1744),
+    (2719, "Vinyl | Hardrock en Metal", 1744),
+    (1374, "Vinyl | Hiphop en Rap", 1744),
+    (1375, "Vinyl | Jazz en Blues", 1744),
+    (2721, "Vinyl | Kinderen en Jeugd", 1744),
+    (1376, "Vinyl | Klassiek", 1744),
+    (1762, "Vinyl | Latin en Salsa", 1744),
+    (1377, "Vinyl | Nederlandstalig", 1744),
+    (1378, "Vinyl | Pop", 1744),
+    (1763, "Vinyl | R&B en Soul", 1744),
+    (1379, "Vinyl | Rock", 1744),
+    (1382, "Vinyl | Verzamelalbums", 1744),
+    (1383, "Vinyl | Wereldmuziek", 1744),
+    (1380, "Vinyl Singles", 1744),
+    (1384, "Vinyl | Overige Vinyl", 1744),
+    (3022, "Accesspoints", 322),
+    (2844, "Android Tablets", 322),
+    (371, "Antivirus- en Beveiligingssoftware", 322),
+    (324, "Apple Desktops", 322),
+    (2722, "Apple iPads", 322),
+    (325, "Apple Macbooks", 322),
+    (373, "Audio-software", 322),
+    (3016, "Barebones", 322),
+    (1415, "Beschrijfbare discs", 322),
+    (359, "Besturingssoftware", 322),
+    (3086, "Capture cards", 322),
+    (3020, "Chromebooks", 322),
+    (326, "Computerbehuizingen", 322),
+    (3018, "Computerkoelers", 322),
+    (328, "Desktop Pc's", 322),
+    (3038, "Dockingstations", 322),
+    (2620, "E-readers", 322),
+    (1475, "Educatie- en Cursussoftware", 322),
+    (3014, "Geheugenkaartlezers", 322),
+    (3013, "Geluidskaarten", 322),
+    (333, "Harde schijven", 322),
+    (3037, "Headsets", 322),
+    (3019, "Interne voedingen", 322),
+    (3036, "Joysticks", 322),
+    (3032, "Labelprinters", 322),
+    (1653, "Laptop-opladers", 322),
+    (3030, "Laptophoezen", 322),
+    (3029, "Laptopstandaarden", 322),
+    (3028, "Laptoptafels", 322),
+    (1654, "Laptoptassen", 322),
+    (335, "Moederborden", 322),
+    (336, "Monitoren", 322),
+    (3035, "Muismatten", 322),
+    (1727, "Muizen", 322),
+    (3017, "NAS", 322),
+    (1477, "Navigatiesoftware", 322),
+    (338, "Netwerk switches", 322),
+    (3015, "Netwerkkaarten", 322),
+    (2841, "Noodvoedingen (UPS)", 322),
+    (3039, "Office-software", 322),
+    (369, "Ontwerp- en Bewerkingssoftware", 322),
+    (350, "Optische drives", 322),
+    (332, "Pc speakers", 322),
+    (1658, "Pc- en Netwerkkabels", 322),
+    (3033, "Pocketprinters", 322),
+    (3023, "Powerlines", 322),
+    (3027, "Presenters", 322),
+    (342, "Printers", 322),
+    (1416, "Printerbenodigdheden", 322),
+    (2842, "3D Printers", 322),
+    (3034, "3D-printerbenodigheden", 322),
+    (343, "Processors", 322),
+    (331, "RAM geheugen", 322),
+    (334, "Routers en Modems", 322),
+    (848, "Scanners", 820),
+    (3012, "Serverkasten", 322),
+    (1417, "Servers", 322),
+    (2847, "Tablet-hoezen", 322),
+    (3031, "Tekentablets", 322),
+    (352, "Toetsenborden", 322),
+    (1418, "USB Sticks", 322),
+    (353, "Videokaarten", 322),
+    (327, "Vintage Computers", 322),
+    (354, "Webcams", 322),
+    (3024, "WiFi-versterkers", 322),
+    (339, "Windows Laptops", 322),
+    (2723, "Windows Tablets", 322),
+    (341, "Overige Computers en Software", 322),
+    (379, "Advies en Oproepen", 378),
+    (1353, "Contact kwijt en Opsporing", 378),
+    (1469, "Dating | Websites en SMS", 378),
+    (380, "Evenementen", 378),
+    (1662, "Gevonden voorwerpen", 378),
+    (2078, "Huisgenoten gezocht", 378),
+    (385, "Man zoekt Man", 378),
+    (386, "Man zoekt Vrouw", 378),
+    (1470, "Muziek maken en Bandleden", 378),
+    (390, "Reisgenoten en Carpoolers", 378),
+    (391, "Reünies", 378),
+    (1473, "Sport en Hobby oproepen", 378),
+    (1661, "Thuisparty's", 378),
+    (1474, "Uitgaan", 378),
+    (1396, "Vriendschappen", 378),
+    (393, "Vrouw zoekt Man", 378),
+    (394, "Vrouw zoekt Vrouw", 378),
+    (1205, "Aannemers", 1098),
+    (2079, "Alarminstallateurs en Beveiliging", 1098),
+    (2054, "Alternatieve geneeskunde en Spiritualiteit", 1098),
+    (1189, "Auto en Motor | Monteurs en Garages", 1098),
+    (2037, "Auto en Motor | Poetsers en Wassers", 1098),
+    (2038, "Auto en Motor | Schadeherstellers en Spuiterijen", 1098),
+    (1191, "Bijles, Privé-les en Taalles", 1098),
+    (1708, "Bloemisten en Geschenken", 1098),
+    (1187, "Boekhouders en Administrateurs", 1098),
+    (2080, "Bouwkundig adviseurs en Architecten", 1098),
+    (2081, "Coaching en Persoonlijke effectiviteit", 1098),
+    (1195, "Computer en Internet experts", 1098),
+    (1210, "Cursussen en Workshops", 1098),
+    (2039, "Dakdekkers en Rietdekkers", 1098),
+    (2611, "Detectivebureaus", 1098),
+    (2040, "Dieren | Honden | Verzorging, Oppas en Les", 1098),
+    (2082, "Dieren | Katten | Verzorging, Oppas en Les", 1098),
+    (2041, "Dieren | Paarden | Verzorging, Oppas en Les", 1098),
+    (1196, "Dieren | Overige | Verzorging, Oppas en Les", 1098),
+    (1201, "Drukwerk en Grafisch ontwerpers", 1098),
+    (2608, "Edelsmeden en Sieradenmakers", 1098),
+    (1633, "Elektriciens", 1098),
+    (1421, "Fietsenmakers en Bromfietsenmakers", 1098),
+    (2042, "Film- en Videobewerking", 1098),
+    (1199, "Fotografen", 1098),
+    (1198, "Geld en Leningen", 1098),
+    (2043, "Gevelrenovatie en Voegers", 1098),
+    (2044, "Glaszetters", 1098),
+    (1427, "Groepsuitjes en Personeelsfeesten", 1098),
+    (1202, "Huishoudelijke hulp", 1098),
+    (1097, "Hypotheken en Verzekeringen", 1098),
+    (1225, "Interieuradviseurs", 1098),
+    (1203, "Juristen en Notarissen", 1098),
+    (1634, "Kappers en Thuiskappers", 1098),
+    (2084, "Kinderfeestjes en Entertainers", 1098),
+    (2612, "Kledingadvies en Stylisten", 1098),
+    (2045, "Kleermakers en Kledingontwerpers", 1098),
+    (1192, "Klussers en Klusbedrijven", 1098),
+    (1204, "Koeriers, Chauffeurs en Taxi's", 1098),
+    (1423, "Kunstenaars en Portretschilders", 1098),
+    (2607, "Lassers en Metaalbewerking", 1098),
+    (1635, "Loodgieters en Installateurs", 1098),
+    (1424, "Makelaars en Taxateurs", 1098),
+    (1425, "Muziekles en Zangles", 1098),
+    (1188, "Muzikanten, Artiesten en Dj's", 1098),
+    (2085, "Ongediertebestrijding", 1098),
+    (1211, "Oppas en Kinderopvang", 1098),
+    (3087, "Personal trainers", 1098),
+    (2613, "Promotie- en Reclamebureaus", 1098),
+    (2610, "Reparatie en Onderhoud | Antiek, Klokken en Meubels", 1098),
+    (1219, "Reparatie en Onderhoud | Audio, Tv en Foto", 1098),
+    (2086, "Reparatie en Onderhoud | Caravans en Campers", 1098),
+    (2047, "Reparatie en Onderhoud | Kleding en Schoenen", 1098),
+    (2087, "Reparatie en Onderhoud | Muziekinstrumenten", 1098),
+    (2088, "Reparatie en Onderhoud | Pc's en Spelcomputers", 1098),
+    (2052, "Reparatie en Onderhoud | Sloten", 1098),
+    (1664, "Reparatie en Onderhoud | Telecommunicatie", 1098),
+    (2089, "Reparatie en Onderhoud | Watersport en Boten", 1098),
+    (1397, "Reparatie en Onderhoud | Witgoed en Apparatuur", 1098),
+    (1636, "Reparatie en Onderhoud | Overige", 1098),
+    (1193, "Restaurants en Cateraars", 1098),
+    (1213, "Rijscholen", 1098),
+    (1214, "Schilders en Behangers", 1098),
+    (2048, "Schoonheidsspecialisten | Manicure", 1098),
+    (2049, "Schoonheidsspecialisten | Pedicure", 1098),
+    (1220, "Schoonheidsspecialisten | Overige", 1098),
+    (1637, "Schoonmakers en Glazenwassers", 1098),
+    (2050, "Schoorsteenvegers", 1098),
+    (2051, "Slopers en Sloopwerkzaamheden", 1098),
+    (1426, "Stukadoors en Tegelzetters", 1098),
+    (1226, "Thuiszorg en Kraamhulp", 1098),
+    (1638, "Timmerlieden en Meubelmakers", 1098),
+    (1218, "Tuinmannen en Stratenmakers", 1098),
+    (2606, "Uitvaartverzorging", 1098),
+    (1221, "Verhuizers en Opslag", 1098),
+    (59, "Verhuur | Auto en Motor", 1098),
+    (996, "Verhuur | Boten", 1098),
+    (1871, "Verhuur | Gereedschap en Machines", 1098),
+    (1422, "Verhuur | Kleding en Feestkleding", 1098),
+    (1639, "Verhuur | Zalen en Feestlocaties", 1098),
+    (1719, "Verhuur | Overig", 1098),
+    (1222, "Vertalers, Tolken en Tekstschrijvers", 1098),
+    (2090, "Vloerleggers en Parketteurs", 1098),
+    (2091, "Wasserettes, Stomerijen en Strijkservice", 1098),
+    (1223, "Webdesigners en Hosting", 1098),
+    (2055, "Welzijn | Masseurs en Massagesalons", 1098),
+    (2056, "Welzijn | Therapeuten", 1098),
+    (1200, "Welzijn | Overige", 1098),
+    (1640, "Zakelijk adviseurs en Bemiddelaars", 1098),
+    (2057, "Zonweringinstallateurs", 1098),
+    (1227, "Overige Diensten", 1098),
+    (399, "Dierenvoeding", 395),
+    (2725, "Honden | Beagles, Bassets en Lopende honden", 395),
+    (1924, "Honden | Bulldogs, Pinschers en Molossers", 395),
+    (1925, "Honden | Chihuahua's en Gezelschapshonden", 395),
+    (1926, "Honden | Dekreuen", 395),
+    (401, "Honden | Herdershonden en Veedrijvers", 395),
+    (402, "Honden | Jack Russells en Terriërs", 395),
+    (404, "Honden | Niet-rashonden", 395),
+    (2726, "Honden | Poolhonden, Keeshonden en Oertypen", 395),
+    (403, "Honden | Retrievers, Spaniëls en Waterhonden", 395),
+    (2727, "Honden | Setters en Staande honden", 395),
+    (1927, "Honden | Teckels en Dashonden", 395),
+    (2728, "Honden | Windhonden", 395),
+    (1928, "Honden-accessoires", 395),
+    (3092, "Hondenbenches", 395),
+    (3094, "Hondenhalsbanden en Penningen", 395),
+    (1356, "Hondenhokken", 395),
+    (3090, "Hondenkleding", 395),
+    (3088, "Hondenmanden", 395),
+    (3093, "Hondenriemen", 395),
+    (3091, "Hondenspeelgoed", 395),
+    (3089, "Hondenvoerbakken en Drinkbakken", 395),
+    (2732, "Insecten en Spinnen", 395),
+    (1929, "Katten en Kittens | Dekkaters", 395),
+    (406, "Katten en Kittens | Overige Katten", 395),
+    (407, "Katten en Kittens | Raskatten | Korthaar", 395),
+    (1930, "Katten en Kittens | Raskatten | Langhaar", 395),
+    (1931, "Katten-accessoires", 395),
+    (3096, "Kattenbakken", 395),
+    (3100, "Kattenhalsbanden en Penningen", 395),
+    (3099, "Kattenmanden", 395),
+    (3098, "Kattenspeelgoed", 395),
+    (3095, "Kattenvoerbakken en Drinkbakken", 395),
+    (408, "Knaagdieren", 395),
+    (1357, "Knaagdieren en Konijnen | Hokken en Kooien", 395),
+    (1932, "Knaagdieren en Konijnen | Toebehoren", 395),
+    (409, "Konijnen", 395),
+    (3097, "Krabmeubelen", 395),
+    (411, "Paarden", 395),
+    (2731, "Paarden en Pony's | Beschermers", 395),
+    (2730, "Paarden en Pony's | Dekens en Dekjes", 395),
+    (1933, "Paarden en Pony's | Dekhengsten en Fokmerries", 395),
+    (1712, "Paarden en Pony's | Hoofdstellen en Tuigage", 395),
+    (413, "Paarden en Pony's | Overige Paardenspullen", 395),
+    (414, "Paarden en Pony's | Trailers en Aanhangwagens", 395),
+    (2729, "Paarden en Pony's | Verzorgingsproducten", 395),
+    (416, "Paarden en Pony's | Zadels", 395),
+    (1486, "Paardrijkleding", 395),
+    (1488, "Pluimvee", 395),
+    (400, "Pluimvee | Toebehoren", 395),
+    (417, "Pony's", 395),
+    (418, "Reptielen en Amfibieën", 395),
+    (421, "Reptielen en Amfibieën | Toebehoren", 395),
+    (419, "Rijtuigen en Koetsen", 395),
+    (422, "Runderen", 395),
+    (1485, "Schapen, Geiten en Varkens", 395),
+    (420, "Stalling en Weidegang", 395),
+    (3050, "Transportboxen", 395),
+    (423, "Vermiste en Gevonden Dieren", 395),
+    (396, "Vissen | Aquaria en Toebehoren", 395),
+    (424, "Vissen | Aquariumvissen", 395),
+    (425, "Vissen | Vijvervissen", 395),
+    (1665, "Vogels | Duiven", 395),
+    (1358, "Vogels | Hokken en Kooien", 395),
+    (1487, "Vogels | Kanaries", 395),
+    (426, "Vogels | Overige Vogels", 395),
+    (427, "Vogels | Parkieten en Papegaaien", 395),
+    (1934, "Vogels | Toebehoren", 395),
+    (410, "Overige Dieren", 395),
+    (397, "Overige Dieren-accessoires", 395),
+    (3199, "Adembescherming", 239),
+    (241, "Aggregaten", 239),
+    (1866, "Alarmsystemen", 239),
+    (3102, "Betonmolens", 239),
+    (2849, "Bouwketen en Schaftketen", 239),
+    (273, "Bouwliften", 239),
+    (1185, "Bouwverlichting", 239),
+    (1395, "Buizen en Afvoer", 239),
+    (243, "Compressors", 239),
+    (2850, "Containers", 239),
+    (270, "Dakpannen en Dakbedekking", 239),
+    (244, "Deuren en Horren", 239),
+    (245, "Draaibanken", 239),
+    (1867, "Elektra en Kabels", 239),
+    (3198, "Gehoorbeschermers", 239),
+    (246, "Geisers en Boilers", 239),
+    (242, "Gereedschap | Boormachines", 239),
+    (2990, "Gereedschap | Freesmachines", 239),
+    (247, "Gereedschap | Handgereedschap", 239),
+    (258, "Gereedschap | Lasapparaten", 239),
+    (1710, "Gereedschap | Machine-onderdelen en Toebehoren", 239),
+    (259, "Gereedschap | Overige machines", 239),
+    (268, "Gereedschap | Schuurmachines", 239),
+    (2733, "Gereedschap | Slijpmachines", 239),
+    (287, "Gereedschap | Zaagmachines", 239),
+    (3103, "Gereedschapskisten", 239),
+    (249, "Glas en Ramen", 239),
+    (1869, "Hang- en Sluitwerk", 239),
+    (252, "Hout en Planken", 239),
+    (2621, "IJzerwaren en Bevestigingsmiddelen", 239),
+    (1870, "Isolatie en Afdichting", 239),
+    (254, "Kozijnen en Schuifpuien", 239),
+    (256, "Kratten en Dozen", 239),
+    (257, "Ladders en Trappen", 239),
+    (3197, "Laskappen", 239),
+    (3049, "Lieren en Takels", 239),
+    (1399, "Meetapparatuur", 239),
+    (260, "Metalen", 239),
+    (2624, "Metselstenen", 239),
+    (2851, "Palletwagens en Pompwagens", 239),
+    (263, "Platen en Panelen", 239),
+    (1872, "Plinten en Afwerking", 239),
+    (264, "Reinigingsmachines", 239),
+    (265, "Rolluiken", 239),
+    (266, "Sanitair", 239),
+    (3104, "Schaafmachines", 239),
+    (267, "Schildersmaterialen", 239),
+    (269, "Steigers", 239),
+    (1873, "Tegels", 239),
+    (271, "Tekentafels", 239),
+    (3105, "Thermostaten", 239),
+    (2623, "Transportwagens", 239),
+    (3101, "Veiligheidsbrillen", 239),
+    (3201, "Veiligheidshelmen", 239),
+    (3200, "Veiligheidskleding", 239),
+    (1874, "Ventilatie en Afzuiging", 239),
+    (1875, "Verf, Beits en Lak", 239),
+    (282, "Verwarming en Radiatoren", 239),
+    (284, "Vloerdelen en Plavuizen", 239),
+    (564, "Weegschalen", 537),
+    (261, "Werkbanken", 239),
+    (1876, "Zeil en Folie", 239),
+    (2622, "Zonnepanelen en Toebehoren", 239),
+    (2852, "Zwenkwielen", 239),
+    (262, "Overige Doe-het-zelf en Verbouw", 239),
+    (2735, "Brommerhelmen", 445),
+    (712, "Brommeronderdelen | Algemeen", 445),
+    (1623, "Brommeronderdelen | Kreidler", 445),
+    (2027, "Brommeronderdelen | Oldtimers", 445),
+    (718, "Brommeronderdelen | Puch", 445),
+    (719, "Brommeronderdelen | Scooters", 445),
+    (720, "Brommeronderdelen | Snorfietsen", 445),
+    (1138, "Brommeronderdelen | Zundapp", 445),
+    (679, "Brommers | Crossbrommers", 445),
+    (2734, "Brommers | Derbi", 445),
+    (1432, "Brommers | Honda", 445),
+    (680, "Brommers | Kreidler", 445),
+    (681, "Brommers | Oldtimers", 445),
+    (682, "Brommers | Overige merken", 445),
+    (2124, "Brommers | Peugeot", 445),
+    (683, "Brommers | Puch", 445),
+    (684, "Brommers | Schadebrommers", 445),
+    (2625, "Brommers | Solex", 445),
+    (1914, "Brommers | Toebehoren", 445),
+    (685, "Brommers | Tomos", 445),
+    (1915, "Brommers | Tuning en Styling", 445),
+    (686, "Brommers | Vespa", 445),
+    (687, "Brommers | Zundapp", 445),
+    (451, "Elektrische fietsen", 445),
+    (450, "Fietsaccessoires | Aanhangers en Karren", 445),
+    (3108, "Fietsaccessoires | Bagagedragers", 445),
+    (3110, "Fietsaccessoires | Buggydragers", 445),
+    (3107, "Fietsaccessoires | Fietsaccu's", 445),
+    (3112, "Fietsaccessoires | Fietscomputers", 445),
+    (3115, "Fietsaccessoires | Fietsenrekken", 445),
+    (3109, "Fietsaccessoires | Fietsgereedschap", 445),
+    (2736, "Fietsaccessoires | Fietshelmen", 445),
+    (468, "Fietsaccessoires | Fietskleding", 445),
+    (1918, "Fietsaccessoires | Fietsmanden", 445),
+    (3113, "Fietsaccessoires | Fietspompen", 445),
+    (3114, "Fietsaccessoires | Fietssloten", 445),
+    (457, "Fietsaccessoires | Fietsstoeltjes", 445),
+    (1666, "Fietsaccessoires | Fietstassen", 445),
+    (3111, "Fietsaccessoires | Fietsverlichting", 445),
+    (3116, "Fietsaccessoires | Fietsbellen", 445),
+    (1919, "Fietsaccessoires | Overige Fietsaccessoires", 445),
+    (446, "Fietsen | Bakfietsen", 445),
+    (1621, "Fietsen | Crossfietsen en BMX", 445),
+    (1667, "Fietsen | Cruisers en Lowriders", 445),
+    (447, "Fietsen | Dames | Damesfietsen", 445),
+    (1916, "Fietsen | Dames | Moederfietsen", 445),
+    (461, "Fietsen | Dames | Omafietsen", 445),
+    (448, "Fietsen | Dames | Sportfietsen en Toerfietsen", 445),
+    (456, "Fietsen | Driewielers", 445),
+    (449, "Fietsen | Driewielfietsen", 445),
+    (3106, "Fietsen | Eenwielers", 445),
+    (453, "Fietsen | Heren | Herenfietsen", 445),
+    (454, "Fietsen | Heren | Sportfietsen en Toerfietsen", 445),
+    (455, "Fietsen | Jongens", 445),
+    (1917, "Fietsen | Kinderfietsjes", 445),
+    (458, "Fietsen | Ligfietsen", 445),
+    (459, "Fietsen | Meisjes", 445),
+    (460, "Fietsen | Mountainbikes en ATB", 445),
+    (2026, "Fietsen | Oldtimers", 445),
+    (464, "Fietsen | Racefietsen", 445),
+    (466, "Fietsen | Tandems", 445),
+    (467, "Fietsen | Vouwfietsen", 445),
+    (462, "Fietsonderdelen", 445),
+    (690, "Minibikes, Midibikes en Pitbikes", 445),
+    (2737, "Scooters | Aprilia", 445),
+    (2738, "Scooters | Kymco", 445),
+    (2742, "Scooters | Overige merken", 445),
+    (2739, "Scooters | Peugeot", 445),
+    (2740, "Scooters | Piaggio", 445),
+    (2853, "Scooters | SYM", 445),
+    (2741, "Scooters | Vespa", 445),
+    (726, "Scooters | Yamaha", 445),
+    (727, "Snorfietsen en Snorscooters", 445),
+    (465, "Steps", 445),
+    (463, "Overige Fietsen en Brommers", 445),
+    (1228, "Borduren en Borduurmachines", 1099),
+    (1229, "Breien en Haken", 1099),
+    (1231, "Cursusmateriaal", 1099),
+    (1969, "Denksport en Puzzels", 1099),
+    (1398, "Elektronica-componenten", 1099),
+    (1234, "Feestartikelen", 1099),
+    (1971, "Feestartikelen | Verhuur", 1099),
+    (1233, "Gezelschapsspellen | Bordspellen", 1099),
+    (2743, "Gezelschapsspellen | Kaartspellen", 1099),
+    (2744, "Gezelschapsspellen | Overige", 1099),
+    (1401, "Kaarten | Zelf maken", 1099),
+    (2745, "Kaarten | Zelfgemaakt", 1099),
+    (2854, "Kantklossen", 1099),
+    (2855, "Kledingapplicaties en Hotfix", 1099),
+    (1235, "Kledingpatronen", 1099),
+    (1240, "Knutselen", 1099),
+    (2626, "Kostuums, Theaterbenodigdheden en LARP", 1099),
+    (1241, "Kralen en Sieraden maken", 1099),
+    (1236, "Metaaldetectors", 1099),
+    (2126, "Ministeck", 1099),
+    (2127, "Modelauto's | 1:5 tot 1:12", 1099),
+    (921, "Modelauto's | 1:18", 1099),
+    (2746, "Modelauto's | 1:24", 1099),
+    (2747, "Modelauto's | 1:32", 1099),
+    (1972, "Modelauto's | 1:43", 1099),
+    (2033, "Modelauto's | 1:50", 1099),
+    (2748, "Modelauto's | 1:87", 1099),
+    (2749, "Modelauto's | Overige schalen", 1099),
+    (1237, "Modelbouw | Auto's en Voertuigen", 1099),
+    (2750, "Modelbouw | Boten en Schepen", 1099),
+    (2751, "Modelbouw | Figuren en Diorama's", 1099),
+    (2752, "Modelbouw | Vliegtuigen en Helikopters", 1099),
+    (2753, "Modelbouw | Overige", 1099),
+    (2034, "Modelbouw | Radiografisch | Auto's", 1099),
+    (2754, "Modelbouw | Radiografisch | Helikopters en Quadcopters", 1099),
+    (2856, "Modelbouw | Radiografisch | Vliegtuigen", 1099),
+    (2755, "Modelbouw | Radiografisch | Overige", 1099),
+    (1238, "Modeltreinen | H0", 1099),
+    (2627, "Modeltreinen | N-Spoor", 1099),
+    (2756, "Modeltreinen | Overige schalen", 1099),
+    (1973, "Naaien en Fournituren", 1099),
+    (1239, "Naaimachines en Toebehoren", 1099),
+    (2857, "Picknickmanden", 1099),
+    (2858, "Pottenbakken", 1099),
+    (1242, "Schilderen", 1099),
+    (1243, "Scrapbooking", 1099),
+    (1230, "Spaarzegeltjes", 1099),
+    (2859, "Spinnewielen en Spinnen", 1099),
+    (1974, "Stempelen", 1099),
+    (2757, "Stickers en Plaatjes", 1099),
+    (1244, "Stoffen en Lappen", 1099),
+    (2860, "Taarten en Cupcakes maken", 1099),
+    (1975, "Tekenen", 1099),
+    (1245, "Theezakjes", 1099),
+    (2861, "Vergrootglazen, Loepen en Loeplampen", 1099),
+    (919, "Verzamelkaartspellen | Magic the Gathering", 1099),
+    (930, "Verzamelkaartspellen | Pokémon", 1099),
+    (949, "Verzamelkaartspellen | Yu-gi-Oh!", 1099),
+    (1976, "Verzamelkaartspellen | Overige", 1099),
+    (1977, "Vilt", 1099),
+    (1449, "Wargaming", 1099),
+    (1264, "Overige Hobby en Vrije tijd", 1099),
+    (1509, "Badkamer | Badkamermeubels", 504),
+    (1935, "Badkamer | Badtextiel en Accessoires", 504),
+    (1936, "Badkamer | Complete badkamers", 504),
+    (505, "Banken | Bankstellen", 504),
+    (1939, "Banken | Complete zithoeken", 504),
+    (1937, "Banken | Sofa's en Chaises Longues", 504),
+    (1938, "Banken | Voetenbanken en Poefen", 504),
+    (2128, "Barkrukken", 504),
+    (3206, "Barren", 504),
+    (1253, "Brandblussers en Brandkasten", 504),
+    (508, "Bureaus", 504),
+    (3194, "Bureaustoelen", 504),
+    (511, "Complete eetkamers", 504),
+    (510, "Complete inboedels", 504),
+    (2951, "Emmers", 504),
+    (1940, "Fauteuils", 504),
+    (2950, "Haarden", 504),
+    (513, "Kachels", 504),
+    (1254, "Kamerplanten", 504),
+    (515, "Kasten | Boekenkasten", 504),
+    (516, "Kasten | Buffetkasten", 504),
+    (2763, "Kasten | Computermeubels", 504),
+    (517, "Kasten | Dressoirs", 504),
+    (518, "Kasten | Kledingkasten", 504),
+    (2764, "Kasten | Ladekasten", 504),
+    (2862, "Kasten | Lockerkasten", 504),
+    (519, "Kasten | Overige", 504),
+    (2765, "Kasten | Roldeurkasten en Archiefkasten", 504),
+    (2864, "Kasten | Schoenenkasten", 504),
+    (3117, "Kasten | Schoenenrekken", 504),
+    (2863, "Kasten | Secretaires", 504),
+    (3118, "Kasten | Stellingkasten", 504),
+    (1255, "Kasten | Televisiemeubels", 504),
+    (520, "Kasten | Vitrinekasten", 504),
+    (1256, "Kasten | Wandmeubels", 504),
+    (1941, "Keuken | Bestek", 504),
+    (521, "Keuken | Complete keukens", 504),
+    (1257, "Keuken | Keukenbenodigdheden", 504),
+    (1942, "Keuken | Keukenelementen", 504),
+    (1511, "Keuken | Potten en Pannen", 504),
+    (1262, "Keuken | Servies", 504),
+    (1943, "Keuken | Textiel", 504),
+    (1512, "Keuken | Tupperware", 504),
+    (3203, "Krukjes", 504),
+    (1258, "Lampen | Hanglampen", 504),
+    (1944, "Lampen | Kroonluchters", 504),
+    (1945, "Lampen | Lampenkappen", 504),
+    (2760, "Lampen | Losse lampen", 504),
+    (1265, "Lampen | Overige", 504),
+    (2761, "Lampen | Plafondlampen", 504),
+    (2762, "Lampen | Spots", 504),
+    (1260, "Lampen | Tafellampen", 504),
+    (1259, "Lampen | Vloerlampen", 504),
+    (1622, "Lampen | Wandlampen", 504),
+    (1261, "Schoonmaakartikelen", 504),
+    (507, "Slaapkamer | Bedden", 504),
+    (525, "Slaapkamer | Beddengoed", 504),
+    (1946, "Slaapkamer | Boxsprings", 504),
+    (1948, "Slaapkamer | Complete slaapkamers", 504),
+    (506, "Slaapkamer | Matrassen en Bedbodems", 504),
+    (2766, "Slaapkamer | Nachtkastjes", 504),
+    (528, "Slaapkamer | Slaapbanken", 504),
+    (1947, "Slaapkamer | Stapelbedden en Hoogslapers", 504),
+    (535, "Slaapkamer | Waterbedden", 504),
+    (530, "Stoelen", 504),
+    (1669, "Stoffering | Behang", 504),
+    (512, "Stoffering | Gordijnen en Lamellen", 504),
+    (533, "Stoffering | Tapijten en Kleden", 504),
+    (1517, "Stoffering | Vloerbedekking", 504),
+    (3120, "Tafelkleden", 504),
+    (531, "Tafelonderdelen", 504),
+    (2758, "Tafels | Bijzettafels", 504),
+    (1949, "Tafels | Eettafels", 504),
+    (2759, "Tafels | Kaptafels", 504),
+    (527, "Tafels | Salontafels", 504),
+    (1950, "Tafels | Sidetables", 504),
+    (3119, "Tafels | Statafels", 504),
+    (2865, "Woonaccessoires | Boeddhabeelden", 504),
+    (509, "Woonaccessoires | Cd- en Dvd-rekken", 504),
+    (3127, "Deurbellen", 504),
+    (3123, "Woonaccessoires | Deurstoppers", 504),
+    (2767, "Woonaccessoires | Dienbladen", 504),
+    (3122, "Woonaccessoires | Droogbloemen", 504),
+    (2866, "Woonaccessoires | Etagères", 504),
+    (2867, "Woonaccessoires | Kamerschermen", 504),
+    (1510, "Woonaccessoires | Kandelaars en Kaarsen", 504),
+    (514, "Woonaccessoires | Kapstokken", 504),
+    (1513, "Woonaccessoires | Kisten", 504),
+    (523, "Woonaccessoires | Klokken", 504),
+    (2869, "Woonaccessoires | Kransen", 504),
+    (2868, "Woonaccessoires | Krantenbakken en Lectuurbakken", 504),
+    (3121, "Woonaccessoires | Kunstplanten en Kunstbloemen", 504),
+    (2768, "Woonaccessoires | Kussens", 504),
+    (2769, "Woonaccessoires | Lijsten", 504),
+    (2871, "Woonaccessoires | Memoborden", 504),
+    (2872, "Woonaccessoires | Onderzetters", 504),
+    (536, "Woonaccessoires | Overige", 504),
+    (3124, "Woonaccessoires | Paraplubakken", 504),
+    (2870, "Woonaccessoires | Plaids en Woondekens", 504),
+    (1514, "Woonaccessoires | Prullenbakken", 504),
+    (1515, "Woonaccessoires | Schalen en Manden", 504),
+    (1668, "Woonaccessoires | Schilderijen, Tekeningen en Foto's", 504),
+    (529, "Woonaccessoires | Spiegels", 504),
+    (2874, "Woonaccessoires | Stolpen", 504),
+    (2873, "Woonaccessoires | Tekstborden en Spreuken", 504),
+    (3125, "Woonaccessoires | Thermometers", 504),
+    (1516, "Woonaccessoires | Vazen", 504),
+    (2875, "Woonaccessoires | Wanddecoraties", 504),
+    (2876, "Woonaccessoires | Wandplanken en Boekenplanken", 504),
+    (3126, "Woonaccessoires | Wereldbollen", 504),
+    (1518, "Woonaccessoires | Wijnrekken", 504),
+    (2877, "Woonaccessoires | Zuilen en Pilaren", 504),
+    (2770, "Zitzakken", 504),
+    (526, "Overige Huis en Inrichting", 504),
+    (2142, "Huizen te koop", 1032),
+    (2143, "Huizen te huur", 1032),
+    (2771, "Kamers te huur", 1032),
+    (2144, "Anti-kraak", 1032),
+    (1041, "Buitenland", 1032),
+    (2147, "Expat Rentals", 1032),
+    (1643, "Garages en Parkeerplaatsen", 1032),
+    (1055, "Kavels en Percelen", 1032),
+    (1642, "Nieuwbouwprojecten", 1032),
+    (860, "Recreatiewoningen te koop", 1032),
+    (2812, "Woningruil", 856),
+    (1081, "Woonboten te koop", 1032),
+    (2145, "Op zoek naar een huis", 1032),
+    (2146, "Op zoek naar een kamer", 1032),
+    (566, "Autostoeltjes", 565),
+    (581, "Babydragers en Draagdoeken", 565),
+    (567, "Babyfoons", 565),
+    (3129, "Babykleding | Baby-kledingpakketten", 565),
+    (3128, "Babykleding | Baby-zwemkleding", 565),
+    (568, "Babykleding | Maat 50", 565),
+    (569, "Babykleding | Maat 56", 565),
+    (570, "Babykleding | Maat 62", 565),
+    (571, "Babykleding | Maat 68", 565),
+    (572, "Babykleding | Maat 74", 565),
+    (573, "Babykleding | Maat 80", 565),
+    (574, "Babykleding | Maat 86", 565),
+    (1673, "Babykleding | Mutsen, Sjaals en Wanten", 565),
+    (575, "Babykleding | Overige", 565),
+    (2777, "Babykleding | Petten en Hoeden", 565),
+    (2130, "Babykleding | Prematuur", 565),
+    (576, "Babykleding | Schoentjes en Sokjes", 565),
+    (3137, "Babymode-accessoires", 565),
+    (1489, "Babyvoeding en Toebehoren", 565),
+    (577, "Babywiegjes en Ledikanten", 565),
+    (578, "Badjes en Verzorging", 565),
+    (580, "Boxen", 565),
+    (2132, "Buggy's", 565),
+    (2129, "Carnavalskleding en Verkleedspullen", 565),
+    (2133, "Dekens, Slaapzakjes en Inbakerproducten", 565),
+    (579, "Kinderkamer | Bedden", 565),
+    (2772, "Kinderkamer | Beddengoed", 565),
+    (2773, "Kinderkamer | Commodes en Kasten", 565),
+    (1670, "Kinderkamer | Complete kinderkamers", 565),
+    (1671, "Kinderkamer | Inrichting en Decoratie", 565),
+    (599, "Kinderkamer | Overige Meubels", 565),
+    (2774, "Kinderkamer | Stapelbedden en Hoogslapers", 565),
+    (2775, "Kinderkamer | Tafels en Stoelen", 565),
+    (3135, "Kinderkleding | Kinder-kledingpakketten", 565),
+    (3134, "Kinderkleding | Kinder-zwemkleding", 565),
+    (584, "Kinderkleding | Maat 104", 565),
+    (585, "Kinderkleding | Maat 110", 565),
+    (586, "Kinderkleding | Maat 116", 565),
+    (587, "Kinderkleding | Maat 122", 565),
+    (588, "Kinderkleding | Maat 128", 565),
+    (589, "Kinderkleding | Maat 134", 565),
+    (590, "Kinderkleding | Maat 140", 565),
+    (591, "Kinderkleding | Maat 146", 565),
+    (592, "Kinderkleding | Maat 152", 565),
+    (593, "Kinderkleding | Maat 158", 565),
+    (594, "Kinderkleding | Maat 164", 565),
+    (595, "Kinderkleding | Maat 170", 565),
+    (596, "Kinderkleding | Maat 176", 565),
+    (582, "Kinderkleding | Maat 92", 565),
+    (583, "Kinderkleding | Maat 98", 565),
+    (1672, "Kinderkleding | Mutsen, Sjaals en Handschoenen", 565),
+    (597, "Kinderkleding | Overige", 565),
+    (2776, "Kinderkleding | Petten en Hoeden", 565),
+    (598, "Kinderkleding | Schoenen en Sokken", 565),
+    (3136, "Kindermode-accessoires", 565),
+    (1951, "Kinderspulletjes", 565),
+    (600, "Kinderstoelen", 565),
+    (603, "Kinderwagens en Combinaties", 565),
+    (1952, "Kraamcadeaus en Geboorteborden", 565),
+    (3138, "Luiertassen", 565),
+    (1490, "Speelgoed | Actiefiguren", 565),
+    (1491, "Speelgoed | Babyspeelgoed", 565),
+    (3144, "Speelgoed | Badspeelgoed", 565),
+    (2157, "Speelgoed | Bouwstenen", 565),
+    (3131, "Speelgoed | Buiten | Accuvoertuigen", 565),
+    (2878, "Speelgoed | Buiten | Actiespeelgoed", 565),
+    (2779, "Speelgoed | Buiten | Los speelgoed", 565),
+    (3130, "Speelgoed | Buiten | Opblaasfiguren", 565),
+    (617, "Speelgoed | Buiten | Rolschaatsen", 565),
+    (618, "Speelgoed | Buiten | Skelters", 565),
+    (3133, "Speelgoed | Buiten | Sleeën", 565),
+    (3011, "Speelgoed | Buiten | Speelhuisjes", 565),
+    (607, "Speelgoed | Buiten | Speeltoestellen", 565),
+    (3132, "Speelgoed | Buiten | Springkussens", 565),
+    (2780, "Speelgoed | Buiten | Trampolines", 565),
+    (2781, "Speelgoed | Buiten | Voertuigen en Loopfietsen", 565),
+    (2782, "Speelgoed | Buiten | Zandbakken", 565),
+    (611, "Speelgoed | Duplo en Lego", 565),
+    (1492, "Speelgoed | Educatief en Creatief", 565),
+    (608, "Speelgoed | Fisher-Price", 565),
+    (3143, "Speelgoed | Hobbelfiguren", 565),
+    (1674, "Speelgoed | Houten speelgoed", 565),
+    (615, "Speelgoed | Kinderpuzzels", 565),
+    (610, "Speelgoed | Knuffels en Pluche", 565),
+    (2879, "Speelgoed | My Little Pony", 565),
+    (612, "Speelgoed | Overig", 565),
+    (613, "Speelgoed | Playmobil", 565),
+    (614, "Speelgoed | Poppen", 565),
+    (2783, "Speelgoed | Poppenhuizen", 565),
+    (616, "Speelgoed | Racebanen", 565),
+    (2131, "Speelgoed | Speelgoedvoertuigen", 565),
+    (3139, "Speelgoed | Speelkeukens", 565),
+    (3142, "Speelgoed | Speelkleden", 565),
+    (3145, "Speelgoed | Speeltafels", 565),
+    (3141, "Speelgoed | Speeltenten", 565),
+    (2880, "Speelgoed | Thomas de Trein", 565),
+    (3140, "Speelgoed | Voetbaltafels", 565),
+    (2778, "Speelgoed | Vtech", 565),
+    (619, "Traphekjes", 565),
+    (1706, "Tweelingen en Meerlingen", 565),
+    (620, "Wipstoeltjes", 565),
+    (606, "Overige Kinderen en Baby's", 565),
+    (1778, "Badmode en Zwemkleding", 1776),
+    (628, "Blouses en Tunieken", 621),
+    (2032, "Bodywarmers", 1776),
+    (646, "Broeken en Pantalons", 1776),
+    (2031, "Carnavalskleding en Feestkleding", 1776),
+    (3146, "Dames-kledingpakketten", 621),
+    (2134, "Gelegenheidskleding", 621),
+    (1331, "Grote Maten", 1776),
+    (641, "Hoeden en Petten", 1776),
+    (2881, "Huispakken", 621),
+    (1494, "Jasjes, Kostuums en Pakken", 621),
+    (2788, "Jassen | Winter", 1776),
+    (647, "Jassen | Zomer", 1776),
+    (2785, "Jumpsuits", 621),
+    (631, "Jurken", 621),
+    (3147, "Kledinghangers", 621),
+    (3148, "Kledingrekken", 621),
+    (1676, "Leggings, Maillots en Panty's", 621),
+    (1680, "Mutsen, Sjaals en Handschoenen", 1776),
+    (632, "Ondergoed en Lingerie", 621),
+    (634, "Positiekleding", 621),
+    (3205, "Pyjama's", 1776),
+    (1495, "Riemen en Ceinturen", 1776),
+    (635, "Rokken", 621),
+    (642, "Schoenen", 1776),
+    (1677, "Sokken en Kousen", 1776),
+    (1497, "Spijkerbroeken en Jeans", 1776),
+    (1779, "Sportkleding", 1776),
+    (651, "T-shirts", 1776),
+    (638, "Tops", 621),
+    (2629, "Trouwkleding en Trouwaccessoires", 1776),
+    (652, "Truien en Vesten", 1776),
+    (2630, "Wintersportkleding", 1776),
+    (633, "Overige Dameskleding", 621),
+    (3149, "Heren-kledingpakketten", 1776),
+    (648, "Kostuums en Colberts", 1776),
+    (1675, "Ondergoed", 1776),
+    (649, "Overhemden", 1776),
+    (2790, "Polo's", 1776),
+    (643, "Stropdassen", 1776),
+    (650, "Overige Herenkleding", 1776),
+    (1893, "Accessoires | Koffers en Tassen", 678),
+    (1894, "Accessoires | Navigatiesystemen", 678),
+    (1895, "Accessoires | Onderhoudsmiddelen", 678),
+    (1896, "Accessoires | Sloten", 678),
+    (1897, "Accessoires | Stickers", 678),
+    (1898, "Accessoires | Overige", 678),
+    (1899, "Kleding | Motorhelmen", 678),
+    (689, "Kleding | Motorkleding", 678),
+    (691, "Motoren | Aprilia", 678),
+    (3222, "Motoren | Benelli", 678),
+    (692, "Motoren | BMW", 678),
+    (2647, "Motoren | Buell", 678),
+    (2648, "Motoren | Cagiva", 678),
+    (3228, "Motoren | CFMOTO", 678),
+    (694, "Motoren | Ducati", 678),
+    (695, "Motoren | Harley-Davidson", 678),
+    (696, "Motoren | Honda", 678),
+    (2882, "Motoren | Husqvarna", 678),
+    (2883, "Motoren | Hyosung", 678),
+    (697, "Motoren | Kawasaki", 678),
+    (2649, "Motoren | KTM", 678),
+    (2941, "Motoren | Mash", 678),
+    (701, "Motoren | Moto Guzzi", 678),
+    (702, "Motoren | MV Agusta", 678),
+    (703, "Motoren | Oldtimers", 678),
+    (2884, "Motoren | Piaggio", 678),
+    (2940, "Motoren | Royal Enfield", 678),
+    (705, "Motoren | Schademotoren", 678),
+    (707, "Motoren | Suzuki", 678),
+    (709, "Motoren | Triumph", 678),
+    (710, "Motoren | Yamaha", 678),
+    (700, "Motoren | Zijspanmotoren", 678),
+    (704, "Motoren | Overige merken", 678),
+    (2792, "Motoren Inkoop", 678),
+    (1903, "Onderdelen | Merk-onafhankelijk", 678),
+    (2018, "Onderdelen | BMW", 678),
+    (2019, "Onderdelen | Ducati", 678),
+    (2020, "Onderdelen | Harley-Davidson", 678),
+    (2021, "Onderdelen | Honda", 678),
+    (2022, "Onderdelen | Kawasaki", 678),
+    (2023, "Onderdelen | Oldtimers", 678),
+    (2024, "Onderdelen | Suzuki", 678),
+    (2025, "Onderdelen | Yamaha", 678),
+    (717, "Onderdelen | Overige", 678),
+    (724, "Quads en Trikes", 678),
+    (723, "Overige Motoren", 678),
+    (729, "Accordeons", 728),
+    (730, "Behuizingen en Koffers", 728),
+    (1713, "Blaasinstrumenten | Blokfluiten", 728),
+    (2885, "Blaasinstrumenten | Didgeridoos", 728),
+    (743, "Blaasinstrumenten | Dwarsfluiten en Piccolo's", 728),
+    (1764, "Blaasinstrumenten | Hobo's", 728),
+    (1765, "Blaasinstrumenten | Hoorns", 728),
+    (771, "Blaasinstrumenten | Klarinetten", 728),
+    (1714, "Blaasinstrumenten | Mondharmonica's", 728),
+    (1766, "Blaasinstrumenten | Saxofoons", 728),
+    (1767, "Blaasinstrumenten | Trombones", 728),
+    (779, "Blaasinstrumenten | Trompetten", 728),
+    (1768, "Blaasinstrumenten | Tuba's", 728),
+    (763, "Blaasinstrumenten | Overige", 728),
+    (731, "Bladmuziek", 728),
+    (738, "Dj-sets en Draaitafels", 728),
+    (1769, "Draaiorgels", 728),
+    (1402, "Drumcomputers", 728),
+    (742, "Drumstellen en Slagwerk", 728),
+    (744, "Effecten", 728),
+    (1716, "Instrumenten | Onderdelen", 728),
+    (1717, "Instrumenten | Toebehoren", 728),
+    (2135, "Kabels en Stekkers", 728),
+    (751, "Keyboards", 728),
+    (754, "Licht en Laser", 728),
+    (756, "Mengpanelen", 728),
+    (757, "Microfoons", 728),
+    (758, "Midi-apparatuur", 728),
+    (761, "Orgels", 728),
+    (762, "Orkestbanden", 728),
+    (739, "Percussie", 728),
+    (765, "Piano's", 728),
+    (770, "Samplers", 728),
+    (772, "Soundmodules", 728),
+    (1770, "Snaarinstrumenten | Banjo's", 728),
+    (746, "Snaarinstrumenten | Gitaren | Akoestisch", 728),
+    (747, "Snaarinstrumenten | Gitaren | Bas", 728),
+    (748, "Snaarinstrumenten | Gitaren | Elektrisch", 728),
+    (2886, "Snaarinstrumenten | Harpen", 728),
+    (1771, "Snaarinstrumenten | Klavecimbels", 728),
+    (1772, "Snaarinstrumenten | Mandolines", 728),
+    (1370, "Snaarinstrumenten | Overige", 728),
+    (774, "Standaards", 728),
+    (1773, "Strijkinstrumenten | Cello's", 728),
+    (1774, "Strijkinstrumenten | Contrabassen", 728),
+    (1371, "Strijkinstrumenten | Violen en Altviolen", 728),
+    (1775, "Strijkinstrumenten | Overige", 728),
+    (777, "Synthesizers", 728),
+    (2631, "Theaterbelichting", 728),
+    (745, "Versterkers | Bas en Gitaar", 728),
+    (768, "Versterkers | Keyboard, Monitor en PA", 728),
+    (764, "Overige Muziek en Instrumenten", 728),
+    (948, "Aandelen en Waardepapieren", 1784),
+    (2926, "Bankbiljetten | België", 1784),
+    (1786, "Bankbiljetten | Nederland", 1784),
+    (1787, "Bankbiljetten | Europa | Eurobiljetten", 1784),
+    (1788, "Bankbiljetten | Europa | Niet-Eurobiljetten", 1784),
+    (1789, "Bankbiljetten | Afrika", 1784),
+    (1790, "Bankbiljetten | Amerika", 1784),
+    (1791, "Bankbiljetten | Azië", 1784),
+    (1792, "Bankbiljetten | Oceanië", 1784),
+    (2927, "Brieven en Enveloppen | België", 1784),
+    (2795, "Brieven en Enveloppen | Nederland", 1784),
+    (2796, "Brieven en Enveloppen | Buitenland", 1784),
+    (2793, "Edelmetalen en Baren", 1784),
+    (2928, "Munten | België", 1784),
+    (924, "Munten | Nederland", 1784),
+    (1394, "Munten | Europa | Euromunten", 1784),
+    (925, "Munten | Europa | Niet-Euromunten", 1784),
+    (1793, "Munten | Afrika", 1784),
+    (1794, "Munten | Amerika", 1784),
+    (1795, "Munten | Azië", 1784),
+    (1796, "Munten | Oceanië", 1784),
+    (1797, "Munten en Bankbiljetten | Toebehoren", 1784),
+    (1798, "Munten en Bankbiljetten | Verzamelingen", 1784),
+    (1799, "Penningen en Medailles", 1784),
+    (939, "Postzegels | Nederland", 1784),
+    (1800, "Postzegels | Nederlandse Antillen en Aruba", 1784),
+    (1801, "Postzegels | Nederlands-Indië en Nieuw-Guinea", 1784),
+    (1802, "Postzegels | Suriname", 1784),
+    (1803, "Postzegels | Europa | België", 1784),
+    (1804, "Postzegels | Europa | Duitsland", 1784),
+    (1805, "Postzegels | Europa | Frankrijk", 1784),
+    (1806, "Postzegels | Europa | Hongarije", 1784),
+    (2794, "Postzegels | Europa | Italië", 1784),
+    (1807, "Postzegels | Europa | Oostenrijk", 1784),
+    (1808, "Postzegels | Europa | Rusland", 1784),
+    (2029, "Postzegels | Europa | Scandinavië", 1784),
+    (1809, "Postzegels | Europa | Spanje", 1784),
+    (2028, "Postzegels | Europa | UK", 1784),
+    (1810, "Postzegels | Europa | Zwitserland", 1784),
+    (938, "Postzegels | Europa | Overig", 1784),
+    (1811, "Postzegels | Afrika", 1784),
+    (1812, "Postzegels | Amerika", 1784),
+    (936, "Postzegels | Azië", 1784),
+    (1813, "Postzegels | Oceanië", 1784),
+    (1814, "Postzegels | Thematische zegels", 1784),
+    (937, "Postzegels | Eerstedagenveloppen", 1784),
+    (1815, "Postzegels | Toebehoren", 1784),
+    (1816, "Postzegels | Volle albums en Verzamelingen", 1784),
+    (3042, "Activity trackers", 1826),
+    (13, "Antieke sieraden", 1826),
+    (1827, "Armbanden", 1826),
+    (1828, "Beautycases", 1826),
+    (17, "Bedels", 1826),
+    (1829, "Broches", 1826),
+    (903, "Edelstenen", 1826),
+    (2137, "Enkelbandjes en Enkelkettinkjes", 1826),
+    (4, "Horloges | Antiek", 1826),
+    (16, "Horloges | Dames", 1826),
+    (1831, "Horloges | Heren", 1826),
+    (2797, "Horloges | Kinderen", 1826),
+    (18, "Kettingen", 1826),
+    (2136, "Kettinghangers", 1826),
+    (2138, "Kindersieraden", 1826),
+    (1348, "Koffers", 1826),
+    (1833, "Manchetknopen", 1826),
+    (19, "Oorbellen", 1826),
+    (3150, "Paraplu's", 1826),
+    (21, "Piercings", 1826),
+    (1836, "Portemonnees", 1826),
+    (22, "Ringen", 1826),
+    (3041, "Smartwatches", 1826),
+    (3045, "Sporthorloges", 1826),
+    (626, "Tassen | Damestassen", 1826),
+    (1837, "Tassen | Reistassen en Weekendtassen", 1826),
+    (1838, "Tassen | Rugtassen", 1826),
+    (1839, "Tassen | Schooltassen", 1826),
+    (1840, "Tassen | Schoudertassen", 1826),
+    (3151, "Tassen | Sporttassen", 1826),
+    (2798, "Toilettassen", 1826),
+    (677, "Uiterlijk | Cosmetica en Make-up", 1826),
+    (2633, "Uiterlijk | Dieet en Afvallen", 1826),
+    (2632, "Uiterlijk | Gezichtsverzorging", 1826),
+    (1830, "Uiterlijk | Haarverzorging", 1826),
+    (1832, "Uiterlijk | Lichaamsverzorging", 1826),
+    (1834, "Uiterlijk | Mondverzorging", 1826),
+    (1835, "Uiterlijk | Parfum", 1826),
+    (627, "Zonnebrillen en Brillen | Dames", 1826),
+    (645, "Zonnebrillen en Brillen | Heren", 1826),
+    (20, "Overige Accessoires", 1826),
+    (1729, "Games | Atari", 356),
+    (2887, "Games | Nintendo 2DS en 3DS", 356),
+    (1733, "Games | Nintendo 64", 356),
+    (1659, "Games | Nintendo DS", 356),
+    (363, "Games | Nintendo Game Boy", 356),
+    (1730, "Games | Nintendo GameCube", 356),
+    (1731, "Games | Nintendo NES", 356),
+    (1732, "Games | Nintendo Super NES", 356),
+    (2942, "Games | Nintendo Switch", 356),
+    (1630, "Games | Nintendo Wii", 356),
+    (2888, "Games | Nintendo Wii U", 356),
+    (364, "Games | Overige", 356),
+    (365, "Games | Pc", 356),
+    (366, "Games | Sega", 356),
+    (367, "Games | Sony PlayStation 1", 356),
+    (1734, "Games | Sony PlayStation 2", 356),
+    (1735, "Games | Sony PlayStation 3", 356),
+    (2889, "Games | Sony PlayStation 4", 356),
+    (2952, "Games | Sony PlayStation 5", 356),
+    (1660, "Games | Sony PlayStation Portable", 356),
+    (2890, "Games | Sony PlayStation Vita", 356),
+    (1631, "Games | Xbox 360", 356),
+    (2891, "Games | Xbox One", 356),
+    (368, "Games | Xbox Original", 356),
+    (2953, "Games | Xbox Series X en S", 356),
+    (345, "Spelcomputers | Atari", 356),
+    (2892, "Spelcomputers | Nintendo 2DS en 3DS", 356),
+    (1739, "Spelcomputers | Nintendo 64", 356),
+    (2800, "Spelcomputers | Nintendo Consoles | Accessoires", 356),
+    (1655, "Spelcomputers | Nintendo DS", 356),
+    (346, "Spelcomputers | Nintendo Game Boy", 356),
+    (1736, "Spelcomputers | Nintendo GameCube", 356),
+    (1737, "Spelcomputers | Nintendo NES", 356),
+    (2799, "Spelcomputers | Nintendo Portables | Accessoires", 356),
+    (1738, "Spelcomputers | Nintendo Super NES", 356),
+    (2943, "Spelcomputers | Nintendo Switch", 356),
+    (2946, "Spelcomputers | Nintendo Switch Lite", 356),
+    (1628, "Spelcomputers | Nintendo Wii", 356),
+    (2893, "Spelcomputers | Nintendo Wii U", 356),
+    (348, "Spelcomputers | Sega", 356),
+    (347, "Spelcomputers | Sony PlayStation 1", 356),
+    (1740, "Spelcomputers | Sony PlayStation 2", 356),
+    (1741, "Spelcomputers | Sony PlayStation 3", 356),
+    (2894, "Spelcomputers | Sony PlayStation 4", 356),
+    (2954, "Spelcomputers | Sony PlayStation 5", 356),
+    (2801, "Spelcomputers | Sony PlayStation Consoles | Accessoires", 356),
+    (2802, "Spelcomputers | Sony PlayStation Portables | Accessoires", 356),
+    (2895, "Spelcomputers | Sony PlayStation Vita", 356),
+    (1656, "Spelcomputers | Sony PSP", 356),
+    (2803, "Spelcomputers | Xbox | Accessoires", 356),
+    (1629, "Spelcomputers | Xbox 360", 356),
+    (2896, "Spelcomputers | Xbox One", 356),
+    (349, "Spelcomputers | Xbox Original", 356),
+    (2955, "Spelcomputers | Xbox Series X en S", 356),
+    (1657, "Spelcomputers | Overige Accessoires", 356),
+    (1743, "Spelcomputers | Overige", 356),
+    (2945, "Virtual Reality", 356),
+    (785, "Badminton", 784),
+    (1780, "Ballet", 784),
+    (786, "Basketbal", 784),
+    (787, "Bergsport en Wandelen", 784),
+    (3158, "Bidons", 784),
+    (789, "Biljarten en Poolen", 784),
+    (3157, "Boksen", 784),
+    (790, "Bowlen", 784),
+    (3154, "Dansen", 784),
+    (791, "Darts", 784),
+    (803, "Fitnessapparatuur", 784),
+    (793, "Fitnessmaterialen", 784),
+    (1386, "Gezondheidsproducten en Wellness", 784),
+    (794, "Golf", 784),
+    (1781, "Handbal", 784),
+    (2139, "Handboogschieten", 784),
+    (795, "Hartslagmeters", 784),
+    (796, "Hockey", 784),
+    (3159, "Hoelahoeps", 784),
+    (1782, "Honkbal en Softbal", 784),
+    (2140, "IJshockey", 784),
+    (797, "Karting", 784),
+    (3156, "Klimsport", 784),
+    (1385, "Korfbal", 784),
+    (799, "Loopsport en Atletiek", 784),
+    (800, "Massageproducten", 784),
+    (3152, "Padel", 784),
+    (804, "Rugby", 784),
+    (805, "Sauna", 784),
+    (806, "Schaatsen", 784),
+    (3153, "Schietsport-accessoires", 784),
+    (1444, "Skateboarden", 784),
+    (807, "Skeelers", 784),
+    (808, "Skiën en Langlaufen", 784),
+    (809, "Snowboarden", 784),
+    (3160, "Springtouwen", 784),
+    (811, "Squash", 784),
+    (812, "Tafeltennis", 784),
+    (813, "Tennis", 784),
+    (1445, "Turnen", 784),
+    (814, "Vechtsporten en Zelfverdediging", 784),
+    (815, "Vliegeren", 784),
+    (816, "Voetbal", 784),
+    (1783, "Volleybal", 784),
+    (792, "Wielrennen", 784),
+    (3155, "Yoga en Pilates", 784),
+    (818, "Zweefvliegen en Paragliding", 784),
+    (801, "Overige Sport en Fitness", 784),
+    (821, "Antennes en Masten", 820),
+    (822, "Antwoordapparaten", 820),
+    (3047, "Autoladers", 820),
+    (1454, "Datacommunicatie en VoIP", 820),
+    (826, "Faxen", 820),
+    (827, "ISDN en ADSL", 820),
+    (1953, "Mobiele telefoons | Apple iPhone", 820),
+    (1683, "Mobiele telefoons | Batterijen en Accu's", 820),
+    (1954, "Mobiele telefoons | Blackberry", 820),
+    (829, "Mobiele telefoons | Hoesjes en Frontjes | Apple iPhone", 820),
+    (2804, "Mobiele telefoons | Hoesjes en Frontjes | Blackberry", 820),
+    (2805, "Mobiele telefoons | Hoesjes en Frontjes | HTC", 820),
+    (2806, "Mobiele telefoons | Hoesjes en Frontjes | Nokia", 820),
+    (2808, "Mobiele telefoons | Hoesjes en Frontjes | Overige merken", 820),
+    (2807, "Mobiele telefoons | Hoesjes en Frontjes | Samsung", 820),
+    (1685, "Mobiele telefoons | HTC", 820),
+    (2897, "Mobiele telefoons | Huawei", 820),
+    (1632, "Mobiele telefoons | LG", 820),
+    (834, "Mobiele telefoons | Motorola", 820),
+    (836, "Mobiele telefoons | Nokia", 820),
+    (1956, "Mobiele telefoons | Oordopjes", 820),
+    (1957, "Mobiele telefoons | Telefoon-opladers", 820),
+    (837, "Mobiele telefoons | Overige merken", 820),
+    (840, "Mobiele telefoons | Sagem", 820),
+    (841, "Mobiele telefoons | Samsung", 820),
+    (842, "Mobiele telefoons | Siemens", 820),
+    (1958, "Mobiele telefoons | Software", 820),
+    (843, "Mobiele telefoons | Sony", 820),
+    (1959, "Mobiele telefoons | Toebehoren en Onderdelen", 820),
+    (340, "Pda's", 820),
+    (1684, "Pda's | Toebehoren", 820),
+    (845, "Portofoons en Walkie-talkies", 820),
+    (3040, "Powerbanks", 820),
+    (846, "Prepaidkaarten en Simkaarten", 820),
+    (850, "Telefooncentrales", 820),
+    (3046, "Telefoonhouders", 820),
+    (851, "Vaste telefoons | Handsets en Draadloos", 820),
+    (852, "Vaste telefoons | Niet Draadloos", 820),
+    (3043, "Wearable-accessoires", 820),
+    (855, "Zenders en Ontvangers", 820),
+    (844, "Overige Telecommunicatie", 820),
+    (1271, "Autovignetten", 1984),
+    (2898, "Beurzen", 1984),
+    (1986, "Concerten | Dance", 1984),
+    (1988, "Concerten | House, Techno en Trance", 1984),
+    (1989, "Concerten | Jazz en Blues", 1984),
+    (1990, "Concerten | Klassiek", 1984),
+    (1992, "Concerten | Nederlandstalig", 1984),
+    (1249, "Concerten | Pop", 1984),
+    (1993, "Concerten | R&B en Hiphop", 1984),
+    (1994, "Concerten | Rock en Metal", 1984),
+    (1996, "Concerten | Overige", 1984),
+    (1448, "Evenementen en Festivals", 1984),
+    (1246, "Filmkaartjes", 1984),
+    (2809, "Hotelbonnen", 1984),
+    (1978, "Kortingen en Cadeaubonnen", 1984),
+    (1248, "Musea", 1984),
+    (1997, "Recreatie | Dierentuinen", 1984),
+    (1247, "Recreatie | Pretparken en Attractieparken", 1984),
+    (1232, "Recreatie | Overige", 1984),
+    (2000, "Sport | Schaatsen", 1984),
+    (2001, "Sport | Tennis", 1984),
+    (1251, "Sport | Voetbal", 1984),
+    (2002, "Sport | Overige", 1984),
+    (1250, "Theater | Cabaret en Komedie", 1984),
+    (2014, "Theater | Musical", 1984),
+    (2016, "Theater | Toneel, Dans en Opera", 1984),
+    (2017, "Theater | Overige", 1984),
+    (1998, "Trein, Bus en Vliegtuig", 1984),
+    (1252, "Overige Tickets en Kaartjes", 1984),
+    (1857, "Aarde en Mest", 1847),
+    (2960, "Barbecue-accessoires", 1847),
+    (3000, "Bergingen en Tuinkasten", 1847),
+    (2957, "Bestrijdingsmiddelen", 1847),
+    (2971, "Bewateringscomputers", 1847),
+    (1849, "Bielzen en Borders", 1847),
+    (2987, "Bladblazers", 1847),
+    (1852, "Bloembakken en Plantenbakken", 1847),
+    (1850, "Bloembollen en Zaden", 1847),
+    (1442, "Bloempotten", 1847),
+    (2985, "Bosmaaiers", 1847),
+    (1443, "Brievenbussen", 1847),
+    (3010, "Bubbelbaden en Hottubs", 1847),
+    (2962, "Buitenkeukens", 1847),
+    (2972, "Buitenkranen", 1847),
+    (281, "Buitenverlichting", 1847),
+    (1853, "Deurmatten", 1847),
+    (2899, "Droogmolens en Wasrekken", 1847),
+    (2976, "Druppelsystemen", 1847),
+    (2958, "Elektrische barbecues", 1847),
+    (2977, "Fakkels", 1847),
+    (1855, "Gaas en Draad", 1847),
+    (2959, "Gasbarbecues", 1847),
+    (2975, "Gieters", 1847),
+    (2634, "Gras en Kunstgras", 1847),
+    (250, "Grasmaaiers", 1847),
+    (2984, "Grastrimmers", 1847),
+    (1860, "Grind, Keien en Split", 1847),
+    (1351, "Haardhout", 1847),
+    (2991, "Hakselaars", 1847),
+    (276, "Hand-tuingereedschap", 1847),
+    (2997, "Handzagen", 1847),
+    (3006, "Hangmatten", 1847),
+    (2989, "Heggenscharen", 1847),
+    (2988, "Hogedrukreinigers", 1847),
+    (1441, "Houtskoolbarbecues", 1847),
+    (2999, "Kassen", 1847),
+    (2992, "Kloofmachines", 1847),
+    (2998, "Kruiwagens", 1847),
+    (2900, "Kweekspullen", 1847),
+    (3005, "Ligbedden", 1847),
+    (2995, "Onkruidbranders", 1847),
+    (2901, "Overkappingen", 1847),
+    (1863, "Palen, Balken en Planken", 1847),
+    (3009, "Parasols", 1847),
+    (1858, "Partytenten", 1847),
+    (3003, "Picknicktafels", 1847),
+    (2961, "Pizzaovens", 1847),
+    (279, "Planten | Bomen", 1847),
+    (2948, "Planten | Fruitbomen", 1847),
+    (2947, "Planten | Struiken en Hagen", 1847),
+    (1851, "Planten | Tuinplanten", 1847),
+    (2956, "Plantenvoeding", 1847),
+    (1859, "Regentonnen", 1847),
+    (2983, "Robotmaaiers", 1847),
+    (3008, "Schaduwdoeken", 1847),
+    (251, "Schuttingen", 1847),
+    (2994, "Snoeischaren", 1847),
+    (2993, "Takkenscharen", 1847),
+    (280, "Tegels en Klinkers", 1847),
+    (2967, "Terrasdelen en Vlonders", 1847),
+    (2811, "Terrasverwarmers", 1847),
+    (3004, "Tuinbanken", 1847),
+    (1861, "Tuinbeelden", 1847),
+    (2966, "Tuinhaarden", 1847),
+    (2968, "Tuinhekken en Hekwerk", 1847),
+    (277, "Tuinhuizen", 1847),
+    (1864, "Tuinmeubel-accessoires", 1847),
+    (2969, "Tuinpoorten", 1847),
+    (2970, "Tuinschermen", 1847),
+    (278, "Tuinsets en Loungesets", 1847),
+    (1865, "Tuinslangen", 1847),
+    (2974, "Tuinsproeiers", 1847),
+    (2979, "Tuinstekers", 1847),
+    (3001, "Tuinstoelen", 1847),
+    (3002, "Tuintafels", 1847),
+    (2978, "Tuinvazen", 1847),
+    (275, "Tuinwanddecoratie", 1847),
+    (2996, "Veegmachines", 1847),
+    (2986, "Verticuteermachines", 1847),
+    (283, "Vijvers", 1847),
+    (3007, "Vijver-toebehoren", 1847),
+    (2981, "Vogelhuisjes en Vogelbaden", 1847),
+    (2964, "Vuurkorven", 1847),
+    (2963, "Vuurschalen", 1847),
+    (2965, "Vuurtafels", 1847),
+    (1854, "Waterpartijen en Fonteinen", 1847),
+    (2973, "Waterpompen", 1847),
+    (1856, "Werkkleding", 1847),
+    (2982, "Windwijzers en Windmolens", 1847),
+    (1848, "Zand", 1847),
+    (2810, "Zitmaaiers", 1847),
+    (288, "Zonneschermen", 1847),
+    (2980, "Zonnewijzers", 1847),
+    (1711, "Zwembad-toebehoren", 1847),
+    (819, "Zwembaden", 1847),
+    (274, "Overige Tuin en Terras", 1847),
+    (1180, "Goede doelen en Vrijwilligerswerk", 167),
+    (1183, "Profielen | Man/Vrouw zoekt werk", 167),
+    (2076, "Profielen | Scholier zoekt bijbaan", 167),
+    (1184, "Profielen | Student zoekt bijbaan of stage", 167),
+    (1158, "Stages en Leerbanen", 167),
+    (1139, "Vacatures | Administratief en Secretarieel", 167),
+    (1141, "Vacatures | Automatisering en ICT", 167),
+    (2075, "Vacatures | Automotive", 167),
+    (1142, "Vacatures | Beveiliging", 167),
+    (1143, "Vacatures | Bouwnijverheid", 167),
+    (1144, "Vacatures | Chauffeurs", 167),
+    (1644, "Vacatures | Cultuur, Recreatie en Sport", 167),
+    (1145, "Vacatures | Detailhandel en Winkelpersoneel", 167),
+    (1146, "Vacatures | Directie, Management en Staf", 167),
+    (1147, "Vacatures | Elektriciens", 167),
+    (1148, "Vacatures | Financiële dienstverlening", 167),
+    (1149, "Vacatures | Gezondheidszorg", 167),
+    (1151, "Vacatures | Grafische industrie", 167),
+    (1152, "Vacatures | Horeca en Catering", 167),
+    (1154, "Vacatures | HR en Arbeidsbemiddeling", 167),
+    (1155, "Vacatures | Industrie en Productie", 167),
+    (1150, "Vacatures | Juridisch en Fiscaal", 167),
+    (1157, "Vacatures | Klantenservice en Callcenter", 167),
+    (1140, "Vacatures | Landbouw, Natuur en Milieu", 167),
+    (1159, "Vacatures | Logistiek, Inkoop en Transport", 167),
+    (1645, "Vacatures | Maatschappelijke dienstverlening", 167),
+    (1161, "Vacatures | Makelaardij en Vastgoed", 167),
+    (1162, "Vacatures | Marketing, Communicatie en Media", 167),
+    (1163, "Vacatures | Modellen", 167),
+    (1438, "Vacatures | Netwerk Marketing", 167),
+    (1164, "Vacatures | Onderwijs, Wetenschap en Onderzoek", 167),
+    (1165, "Vacatures | Overheid", 167),
+    (1166, "Vacatures | Promotiewerk en Flyering", 167),
+    (1179, "Vacatures | Scheepvaart en Visserij", 167),
+    (1167, "Vacatures | Schoonmaak en Facilitaire diensten", 167),
+    (1171, "Vacatures | Techniek", 167),
+    (1172, "Vacatures | Tekstschrijvers en Editors", 167),
+    (1173, "Vacatures | Thuiswerk", 167),
+    (1174, "Vacatures | Toerisme, Reizen en Evenementen", 167),
+    (1175, "Vacatures | Uiterlijke verzorging", 167),
+    (1176, "Vacatures | Vakantiewerk", 167),
+    (1177, "Vacatures | Verkoop en Commercie", 167),
+    (1646, "Vacatures | Zakelijke dienstverlening", 167),
+    (1181, "Vacatures | Overige Vacatures", 167),
+    (1707, "Bed & Breakfasts en Pensions", 856),
+    (859, "Campings", 856),
+    (2062, "Vakantie | Aanbiedingen en Last minute", 856),
+    (2601, "Vakantie | Autovakanties", 856),
+    (2063, "Vakantie | Creatief", 856),
+    (2064, "Vakantie | Fly-drive", 856),
+    (2065, "Vakantie | Groepen en Rondreizen", 856),
+    (2066, "Vakantie | Jongeren en Studenten", 856),
+    (2067, "Vakantie | Kinderen en Jeugd", 856),
+    (2068, "Vakantie | Kunst en Cultuur", 856),
+    (2069, "Vakantie | Senioren", 856),
+    (2070, "Vakantie | Singles en Alleenstaanden", 856),
+    (2071, "Vakantie | Sportief en Actief", 856),
+    (2072, "Vakantie | Stedentrips", 856),
+    (2073, "Vakantie | Wintersport", 856),
+    (2074, "Vakantie | Zon en Strand", 856),
+    (862, "Vakantiehuizen | België", 856),
+    (1278, "Vakantiehuizen | Denemarken", 856),
+    (863, "Vakantiehuizen | Duitsland", 856),
+    (1291, "Vakantiehuizen | Frankrijk", 856),
+    (865, "Vakantiehuizen | Griekenland", 856),
+    (866, "Vakantiehuizen | Groot-Brittannië", 856),
+    (867, "Vakantiehuizen | Hongarije", 856),
+    (1302, "Vakantiehuizen | Ierland", 856),
+    (1310, "Vakantiehuizen | Italië", 856),
+    (1311, "Vakantiehuizen | Kroatië", 856),
+    (2930, "Vakantiehuizen | Luxemburg", 856),
+    (892, "Vakantiehuizen | Nederland", 856),
+    (1709, "Vakantiehuizen | Nederlandse Antillen", 856),
+    (1313, "Vakantiehuizen | Noorwegen", 856),
+    (869, "Vakantiehuizen | Oostenrijk", 856),
+    (870, "Vakantiehuizen | Polen", 856),
+    (871, "Vakantiehuizen | Portugal", 856),
+    (1316, "Vakantiehuizen | Slowakije", 856),
+    (872, "Vakantiehuizen | Spanje", 856),
+    (1324, "Vakantiehuizen | Tsjechië", 856),
+    (873, "Vakantiehuizen | Turkije", 856),
+    (1327, "Vakantiehuizen | Zweden", 856),
+    (874, "Vakantiehuizen | Zwitserland", 856),
+    (2094, "Vakantiehuizen | Amerika", 856),
+    (889, "Vakantiehuizen | Overige landen", 856),
+    (2931, "Ansichtkaarten | België", 895),
+    (897, "Ansichtkaarten | Nederland", 895),
+    (1817, "Ansichtkaarten | Buitenland", 895),
+    (2635, "Ansichtkaarten | Dieren", 895),
+    (1818, "Ansichtkaarten | Themakaarten", 895),
+    (909, "Automerken, Motoren en Formule 1", 895),
+    (1624, "Automaten | Flipperkasten", 895),
+    (1625, "Automaten | Gokkasten en Fruitautomaten", 895),
+    (1626, "Automaten | Jukeboxen", 895),
+    (1268, "Automaten | Overige", 895),
+    (898, "Beelden en Beeldjes", 895),
+    (900, "Beren en Cherished Teddies", 895),
+    (2813, "Bidprentjes en Rouwkaarten", 895),
+    (1269, "Biermerken", 895),
+    (899, "Blikken", 895),
+    (1820, "Boekenleggers", 895),
+    (1393, "Complete verzamelingen en Collecties", 895),
+    (901, "Diddl", 895),
+    (902, "Dierenverzamelingen", 895),
+    (1270, "Disney", 895),
+    (2814, "Efteling", 895),
+    (904, "Elektronische Apparatuur", 895),
+    (1392, "Film en Tv", 895),
+    (908, "Flippo's", 895),
+    (906, "Fotografica en Filmapparatuur", 895),
+    (910, "Foto's en Prenten", 895),
+    (911, "Geboortekaartjes en Visitekaartjes", 895),
+    (912, "Glas en Borrelglaasjes", 895),
+    (913, "Harry Potter", 895),
+    (914, "Kleding en Patronen", 895),
+    (915, "KLM Huisjes", 895),
+    (916, "Koninklijk Huis en Royalty", 895),
+    (917, "Lord of the Rings", 895),
+    (918, "Luchtvaart en Vliegtuigspotten", 895),
+    (935, "Merken en Reclamevoorwerpen", 895),
+    (920, "Militaria | Algemeen", 895),
+    (2815, "Militaria | Tweede Wereldoorlog", 895),
+    (1387, "Mineralen en Fossielen", 895),
+    (926, "Muziek, Artiesten en Beroemdheden", 895),
+    (928, "Parfumverzamelingen", 895),
+    (929, "Pennenverzamelingen", 895),
+    (2902, "Poesieplaatjes", 895),
+    (931, "Poppen", 895),
+    (1627, "Poppenhuizen en Toebehoren", 895),
+    (933, "Poppetjes en Figuurtjes", 895),
+    (934, "Porselein, Kristal en Bestek", 895),
+    (1446, "Posters", 895),
+    (1821, "Religie", 895),
+    (1390, "Retro", 895),
+    (896, "Rookartikelen, Aanstekers en Luciferdoosjes", 895),
+    (1686, "Scheepvaart", 895),
+    (1822, "Scouting", 895),
+    (941, "Sleutelhangers", 895),
+    (2816, "Smurfen", 895),
+    (2817, "Spaarpotten", 895),
+    (942, "Speelgoed", 895),
+    (2818, "Speelkaarten, Jokers en Kwartetten", 895),
+    (943, "Speldjes, Pins en Buttons", 895),
+    (944, "Spoorwegen en Tramwegen", 895),
+    (945, "Sportartikelen en Voetbal", 895),
+    (2819, "Star Wars", 895),
+    (1823, "Stickers", 895),
+    (1447, "Stripfiguren", 895),
+    (1824, "Suikerzakjes", 895),
+    (2820, "Supermarktacties", 895),
+    (1388, "Swarovski", 895),
+    (946, "Telefoonkaarten", 895),
+    (947, "Tijdschriften, Kranten en Knipsels", 895),
+    (2821, "Transformers", 895),
+    (2141, "Verrassingseieren", 895),
+    (1825, "Vingerhoedjes", 895),
+    (907, "Wijnen", 895),
+    (2903, "Winkelwagenmuntjes", 895),
+    (927, "Overige Verzamelen", 895),
+    (977, "Accessoires en Onderhoud", 976),
+    (1960, "Beroepsscheepvaart", 976),
+    (978, "Bootonderdelen", 976),
+    (979, "Boottrailers", 976),
+    (980, "Buiten- en Binnenboordmotoren", 976),
+    (981, "Catamarans", 976),
+    (982, "Duiken", 976),
+    (1961, "Golfsurfen", 976),
+    (2826, "Hengelsport | Algemeen", 976),
+    (983, "Hengelsport | Karpervissen", 976),
+    (2823, "Hengelsport | Roofvissen", 976),
+    (2825, "Hengelsport | Vliegvissen", 976),
+    (2822, "Hengelsport | Witvissen", 976),
+    (2824, "Hengelsport | Zeevissen", 976),
+    (984, "Jetski's en Waterscooters", 976),
+    (3164, "Kajaks", 976),
+    (985, "Kajuitzeilboten en Zeiljachten", 976),
+    (986, "Kano's", 976),
+    (1404, "Kitesurfen", 976),
+    (987, "Ligplaatsen", 976),
+    (989, "Motorboten en Motorjachten", 976),
+    (988, "Navigatiemiddelen en Scheepselektronica", 976),
+    (990, "Open zeilboten", 976),
+    (3165, "Peddels", 976),
+    (2827, "Platbodems", 976),
+    (992, "Roeiboten", 976),
+    (993, "Rubberboten", 976),
+    (1407, "Sloepen", 976),
+    (3162, "Snorkelen", 976),
+    (994, "Speedboten", 976),
+    (3163, "Suppen", 976),
+    (1408, "Vis- en Consoleboten", 976),
+    (2636, "Wakeboarden", 976),
+    (3161, "Waterpolo", 976),
+    (1455, "Waterski's", 976),
+    (997, "Watersportkleding", 976),
+    (995, "Windsurfen", 976),
+    (3195, "Wingsurfen", 976),
+    (998, "Zeilen en Zeiltoebehoren", 976),
+    (991, "Overige Watersport en Boten", 976),
+    (538, "Afzuigkappen", 537),
+    (561, "Airco's", 537),
+    (3177, "Airfryers", 537),
+    (3181, "Blenders", 537),
+    (1979, "Broodbakmachines", 537),
+    (1980, "Broodroosters", 537),
+    (3185, "Bruiswatermachines", 537),
+    (3184, "Contactgrills", 537),
+    (3179, "Eierkokers", 537),
+    (3171, "Fonduesets", 537),
+    (542, "Fornuizen", 537),
+    (541, "Frituurpannen", 537),
+    (1981, "Gourmetstellen", 537),
+    (3173, "Grillplaten", 537),
+    (3175, "IJsmachines", 537),
+    (3183, "Juicers", 537),
+    (543, "Keukenmixers", 537),
+    (544, "Koelkasten en IJskasten", 537),
+    (3182, "Koffiemachine-accessoires", 537),
+    (545, "Koffiezetapparaten", 537),
+    (546, "Kookplaten", 537),
+    (3166, "Luchtbehandelingsapparatuur", 537),
+    (548, "Magnetrons", 537),
+    (3180, "Melkopschuimers", 537),
+    (1982, "Onderdelen en Toebehoren", 537),
+    (552, "Ovens", 537),
+    (554, "Persoonlijke-verzorgingsapparatuur", 537),
+    (3178, "Rijstkokers", 537),
+    (3174, "Slowcookers", 537),
+    (556, "Stofzuigers", 537),
+    (3168, "Stoomapparaten", 537),
+    (557, "Strijkijzers en Strijkplanken", 537),
+    (1457, "Thuistaps", 537),
+    (560, "Vaatwasmachines", 537),
+    (3167, "Ventilatoren", 537),
+    (540, "Vriezers en Diepvrieskisten", 537),
+    (3172, "Wafelijzers", 537),
+    (3170, "Was-droogcombinaties", 537),
+    (562, "Wasdrogers", 537),
+    (563, "Wasmachines", 537),
+    (3176, "Waterkoelers", 537),
+    (1983, "Waterkokers", 537),
+    (3169, "Waterontharders", 537),
+    (1458, "Wekkers", 537),
+    (1359, "Zonnebanken en Gezichtsbruiners", 537),
+    (553, "Overige Witgoed en Apparatuur", 537),
+    (1086, "Agrarisch | Aardappelen, Groenten, Fruit en Vlees", 1085),
+    (2097, "Agrarisch | Agrarisch Onroerend goed", 1085),
+    (2605, "Agrarisch | Veevoer", 1085),
+    (1691, "Agrarisch | Onderdelen | Banden, Velgen en Assen", 1085),
+    (1092, "Agrarisch | Tractoren", 1085),
+    (1692, "Agrarisch | Werktuigen", 1085),
+    (1087, "Bedrijfs Onroerend goed", 1085),
+    (1094, "Exploitaties en Overnames", 1085),
+    (2103, "Horeca | Food", 1085),
+    (1090, "Horeca | Keukenapparatuur", 1085),
+    (1689, "Horeca | Meubilair en Inrichting", 1085),
+    (1688, "Horeca | Overige", 1085),
+    (2604, "Kantoor en Winkelinrichting | Beveiliging", 1085),
+    (1389, "Kantoor en Winkelinrichting | Apparatuur en Telecommunicatie", 1085),
+    (372, "Kantoor en Winkelinrichting | Computer en IT", 1085),
+    (441, "Kantoor en Winkelinrichting | Kantoorartikelen", 1085),
+    (1690, "Kantoor en Winkelinrichting | Kantoormeubilair en Inrichting", 1085),
+    (2603, "Kantoor en Winkelinrichting | Kassa's en Betaalsystemen", 1085),
+    (1700, "Kantoor en Winkelinrichting | Magazijn, Stelling en Opslag", 1085),
+    (1964, "Kantoor en Winkelinrichting | Onderdelen", 1085),
+    (1091, "Kantoor en Winkelinrichting | Winkel en Inventaris", 1085),
+    (2113, "Machines en Bouw | Aggregaten", 1085),
+    (1965, "Machines en Bouw | Heftrucks en Intern transport", 1085),
+    (2117, "Machines en Bouw | Houtbewerking", 1085),
+    (1694, "Machines en Bouw | Industrie en Techniek", 1085),
+    (286, "Machines en Bouw | Keten en Containers", 1085),
+    (255, "Machines en Bouw | Kranen en Graafmachines", 1085),
+    (2115, "Machines en Bouw | Lastechniek", 1085),
+    (2105, "Machines en Bouw | Liften, Steigers en Ladders", 1085),
+    (2116, "Machines en Bouw | Metaalbewerking", 1085),
+    (1695, "Machines en Bouw | Onderdelen", 1085),
+    (1696, "Machines en Bouw | Onderhoud en Reiniging", 1085),
+    (2114, "Machines en Bouw | Pompen en Compressoren", 1085),
+    (1698, "Machines en Bouw | Transport", 1085),
+    (1966, "Machines en Bouw | Tuin, Park en Bosbouw", 1085),
+    (1697, "Machines en Bouw | Overig", 1085),
+    (1089, "Partijgoederen en Retail | Franchising, Wederverkoop en Distributie", 1085),
+    (1419, "Partijgoederen en Retail | Partijgoederen", 1085),
+    (1096, "Partijgoederen en Retail | Verkoopwagens", 1085),
+    (1702, "Partijgoederen en Retail | Verpakking en Verzending", 1085),
+    (1093, "Overige Zakelijke goederen", 1085),
+    (1967, "Agenda's", 428),
+    (1347, "Braces", 428),
+    (431, "Brommobielen en Scootmobielen", 428),
+    (3193, "Bureau-accessoires", 428),
+    (3186, "Cadeaupapier", 428),
+    (3187, "Cadeauverpakkingen", 428),
+    (3192, "Kalenders", 428),
+    (436, "Kerst", 428),
+    (1968, "Levensmiddelen", 428),
+    (3202, "Loopkrukken", 428),
+    (3208, "Looprekken", 428),
+    (3189, "Notitieboeken", 428),
+    (3190, "Papierwaren", 428),
+    (1703, "Pasen", 428),
+    (3188, "Rekenmachines", 428),
+    (3209, "Rollators", 428),
+    (2904, "Rolstoelen", 428),
+    (1345, "Rommelmarktspullen", 428),
+    (1456, "Schoolbenodigdheden", 428),
+    (3044, "Schoolborden", 428),
+    (1705, "Schrijfwaren", 428),
+    (443, "Sinterklaas", 428),
+    (2828, "Trapliften", 428),
+    (1355, "Typemachines", 428),
+    (1346, "Verpleegmiddelen", 428),
+    (1704, "Vlaggen en Wimpels", 428),
+    (3207, "Wandelstokken", 428),
+    (3191, "Wenskaarten", 428),
+    (440, "Overige Diversen", 428),
+)
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING
+
+from marktplaats.query import Condition, SearchQuery
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from marktplaats.models import Listing
+    from marktplaats.query import SearchSpec
+    from marktplaats.transport import Transport
+
+
+# The biggest page Marktplaats returns
+MAX_LIMIT = 100
+
+# How the conditions that can be filtered on show up in a listing's attributes.
+#  Specs with other conditions are only merged with specs with the same one.
+CONDITION_LABELS: dict[Condition, str] = {
+    Condition.NEW: "Nieuw",
+    Condition.AS_GOOD_AS_NEW: "Zo goed als nieuw",
+    Condition.USED: "Gebruikt",
+}
+
+
+@dataclass(frozen=True)
+class SpecGroup:
+    """Specs that can be answered by filtering the results of one wider spec."""
+
+    merged: SearchSpec
+    members: tuple[SearchSpec, ...]
+
+
+def _group_key(spec: SearchSpec) -> SearchSpec:
+    # Everything that can't be filtered on afterwards has to be the same
+    return replace(
+        spec,
+        price_from=None,
+        price_to=None,
+        distance_km=None,
+        condition=spec.condition if spec.condition not in CONDITION_LABELS else None,
+        limit=MAX_LIMIT,
+    )
+
+
+def _widest(
+    values: list[int | None],
+    pick: Callable[[Iterable[int]], int],
+) -> int | None:
+    # No bound at all is the widest there is
+    if None in values:
+        return None
+    return pick(value for value in values if value is not None)
+
+
+def _merge(members: list[SearchSpec]) -> SearchSpec:
+    conditions = {spec.condition for spec in members}
+    return replace(
+        _group_key(members[0]),
+        price_from=_widest([spec.price_from for spec in members], min),
+        price_to=_widest([spec.price_to for spec in members], max),
+        distance_km=_widest([spec.distance_km for spec in members], max),
+        condition=conditions.pop() if len(conditions) == 1 else None,
+    )
+
+
+def group_specs(specs: Iterable[SearchSpec]) -> list[SpecGroup]:
+    """
+    Group the specs that only differ in price, distance_km or condition.
+
+    Specs with an offset are never merged, as filtering changes what the
+    offset would skip.
+
+    Returns:
+        The groups. Specs that can't be merged with any other get a group of
+        their own, with the spec itself as the merged spec.
+
+    """
+    groups: dict[SearchSpec, list[SearchSpec]] = {}
+    for spec in dict.fromkeys(specs):
+        key = _group_key(spec) if spec.offset == 0 else spec
+        groups.setdefault(key, []).append(spec)
+    return [
+        SpecGroup(_merge(members) if len(members) > 1 else members[0], tuple(members))
+        for members in groups.values()
+    ]
+
+
+def spec_matches(spec: SearchSpec, listing: Listing) -> bool:
+    """
+    Check a listing against the price, distance and condition of a spec.
+
+    Returns:
+        Whether the listing would have been in the results of the spec.
+
+    """
+    if spec.price_from is not None and listing.price < spec.price_from:
+        return False
+    if spec.price_to is not None and listing.price > spec.price_to:
+        return False
+    # In meters, like Marktplaats filters: distance_km is rounded down
+    if spec.distance_km is not None and (
+        listing.location.distance_meters is None
+        or listing.location.distance_meters > spec.distance_km * 1000
+    ):
+        return False
+    if spec.condition in CONDITION_LABELS:
+        label = CONDITION_LABELS[spec.condition]
+        return any(
+            attribute["key"] == "condition" and attribute["value"] == label
+            for attribute in listing.attributes
+        )
+    return True
+
+
+def _filter_pages(
+    query: SearchQuery,
+    results: dict[SearchSpec, list[Listing]],
+    max_pages: int | None,
+) -> bool:
+    # Returns whether all results of the query were seen
+    seen: set[str] = set()
+    for number, page in enumerate(query.iter_pages(), start=1):
+        for listing in page.get_listings():
+            if listing.id in seen:  # Marktplaats pads pages with duplicates
+                continue
+            seen.add(listing.id)
+            for spec, found in results.items():
+                if len(found) < spec.limit and spec_matches(spec, listing):
+                    found.append(listing)
+        if len(seen) >= (query.total_result_count or 0):
+            break
+        missing = sum(len(found) < spec.limit for spec, found in results.items())
+        # Another page only pays off when it can complete more than one spec,
+        #  and it mustn't take more requests than separate searches would
+        #  if it completes none of them
+        if (
+            missing <= 1
+            or number + 1 + missing > len(results)
+            or (max_pages is not None and number >= max_pages)
+        ):
+            return False
+    # Unless Marktplaats stopped paging early
+    return not query.is_capped
+
+
+def _run_group(
+    group: SpecGroup,
+    transport: Transport | None,
+    max_pages: int | None,
+) -> dict[SearchSpec, list[Listing]]:
+    if len(group.members) == 1:
+        (spec,) = group.members
+        return {spec: SearchQuery.from_spec(spec, transport=transport).get_listings()}
+
+    results: dict[SearchSpec, list[Listing]] = {spec: [] for spec in group.members}
+    query = SearchQuery.from_spec(group.merged, transport=transport)
+    complete = _filter_pages(query, results, max_pages)
+
+    if not complete:
+        for spec, found in results.items():
+            if len(found) < spec.limit:
+                query = SearchQuery.from_spec(spec, transport=transport)
+                results[spec] = query.get_listings()
+    return results
+
+
+def search_coalesced(
+    specs: Iterable[SearchSpec],
+    *,
+    transport: Transport | None = None,
+    max_workers: int = 8,
+    max_pages: int | None = None,
+) -> dict[SearchSpec, list[Listing]]:
+    """
+    Run many searches, sending one request for specs that can be merged.
+
+    Specs that only differ in price, distance_km or condition are merged into
+    the widest spec, whose results are filtered for every spec. Pages of the
+    merged spec are fetched until every spec has its limit of listings, or
+    until another page can't save a request anymore, and at most max_pages.
+    Specs that still don't have enough listings then, for instance because
+    Marktplaats doesn't page that far, are sent separately after all.
+
+    Merged pages and separate requests together take no more requests than
+    sending every spec separately would, unless the first merged page already
+    completes none of them: then that page is the one extra request.
+
+    Returns:
+        The listings of every spec, at most its limit.
+
+    """
+    groups = group_specs(specs)
+    results: dict[SearchSpec, list[Listing]] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for group_results in executor.map(
+            lambda group: _run_group(group, transport, max_pages),
+            groups,
+        ):
+            results.update(group_results)
+    return results
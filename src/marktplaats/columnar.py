@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import importlib
+from array import array
+from datetime import date
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from marktplaats.models.price_type import PriceType
+from marktplaats.parsing import parse_listing_date, parse_price_type
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from os import PathLike
+    from types import ModuleType
+
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
+
+    from marktplaats.api_types.search import Listing as ListingResponse
+
+
+# The names of the price types, in the order of their codes in the columns
+PRICE_TYPES: tuple[str, ...] = tuple(PriceType.__members__)
+_PRICE_TYPE_CODES = {
+    price_type.value: code for code, price_type in enumerate(PriceType)
+}
+
+DEFAULT_BATCH_SIZE = 100_000
+
+
+def _require(module: str, extra: str) -> ModuleType:
+    # Imported when they're needed, as most users need only one of them
+    try:
+        return importlib.import_module(module)
+    except ImportError as err:
+        msg = (
+            f"This requires {module}. "
+            f"Install it with `pip install marktplaats[{extra}]`."
+        )
+        raise ImportError(msg) from err
+
+
+def arrow_schema() -> pa.Schema:
+    """
+    Get the Arrow schema of the listing columns.
+
+    Returns:
+        The schema of the record batches built by ListingColumns.
+
+    """
+    pyarrow = _require("pyarrow", "arrow")
+    return pyarrow.schema(
+        [
+            pyarrow.field("id", pyarrow.string(), nullable=False),
+            pyarrow.field("title", pyarrow.string(), nullable=False),
+            pyarrow.field("price_cents", pyarrow.int64(), nullable=False),
+            pyarrow.field(
+                "price_type",
+                pyarrow.dictionary(pyarrow.int8(), pyarrow.string()),
+                nullable=False,
+            ),
+            pyarrow.field("date", pyarrow.date32()),
+            pyarrow.field("seller_id", pyarrow.int64(), nullable=False),
+            pyarrow.field("latitude", pyarrow.float64()),
+            pyarrow.field("longitude", pyarrow.float64()),
+            pyarrow.field("distance_km", pyarrow.int64()),
+            pyarrow.field("category_id", pyarrow.int64(), nullable=False),
+        ],
+    )
+
+
+class ListingColumns:
+    """
+    Builds columns of listings straight from search responses.
+
+    Listings are added as the raw dicts from body_json["listings"] or
+    ListingStream.raw_listings(), without creating a Listing for any of them.
+    Dates, price types and locations are parsed like parse_listing() does.
+    Price types are stored as codes into PRICE_TYPES, the names of PriceType.
+
+    The columns are handed over as an Arrow record batch, or a polars or pandas
+    DataFrame, after which the builder is empty again, so it can build the
+    next batch. The integer columns are handed over to Arrow without copying.
+    """
+
+    def __init__(self) -> None:
+        self._clear()
+
+    def _clear(self) -> None:
+        self.ids: list[str] = []
+        self.titles: list[str] = []
+        self.price_cents = array("q")
+        self.price_types = array("b")
+        self.dates: list[date | None] = []
+        self.seller_ids = array("q")
+        self.latitudes: list[float | None] = []
+        self.longitudes: list[float | None] = []
+        self.distances_km: list[int | None] = []
+        self.category_ids = array("q")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, listings: Iterable[ListingResponse]) -> None:
+        """
+        Add listings from search responses.
+
+        Keep in mind that Marktplaats pads small pages with extra listings, so
+        only pass the first `limit` listings of a response to leave those out.
+        """
+        today = date.today()
+        for listing in listings:
+            price_info = listing["priceInfo"]
+            code = _PRICE_TYPE_CODES.get(price_info["priceType"])
+            if code is None:
+                # Reported like parse_listing() does
+                code = _PRICE_TYPE_CODES[parse_price_type(listing).value]
+            location = listing["location"]
+            distance_meters = location.get("distanceMeters")
+
+            self.ids.append(listing["itemId"])
+            self.titles.append(listing["title"])
+            self.price_cents.append(price_info["priceCents"])
+            self.price_types.append(code)
+            self.dates.append(parse_listing_date(listing, today))
+            self.seller_ids.append(listing["sellerInformation"]["sellerId"])
+            self.latitudes.append(location["latitude"] or None)
+            self.longitudes.append(location["longitude"] or None)
+            self.distances_km.append(
+                distance_meters // 1000
+                if distance_meters != -1000  # ruff:ignore[magic-value-comparison] Like ListingLocation
+                else None,
+            )
+            self.category_ids.append(listing["categoryId"])
+
+    def to_arrow(self) -> pa.RecordBatch:
+        """
+        Hand over the columns as an Arrow record batch, and empty the builder.
+
+        Returns:
+            A record batch with arrow_schema() as its schema.
+
+        """
+        pyarrow = _require("pyarrow", "arrow")
+
+        def int64(values: array[int]) -> pa.Array:
+            # Shares the memory of the array, which the builder lets go of
+            return pyarrow.Array.from_buffers(
+                pyarrow.int64(),
+                len(values),
+                [None, pyarrow.py_buffer(values)],
+            )
+
+        batch = pyarrow.RecordBatch.from_arrays(
+            [
+                pyarrow.array(self.ids, pyarrow.string()),
+                pyarrow.array(self.titles, pyarrow.string()),
+                int64(self.price_cents),
+                pyarrow.DictionaryArray.from_arrays(
+                    pyarrow.Array.from_buffers(
+                        pyarrow.int8(),
+                        len(self.price_types),
+                        [None, pyarrow.py_buffer(self.price_types)],
+                    ),
+                    pyarrow.array(PRICE_TYPES, pyarrow.string()),
+                ),
+                pyarrow.array(self.dates, pyarrow.date32()),
+                int64(self.seller_ids),
+                pyarrow.array(self.latitudes, pyarrow.float64()),
+                pyarrow.array(self.longitudes, pyarrow.float64()),
+                pyarrow.array(self.distances_km, pyarrow.int64()),
+                int64(self.category_ids),
+            ],
+            schema=arrow_schema(),
+        )
+        # New arrays, as the shared ones can't grow anymore
+        self._clear()
+        return batch
+
+    def to_polars(self) -> pl.DataFrame:
+        """
+        Hand over the columns as a polars DataFrame, and empty the builder.
+
+        This doesn't need pyarrow. The price types are an Enum column.
+
+        Returns:
+            A DataFrame with the listing columns.
+
+        """
+        polars = _require("polars", "polars")
+        frame: pl.DataFrame = polars.DataFrame(
+            {
+                "id": self.ids,
+                "title": self.titles,
+                "price_cents": self.price_cents,
+                "price_type": [PRICE_TYPES[code] for code in self.price_types],
+                "date": self.dates,
+                "seller_id": self.seller_ids,
+                "latitude": self.latitudes,
+                "longitude": self.longitudes,
+                "distance_km": self.distances_km,
+                "category_id": self.category_ids,
+            },
+            schema={
+                "id": polars.String,
+                "title": polars.String,
+                "price_cents": polars.Int64,
+                "price_type": polars.Enum(PRICE_TYPES),
+                "date": polars.Date,
+                "seller_id": polars.Int64,
+                "latitude": polars.Float64,
+                "longitude": polars.Float64,
+                "distance_km": polars.Int64,
+                "category_id": polars.Int64,
+            },
+        )
+        self._clear()
+        return frame
+
+    def to_pandas(self) -> pd.DataFrame:
+        """
+        Hand over the columns as a pandas DataFrame, and empty the builder.
+
+        The columns are backed by Arrow (pandas.ArrowDtype), so they aren't
+        copied into NumPy arrays. This needs pyarrow as well.
+
+        Returns:
+            A DataFrame with the listing columns.
+
+        """
+        pandas = _require("pandas", "pandas")
+        frame: pd.DataFrame = self.to_arrow().to_pandas(types_mapper=pandas.ArrowDtype)
+        return frame
+
+
+def record_batches(
+    listings: Iterable[ListingResponse],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[pa.RecordBatch]:
+    """
+    Build Arrow record batches from any number of listings.
+
+    Only one batch is built at a time, so the listings can come from a
+    generator over many pages without all of them being in memory.
+
+    Yields:
+        Record batches of at most batch_size listings.
+
+    """
+    columns = ListingColumns()
+    iterator = iter(listings)
+    while True:
+        columns.add(islice(iterator, batch_size))
+        if not columns:
+            return
+        yield columns.to_arrow()
+
+
+def write_parquet(
+    listings: Iterable[ListingResponse],
+    path: str | PathLike[str],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Write any number of listings to a Parquet file, a batch at a time.
+
+    Returns:
+        The number of listings written.
+
+    """
+    pq = _require("pyarrow.parquet", "arrow")
+    count = 0
+    with pq.ParquetWriter(path, arrow_schema()) as writer:
+        for batch in record_batches(listings, batch_size=batch_size):
+            writer.write_batch(batch)
+            count += batch.num_rows
+    return count
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _orjson() -> Callable[[bytes], object]:
+    import orjson  # ruff:ignore[import-outside-top-level] Only the used backend is imported
+
+    return orjson.loads
+
+
+def _msgspec() -> Callable[[bytes], object]:
+    import msgspec  # ruff:ignore[import-outside-top-level] Only the used backend is imported
+
+    decoder = msgspec.json.Decoder()
+
+    def loads(content: bytes) -> object:
+        try:
+            return decoder.decode(content)
+        except msgspec.DecodeError as err:
+            # Every backend raises a ValueError, like json and orjson do
+            raise ValueError(str(err)) from err
+
+    return loads
+
+
+def _json() -> Callable[[bytes], object]:
+    return json.loads
+
+
+# Ordered from fastest to slowest, the first installed one is used by default.
+# A backend is only imported once it's used to decode something.
+_BACKENDS: dict[str, Callable[[], Callable[[bytes], object]]] = {
+    "orjson": _orjson,
+    "msgspec": _msgspec,
+    "json": _json,
+}
+
+# None until chosen with set_json_backend() or picked on first use
+_backend: str | None = None
+_loads: Callable[[bytes], object] | None = None
+
+
+def available_json_backends() -> list[str]:
+    """
+    List the installed JSON backends, fastest first.
+
+    Returns:
+        The names of the backends that can be passed to set_json_backend().
+
+    """
+    return [
+        name
+        for name in _BACKENDS
+        if name == "json" or importlib.util.find_spec(name) is not None
+    ]
+
+
+def get_json_backend() -> str:
+    """
+    Get the name of the JSON backend used to decode responses.
+
+    Returns:
+        "orjson", "msgspec" or "json".
+
+    """
+    if _backend is None:
+        return available_json_backends()[0]
+    return _backend
+
+
+def set_json_backend(name: str | None) -> None:
+    """
+    Choose the JSON backend used to decode responses.
+
+    Pass None to go back to the fastest installed backend.
+
+    Raises:
+        ValueError: If the backend isn't installed.
+
+    """
+    global _backend, _loads  # ruff:ignore[global-statement] Process-wide setting
+    if name is not None and name not in available_json_backends():
+        msg = (
+            f"JSON backend {name!r} is not available. "
+            f"Installed backends: {', '.join(available_json_backends())}"
+        )
+        raise ValueError(msg)
+    _backend = name
+    _loads = None
+
+
+def _load_backend() -> Callable[[bytes], object]:
+    global _loads  # ruff:ignore[global-statement] Process-wide setting
+    _loads = _BACKENDS[get_json_backend()]()
+    return _loads
+
+
+def decode_json(content: bytes) -> Any:  # type: ignore[explicit-any]  # ruff:ignore[any-type] Like json.loads, so it can be assigned to the response TypedDicts
+    """
+    Decode a JSON response body straight from its bytes.
+
+    Raises a ValueError if the content isn't valid JSON, whatever the backend.
+
+    Returns:
+        The decoded JSON.
+
+    """
+    loads = _loads
+    if loads is None:
+        loads = _load_backend()
+    return loads(content)
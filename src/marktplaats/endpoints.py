@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from enum import Enum
+
+
+SEARCH_URL = "https://www.marktplaats.nl/lrp/api/search"
+SELLER_PROFILE_URL = "https://www.marktplaats.nl/v/api/seller-profile/{seller_id}"
+SELLER_LISTINGS_URL = "https://www.marktplaats.nl/v/api/seller-other-items"
+LISTING_PAGE_URL = "https://link.marktplaats.nl/{listing_id}"
+
+
+class Endpoint(Enum):
+    """The different Marktplaats endpoints this library sends requests to."""
+
+    SEARCH = "search"
+    SELLER_PROFILE = "seller-profile"
+    SELLER_LISTINGS = "seller-listings"
+    LISTING_PAGE = "listing-page"
+    OTHER = "other"
+
+
+_SELLER_PROFILE_PREFIX = SELLER_PROFILE_URL.removesuffix("{seller_id}")
+_LISTING_PAGE_PREFIX = LISTING_PAGE_URL.removesuffix("{listing_id}")
+
+
+def endpoint_for_url(url: str) -> Endpoint:
+    # Query strings are passed separately, but strip them just in case
+    url = url.partition("?")[0]
+    if url == SEARCH_URL:
+        return Endpoint.SEARCH
+    if url == SELLER_LISTINGS_URL:
+        return Endpoint.SELLER_LISTINGS
+    if url.startswith(_SELLER_PROFILE_PREFIX):
+        return Endpoint.SELLER_PROFILE
+    if url.startswith(_LISTING_PAGE_PREFIX):
+        return Endpoint.LISTING_PAGE
+    return Endpoint.OTHER
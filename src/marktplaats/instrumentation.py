@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from marktplaats.decoding import decode_json
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from marktplaats.endpoints import Endpoint
+    from marktplaats.retry import RetryEvent
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """A request that has finished, successfully or not."""
+
+    endpoint: Endpoint
+    url: str
+    duration: float  # Seconds, including retries
+    status_code: int | None = None  # None if it failed without a response
+    size: int | None = None  # Bytes in the body, None if it's unknown
+    from_cache: bool = False
+    error: BaseException | None = None
+    retries: int = 0  # Attempts after the first, also reported as request_retried
+
+
+class Instrumentation:
+    """
+    Receives events from the library, to turn them into metrics or traces.
+
+    Every event does nothing by default, so subclasses only override the ones
+    they need. Install one with set_instrumentation(). All events are called
+    on the thread (or in the task) that caused them, so they should be quick.
+    """
+
+    def request_started(self, endpoint: Endpoint, url: str) -> None:
+        """Handle a request that is about to be sent, or answered from the cache."""
+
+    def request_finished(self, event: RequestEvent) -> None:
+        """Handle a request that has finished, after any retries."""
+
+    def request_retried(self, event: RetryEvent) -> None:
+        """Handle a request that is about to be retried."""
+
+    def json_decoded(self, endpoint: Endpoint, size: int, duration: float) -> None:
+        """Handle the decoding of a JSON response of size bytes."""
+
+    def page_parsed(self, listings: int, duration: float) -> None:
+        """Handle the parsing of the listings of a search response."""
+
+    def images_parsed(self, parser: str, duration: float) -> None:
+        """
+        Handle the search for the images in a listing page.
+
+        parser is "scan" when the page was only scanned for its ld+json, or
+        "beautifulsoup" when it had to be parsed with BeautifulSoup.
+        """
+
+    def unknown_value(self, field: str, value: str) -> None:
+        """Handle a "date" or "price_type" this library doesn't know."""
+
+
+_instrumentation: Instrumentation | None = None
+
+
+def set_instrumentation(instrumentation: Instrumentation | None) -> None:
+    """Install the process-wide instrumentation, or disable it with None."""
+    global _instrumentation  # ruff:ignore[global-statement] Process-wide setting
+    _instrumentation = instrumentation
+
+
+def get_instrumentation() -> Instrumentation:
+    """
+    Get the process-wide instrumentation.
+
+    Returns:
+        The installed instrumentation, or a no-op one if none is installed.
+
+    """
+    return _instrumentation or _NOOP
+
+
+def active_instrumentation() -> Instrumentation | None:
+    """
+    Get the installed instrumentation, for the library to report to.
+
+    Returns:
+        The installed instrumentation, or None when it's disabled, so nothing
+        needs to be measured.
+
+    """
+    return _instrumentation
+
+
+def timed_decode_json(content: bytes, endpoint: Endpoint) -> Any:  # type: ignore[explicit-any]  # ruff:ignore[any-type] Like decode_json
+    """
+    Decode a JSON response body, reporting how long it took.
+
+    Returns:
+        The decoded JSON.
+
+    """
+    instrumentation = _instrumentation
+    if instrumentation is None:
+        return decode_json(content)
+    started = time.perf_counter()
+    decoded = decode_json(content)
+    instrumentation.json_decoded(
+        endpoint,
+        len(content),
+        time.perf_counter() - started,
+    )
+    return decoded
+
+
+def content_length(headers: Mapping[str, str]) -> int | None:
+    """
+    Get the size of a response body that hasn't been read yet.
+
+    Returns:
+        The Content-Length, or None if it's missing or invalid.
+
+    """
+    try:
+        return int(headers["Content-Length"])
+    except (KeyError, ValueError):
+        return None
+
+
+_NOOP = Instrumentation()
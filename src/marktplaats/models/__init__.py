@@ -1,7 +1,24 @@
 from __future__ import annotations
 
+from marktplaats.models.compact import (
+    CompactListing as CompactListing,
+    CompactListingFirstImage as CompactListingFirstImage,
+    CompactListingLocation as CompactListingLocation,
+    CompactListingSeller as CompactListingSeller,
+)
 from marktplaats.models.listing import Listing as Listing
-from marktplaats.models.listing_image import ListingFirstImage as ListingFirstImage
+from marktplaats.models.listing_image import (
+    ListingFirstImage as ListingFirstImage,
+    ListingImagesResult as ListingImagesResult,
+    fetch_listing_images_many as fetch_listing_images_many,
+)
 from marktplaats.models.listing_location import ListingLocation as ListingLocation
-from marktplaats.models.listing_seller import ListingSeller as ListingSeller
+from marktplaats.models.listing_seller import (
+    ListingSeller as ListingSeller,
+    Seller as Seller,
+    SellerCache as SellerCache,
+    SellersResult as SellersResult,
+    enrich_sellers as enrich_sellers,
+    get_default_seller_cache as get_default_seller_cache,
+)
 from marktplaats.models.price_type import PriceType as PriceType
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from typing_extensions import Self
+
+from marktplaats.models.listing_image import fetch_listing_images
+
+
+if TYPE_CHECKING:
+    from datetime import date
+    from types import NotImplementedType
+
+    from marktplaats.models.listing import Listing
+    from marktplaats.models.listing_image import ListingFirstImage
+    from marktplaats.models.listing_location import ListingLocation
+    from marktplaats.models.listing_seller import ListingSeller
+    from marktplaats.models.price_type import PriceType
+    from marktplaats.transport import Transport
+
+
+def _intern(value: str | None) -> str | None:
+    return None if value is None else sys.intern(value)
+
+
+@dataclass(slots=True, frozen=True)
+class CompactListingLocation:
+    """A ListingLocation without a __dict__, sharing its city and country strings."""
+
+    city: str | None
+    country: str | None
+    country_short: str | None
+    latitude: float | None
+    longitude: float | None
+    distance_km: int | None
+
+    @classmethod
+    def from_location(cls, location: ListingLocation) -> Self:
+        return cls(
+            _intern(location.city),
+            _intern(location.country),
+            _intern(location.country_short),
+            location.latitude,
+            location.longitude,
+            location.distance_km,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class CompactListingSeller:
+    """A ListingSeller without a __dict__."""
+
+    id: int
+    name: str
+    is_verified: bool
+
+    @classmethod
+    def from_seller(cls, seller: ListingSeller) -> Self:
+        return cls(seller.id, seller.name, seller.is_verified)
+
+
+# Marktplaats serves the image sizes from the same URL, only the rule differs
+_SIZE_RULES = ("$_14.", "$_82.", "$_83.", "$_85.")
+_TEMPLATE_RULE = "$_#."
+
+
+class CompactListingFirstImage:
+    """
+    A ListingFirstImage that stores one URL instead of four, where possible.
+
+    The four sizes normally only differ in their size rule, so only a template
+    is stored and the sizes are derived from it. URLs that don't follow that
+    pattern are stored as they are.
+    """
+
+    __slots__ = ("_urls",)
+
+    def __init__(
+        self,
+        extra_small: str,
+        medium: str,
+        large: str,
+        extra_large: str,
+    ) -> None:
+        urls = (extra_small, medium, large, extra_large)
+        template = extra_small.replace(_SIZE_RULES[0], _TEMPLATE_RULE, 1)
+        derived = tuple(
+            template.replace(_TEMPLATE_RULE, rule, 1) for rule in _SIZE_RULES
+        )
+        self._urls: str | tuple[str, str, str, str] = (
+            template if template != extra_small and derived == urls else urls
+        )
+
+    @classmethod
+    def from_image(cls, image: ListingFirstImage) -> Self:
+        return cls(image.extra_small, image.medium, image.large, image.extra_large)
+
+    def _url(self, size: int) -> str:
+        if isinstance(self._urls, tuple):
+            return self._urls[size]
+        return self._urls.replace(_TEMPLATE_RULE, _SIZE_RULES[size], 1)
+
+    @property
+    def extra_small(self) -> str:
+        return self._url(0)
+
+    @property
+    def medium(self) -> str:
+        return self._url(1)
+
+    @property
+    def large(self) -> str:
+        return self._url(2)
+
+    @property
+    def extra_large(self) -> str:
+        return self._url(3)
+
+    def __eq__(self, other: object) -> NotImplementedType | bool:
+        if not isinstance(other, CompactListingFirstImage):
+            return NotImplemented
+        return self._urls == other._urls
+
+    def __hash__(self) -> int:
+        return hash(self._urls)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(extra_small={self.extra_small!r}, "
+            f"medium={self.medium!r}, large={self.large!r}, "
+            f"extra_large={self.extra_large!r})"
+        )
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class CompactListing:
+    """
+    A Listing that takes a lot less memory, for keeping many of them around.
+
+    Made with CompactListing.from_listing(). It has no __dict__, the few
+    distinct cities, countries and attribute keys are interned, and by default
+    it only keeps the first image and drops the attributes.
+    """
+
+    id: str
+    title: str
+    description: str
+    date: date | None
+    seller: CompactListingSeller
+    location: CompactListingLocation
+    price: float
+    price_type: PriceType
+    images: tuple[CompactListingFirstImage, ...]
+    category_id: int
+    # (key, value) pairs, only kept when asked for
+    attributes: tuple[tuple[str, str], ...]
+
+    @classmethod
+    def from_listing(
+        cls,
+        listing: Listing,
+        *,
+        first_image_only: bool = True,
+        keep_attributes: bool = False,
+    ) -> Self:
+        images = listing._images[:1] if first_image_only else listing._images  # ruff:ignore[private-member-access] Converting a Listing
+        return cls(
+            listing.id,
+            listing.title,
+            listing.description,
+            listing.date,
+            CompactListingSeller.from_seller(listing.seller),
+            CompactListingLocation.from_location(listing.location),
+            listing.price,
+            listing.price_type,
+            tuple(CompactListingFirstImage.from_image(image) for image in images),
+            listing.category_id,
+            tuple(
+                (sys.intern(attribute["key"]), attribute["value"])
+                for attribute in listing.attributes
+            )
+            if keep_attributes
+            else (),
+        )
+
+    @property
+    def link(self) -> str:
+        return "https://link.marktplaats.nl/" + self.id
+
+    @property
+    def first_image(self) -> CompactListingFirstImage | None:
+        return self.images[0] if self.images else None
+
+    def get_images(self, *, transport: Transport | None = None) -> list[str]:
+        return fetch_listing_images(self.id, transport=transport)
+
+    def __eq__(self, other: object) -> NotImplementedType | bool:
+        if not isinstance(other, CompactListing):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def price_as_string(
+        self,
+        *,
+        euro_sign: bool = True,
+        lang: str = "en",
+    ) -> str:
+        return self.price_type._as_string(  # ruff:ignore[private-member-access] private member access
+            self.price,
+            euro_sign=euro_sign,
+            lang=lang,
+        )
@@ -15,6 +15,7 @@ if TYPE_CHECKING:
     from marktplaats.models.listing_location import ListingLocation
     from marktplaats.models.listing_seller import ListingSeller
     from marktplaats.models.price_type import PriceType
+    from marktplaats.transport import Transport
 
 
 @dataclass
@@ -51,8 +52,8 @@ class Listing:
             # there seem to be no images in the listing, so return None
             return None
 
-    def get_images(self) -> list[str]:
-        return fetch_listing_images(self.id)
+    def get_images(self, *, transport: Transport | None = None) -> list[str]:
+        return fetch_listing_images(self.id, transport=transport)
 
     def __eq__(self, other: object) -> NotImplementedType | bool:
         if not isinstance(other, Listing):
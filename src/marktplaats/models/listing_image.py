@@ -1,17 +1,31 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import re
+import time
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from contextlib import ExitStack
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from bs4 import BeautifulSoup
 from typing_extensions import Self
 
+from marktplaats.decoding import decode_json
+from marktplaats.endpoints import LISTING_PAGE_URL
+from marktplaats.instrumentation import active_instrumentation
 from marktplaats.utils import get_request
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from marktplaats.api_types import Picture
+    from marktplaats.transport import Transport
 
 
 @dataclass
@@ -42,33 +56,190 @@ class ListingFirstImage:
         ]
 
 
-def fetch_listing_images(listing_id: str) -> list[str]:
+def fetch_listing_images(
+    listing_id: str,
+    *,
+    transport: Transport | None = None,
+) -> list[str]:
     """
     Return a list of image URLs for a given listing.
 
     It scrapes the listing page and parses the ld+json objects on that page.
     Returns an empty list if the listing has no photos.
     :param listing_id: The listing ID to get images for.
+    :param transport: The transport to send the request with.
+        Defaults to the process-wide transport.
     :return: A list of image URLs (https).
     """  # ruff:ignore[docstring-missing-returns] TODO: all the docstrings are a bit inconsistent
-    r = get_request(f"https://link.marktplaats.nl/{listing_id}")
+    return parse_listing_images(_fetch_listing_page(listing_id, transport))
+
+
+@dataclass
+class ListingImagesResult:
+    """The images of many listings, and the errors of the ones that failed."""
+
+    images: dict[str, list[str]] = field(default_factory=dict)
+    errors: dict[str, BaseException] = field(default_factory=dict)
+
+
+def _fetch_listing_page(listing_id: str, transport: Transport | None) -> bytes:
+    r = get_request(
+        LISTING_PAGE_URL.format(listing_id=listing_id),
+        transport=transport,
+    )
     r.raise_for_status()  # raises so we can stop the fetching on a higher level
+    return r.content
+
 
-    soup = BeautifulSoup(r.text, "html.parser")
+def fetch_listing_images_many(
+    listing_ids: Iterable[str],
+    *,
+    max_workers: int = 8,
+    processes: int | None = None,
+    transport: Transport | None = None,
+) -> ListingImagesResult:
+    """
+    Fetch the images of many listings concurrently.
 
-    images: list[str] = []
+    The listing pages are fetched on at most max_workers threads, sharing the
+    transport's connection pool. Pages are parsed on those threads too, unless
+    processes is set: then they're parsed in that many worker processes.
+    That's only worth it for very large batches, as parsing a page is cheap
+    compared to sending it to another process.
 
-    # get the data objects from the HTML response
-    for data in soup.select('script[type="application/ld+json"]'):
-        parsed = json.loads(data.text)
-        # the list of image URLs is hidden within the product object
-        if type(parsed) is dict and parsed["@type"] == "Product":
-            # actual photos are protocol-relative (//images.marktplaats.com/...).
-            #  Listings without photos have an absolute placeholder URL here
-            #  instead, which we don't want to return as an image.
-            images.extend(
-                f"https:{image}" for image in parsed["image"] if image.startswith("//")
+    A listing that fails doesn't stop the others; its error is collected.
+
+    Returns:
+        The image URLs by listing ID, in the order of listing_ids,
+        and the errors by listing ID.
+
+    """
+    listing_ids = list(dict.fromkeys(listing_ids))
+    images: dict[str, list[str]] = {}
+    errors: dict[str, BaseException] = {}
+
+    def collect(futures: dict[Future[list[str]], str]) -> None:
+        for future in as_completed(futures):
+            error = future.exception()
+            if error is None:
+                images[futures[future]] = future.result()
+            else:
+                errors[futures[future]] = error
+
+    with ExitStack() as stack:
+        threads = stack.enter_context(ThreadPoolExecutor(max_workers=max_workers))
+        if processes is None:
+            collect(
+                {
+                    threads.submit(fetch_listing_images, id_, transport=transport): id_
+                    for id_ in listing_ids
+                },
             )
-            break
+        else:
+            import multiprocessing  # ruff:ignore[import-outside-top-level] Only loaded when parsing in processes
+            from concurrent.futures import ProcessPoolExecutor  # ruff:ignore[import-outside-top-level] Only loaded when parsing in processes
+
+            # Not forked: the fetching threads are already running
+            parser = stack.enter_context(
+                ProcessPoolExecutor(
+                    processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                ),
+            )
+            pages = {
+                threads.submit(_fetch_listing_page, id_, transport): id_
+                for id_ in listing_ids
+            }
+            parsed: dict[Future[list[str]], str] = {}
+            for page in as_completed(pages):
+                listing_id = pages[page]
+                error = page.exception()
+                if error is None:
+                    content = page.result()
+                    parsed[parser.submit(parse_listing_images, content)] = listing_id
+                else:
+                    errors[listing_id] = error
+            collect(parsed)
+
+    return ListingImagesResult(
+        {id_: images[id_] for id_ in listing_ids if id_ in images},
+        {id_: errors[id_] for id_ in listing_ids if id_ in errors},
+    )
+
+
+def parse_listing_images(html: str | bytes) -> list[str]:
+    """
+    Return the image URLs found in the HTML of a listing page.
 
+    The ld+json blocks are found by scanning the page, without parsing all of
+    its HTML. Only when that doesn't turn up a product, the page is parsed
+    with BeautifulSoup to be sure.
+    :param html: The listing page's HTML, preferably the raw bytes.
+    :return: A list of image URLs (https).
+    """  # ruff:ignore[docstring-missing-returns] Same style as fetch_listing_images
+    instrumentation = active_instrumentation()
+    started = time.perf_counter() if instrumentation is not None else 0.0
+    parser = "scan"
+    images = scan_listing_images(html)
+    if images is None:
+        parser = "beautifulsoup"
+        images = soup_listing_images(html)
+    if instrumentation is not None:
+        instrumentation.images_parsed(parser, time.perf_counter() - started)
     return images
+
+
+_LD_JSON_SCRIPT = re.compile(
+    rb"<script\b[^>]*\btype\s*=\s*[\"']?application/ld\+json[\"']?[^>]*>"
+    rb"(.*?)</script\s*>",
+    re.DOTALL | re.IGNORECASE,
+)
+
+
+def scan_listing_images(html: str | bytes) -> list[str] | None:
+    """
+    Find the image URLs in a listing page by scanning it for ld+json blocks.
+
+    :param html: The listing page's HTML.
+    :return: A list of image URLs (https),
+        or None if no product could be found this way.
+    """  # ruff:ignore[docstring-missing-returns] Same style as fetch_listing_images
+    if isinstance(html, str):
+        html = html.encode()
+    for match in _LD_JSON_SCRIPT.finditer(html):
+        try:
+            parsed = decode_json(match.group(1))
+        except ValueError:
+            return None
+        images = _product_images(parsed)
+        if images is not None:
+            return images
+    return None
+
+
+def soup_listing_images(html: str | bytes) -> list[str]:
+    """
+    Find the image URLs in a listing page by parsing all of it with BeautifulSoup.
+
+    :param html: The listing page's HTML.
+    :return: A list of image URLs (https).
+    """  # ruff:ignore[docstring-missing-returns] Same style as fetch_listing_images
+    soup = BeautifulSoup(html, "html.parser")
+
+    # get the data objects from the HTML response
+    for data in soup.select('script[type="application/ld+json"]'):
+        images = _product_images(json.loads(data.text))
+        if images is not None:
+            return images
+
+    return []
+
+
+def _product_images(parsed: object) -> list[str] | None:
+    # the list of image URLs is hidden within the product object
+    if type(parsed) is not dict or parsed.get("@type") != "Product":
+        return None
+    # actual photos are protocol-relative (//images.marktplaats.com/...).
+    #  Listings without photos have an absolute placeholder URL here
+    #  instead, which we don't want to return as an image.
+    return [f"https:{image}" for image in parsed["image"] if image.startswith("//")]
@@ -19,6 +19,8 @@ class ListingLocation:
     latitude: float | None
     longitude: float | None
     distance_km: int | None
+    # Exactly, where distance_km is rounded down
+    distance_meters: int | None = None
 
     @property
     def distance(self) -> int | None:
@@ -31,13 +33,15 @@ class ListingLocation:
 
     @classmethod
     def parse(cls, data: Location) -> Self:
+        distance_meters: int | None = data.get("distanceMeters")
+        if distance_meters == -1000:  # ruff:ignore[magic-value-comparison] magic value
+            distance_meters = None
         return cls(
             data.get("cityName"),
             data.get("countryName"),
             data.get("countryAbbreviation"),
             data["latitude"] if data["latitude"] != 0 else None,
             data["longitude"] if data["longitude"] != 0 else None,
-            data.get("distanceMeters") // 1000
-            if data.get("distanceMeters") != -1000  # ruff:ignore[magic-value-comparison] magic value
-            else None,
+            distance_meters // 1000 if distance_meters is not None else None,
+            distance_meters,
         )
@@ -1,16 +1,27 @@
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from typing_extensions import Self
 
+from marktplaats.cache import DEFAULT_TTLS, TTLCache
+from marktplaats.endpoints import SELLER_PROFILE_URL, Endpoint
+from marktplaats.instrumentation import timed_decode_json
 from marktplaats.utils import get_request
 
 
 if TYPE_CHECKING:
-    from marktplaats.api_types import Review, SellerInformation
+    from collections.abc import Callable, Iterable
+
+    from marktplaats.api_types import SellerDetailsResponse, SellerInformation
+    from marktplaats.api_types.seller_details import Review
+    from marktplaats.models.compact import CompactListing
+    from marktplaats.models.listing import Listing
+    from marktplaats.transport import Transport
 
 
 @dataclass
@@ -39,14 +50,30 @@ class ListingSeller:
             data["isVerified"],
         )
 
-    def get_seller(self) -> Seller:
+    def get_seller(
+        self,
+        *,
+        transport: Transport | None = None,
+        cache: SellerCache | None = None,  # Not cached unless a cache is passed
+    ) -> Seller:
+        if cache is not None:
+            seller = cache.get(self.id)
+            if seller is not None:
+                return seller
+
         request = get_request(
-            f"https://www.marktplaats.nl/v/api/seller-profile/{self.id}"
+            SELLER_PROFILE_URL.format(seller_id=self.id),
+            transport=transport,
         )
 
-        body = request.text
-        body_json = json.loads(body)
+        body_json = timed_decode_json(request.content, Endpoint.SELLER_PROFILE)
 
+        seller = self.parse_seller(body_json)
+        if cache is not None:
+            cache.add(seller)
+        return seller
+
+    def parse_seller(self, body_json: SellerDetailsResponse) -> Seller:
         review: Review | None = (
             body_json["reviews"][0] if body_json["reviews"] else None
         )
@@ -60,3 +87,117 @@ class ListingSeller:
             body_json["identification"],
             body_json["phoneNumber"],
         )
+
+
+class SellerCache(TTLCache[int, Seller]):
+    """
+    A thread-safe LRU cache of sellers by their ID.
+
+    Sellers expire after ttl seconds, by default the TTL the response cache
+    uses for seller profiles.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        *,
+        ttl: float = DEFAULT_TTLS[Endpoint.SELLER_PROFILE],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(max_entries, clock=clock)
+        self.ttl = ttl
+
+    def add(self, seller: Seller) -> None:
+        self.set(seller.id, seller, self.ttl)
+
+
+@dataclass
+class SellersResult:
+    """The sellers of many listings, and the errors of the ones that failed."""
+
+    sellers: dict[int, Seller] = field(default_factory=dict)
+    errors: dict[int, BaseException] = field(default_factory=dict)
+
+
+_default_seller_cache: SellerCache | None = None
+_default_seller_cache_lock = threading.Lock()
+
+
+def get_default_seller_cache() -> SellerCache:
+    """
+    Get the process-wide seller cache, creating it on first use.
+
+    Returns:
+        The seller cache used by enrich_sellers() when none is passed explicitly.
+
+    """
+    global _default_seller_cache  # ruff:ignore[global-statement] Process-wide default
+    if _default_seller_cache is None:
+        with _default_seller_cache_lock:
+            if _default_seller_cache is None:
+                _default_seller_cache = SellerCache()
+    return _default_seller_cache
+
+
+def enrich_sellers(
+    listings: Iterable[Listing | CompactListing],
+    *,
+    max_workers: int = 8,
+    cache: SellerCache | None = None,  # Defaults to the process-wide seller cache
+    transport: Transport | None = None,
+) -> SellersResult:
+    """
+    Fetch the full sellers of many listings at once.
+
+    Every seller is only fetched once, however many listings they have, and
+    sellers already in the cache aren't fetched at all. The others are fetched
+    in parallel on at most max_workers threads, and added to the cache.
+
+    A seller that fails doesn't stop the others; its error is collected.
+
+    Returns:
+        The sellers by their ID, in the order of the listings,
+        and the errors by seller ID.
+
+    """
+    if cache is None:
+        cache = get_default_seller_cache()
+
+    order: list[int] = []
+    sellers: dict[int, Seller] = {}
+    errors: dict[int, BaseException] = {}
+    missing: dict[int, ListingSeller] = {}
+    for listing in listings:
+        seller_id = listing.seller.id
+        if seller_id in sellers or seller_id in missing:
+            continue
+        order.append(seller_id)
+        seller = cache.get(seller_id)
+        if seller is not None:
+            sellers[seller_id] = seller
+        else:
+            missing[seller_id] = ListingSeller(
+                seller_id,
+                listing.seller.name,
+                listing.seller.is_verified,
+            )
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(seller.get_seller, transport=transport): seller_id
+                for seller_id, seller in missing.items()
+            }
+            for future in as_completed(futures):
+                error = future.exception()
+                if error is None:
+                    seller = future.result()
+                    cache.add(seller)
+                    sellers[futures[future]] = seller
+                else:
+                    errors[futures[future]] = error
+
+    return SellersResult(
+        {id_: sellers[id_] for id_ in order if id_ in sellers},
+        {id_: errors[id_] for id_ in order if id_ in errors},
+    )
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from marktplaats.instrumentation import Instrumentation
+
+
+try:
+    from opentelemetry import context, trace
+except ImportError as err:  # pragma: no cover
+    msg = (
+        "marktplaats.otel requires opentelemetry-api. "
+        "Install it with `pip install marktplaats[opentelemetry]`."
+    )
+    raise ImportError(msg) from err
+
+
+if TYPE_CHECKING:
+    from contextvars import Token
+
+    from opentelemetry.context import Context
+
+    from marktplaats.endpoints import Endpoint
+    from marktplaats.instrumentation import RequestEvent
+    from marktplaats.retry import RetryEvent
+
+
+# The span of the request being sent, and the token to restore the context with.
+#  A context variable, so every thread and every task has its own.
+_current_request: ContextVar[tuple[trace.Span, Token[Context]] | None] = ContextVar(
+    "marktplaats_request_span",
+    default=None,
+)
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """
+    Reports the events of the library as OpenTelemetry spans.
+
+    Every request gets a client span, which is the current span while it's
+    being sent, with its retries as span events. Decoding and parsing get a
+    span of their own. Unknown dates and price types are added as events to
+    the current span.
+    """
+
+    def __init__(self, tracer: trace.Tracer | None = None) -> None:
+        self.tracer = trace.get_tracer("marktplaats") if tracer is None else tracer
+
+    @override
+    def request_started(self, endpoint: Endpoint, url: str) -> None:
+        span = self.tracer.start_span(
+            f"GET {endpoint.value}",
+            kind=trace.SpanKind.CLIENT,
+            attributes={"http.request.method": "GET", "url.full": url},
+        )
+        token = context.attach(trace.set_span_in_context(span))
+        _current_request.set((span, token))
+
+    @override
+    def request_finished(self, event: RequestEvent) -> None:
+        current = _current_request.get()
+        if current is None:
+            return
+        span, token = current
+        _current_request.set(None)
+        context.detach(token)
+
+        span.set_attribute("marktplaats.from_cache", event.from_cache)
+        if event.status_code is not None:
+            span.set_attribute("http.response.status_code", event.status_code)
+        if event.size is not None:
+            span.set_attribute("http.response.body.size", event.size)
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(trace.StatusCode.ERROR, type(event.error).__name__)
+        elif event.status_code is not None and event.status_code >= 400:  # ruff:ignore[magic-value-comparison] HTTP status codes are a universal constant
+            span.set_status(trace.StatusCode.ERROR)
+        span.end()
+
+    @override
+    def request_retried(self, event: RetryEvent) -> None:
+        attributes: dict[str, str | int | float] = {
+            "marktplaats.attempt": event.attempt,
+            "marktplaats.retry_delay": event.delay,
+        }
+        if event.status_code is not None:
+            attributes["http.response.status_code"] = event.status_code
+        if event.error is not None:
+            attributes["error.type"] = type(event.error).__name__
+        trace.get_current_span().add_event("retry", attributes)
+
+    def _add_span(
+        self,
+        name: str,
+        duration: float,
+        attributes: dict[str, str | int],
+    ) -> None:
+        # The work is already done, so the span is created afterwards
+        end = time.time_ns()
+        span = self.tracer.start_span(
+            name,
+            start_time=end - int(duration * 1e9),
+            attributes=attributes,
+        )
+        span.end(end_time=end)
+
+    @override
+    def json_decoded(self, endpoint: Endpoint, size: int, duration: float) -> None:
+        self._add_span(
+            "marktplaats.decode_json",
+            duration,
+            {"marktplaats.endpoint": endpoint.value, "marktplaats.size": size},
+        )
+
+    @override
+    def page_parsed(self, listings: int, duration: float) -> None:
+        self._add_span(
+            "marktplaats.parse_listings",
+            duration,
+            {"marktplaats.listings": listings},
+        )
+
+    @override
+    def images_parsed(self, parser: str, duration: float) -> None:
+        self._add_span(
+            "marktplaats.parse_listing_images",
+            duration,
+            {"marktplaats.parser": parser},
+        )
+
+    @override
+    def unknown_value(self, field: str, value: str) -> None:
+        trace.get_current_span().add_event(
+            "marktplaats.unknown_value",
+            {"marktplaats.field": field, "marktplaats.value": value},
+        )
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import logging
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from marktplaats.config import ISSUE_LINK
+from marktplaats.instrumentation import active_instrumentation
+from marktplaats.models.price_type import PriceType
+
+
+if TYPE_CHECKING:
+    from marktplaats.api_types.search import Listing as ListingResponse
+
+
+logger = logging.getLogger(__name__)
+
+MONTH_MAPPING = {
+    "jan": "Jan",
+    "feb": "Feb",
+    "mrt": "Mar",
+    "apr": "Apr",
+    "mei": "May",
+    "jun": "Jun",
+    "jul": "Jul",
+    "aug": "Aug",
+    "sep": "Sep",
+    "okt": "Oct",
+    "nov": "Nov",
+    "dec": "Dec",
+}
+
+# Month numbers by their Dutch abbreviation, for parsing dates in a single pass
+DUTCH_MONTHS = {dutch: number for number, dutch in enumerate(MONTH_MAPPING, start=1)}
+
+# The relative words marktplaats returns for recent dates, in days ago
+RELATIVE_DAYS = {"Vandaag": 0, "Gisteren": 1, "Eergisteren": 2}
+
+
+def replace_dutch_months(date_str: str) -> str:
+    # marktplaats returns Dutch names for months
+    # so we need to convert them to english to be parsed
+    for dutch, english in MONTH_MAPPING.items():
+        date_str = date_str.replace(dutch, english)
+    return date_str
+
+
+def parse_date(date_str: str, *, today: date | None = None) -> date:
+    # marktplaats returns these relative words for the date
+    # OR a date like '10 mrt 24'
+    days_ago = RELATIVE_DAYS.get(date_str)
+    if days_ago is not None:
+        return (today or date.today()) - timedelta(days=days_ago)
+    return _parse_absolute_date(date_str)
+
+
+@lru_cache(maxsize=4096)  # A page of listings only has a handful of different dates
+def _parse_absolute_date(date_str: str) -> date:
+    # Same as strptime(replace_dutch_months(date_str), "%d %b %y"), only faster
+    parts = date_str.split()
+    if (
+        len(parts) != 3  # ruff:ignore[magic-value-comparison] Day, month and year
+        or not (parts[0].isdecimal() and len(parts[0]) <= 2)  # ruff:ignore[magic-value-comparison] Like %d
+        or not (parts[2].isdecimal() and len(parts[2]) == 2)  # ruff:ignore[magic-value-comparison] Like %y
+        or parts[1].lower() not in DUTCH_MONTHS
+    ):
+        msg = f"Unknown date format: {date_str!r}"
+        raise ValueError(msg)
+    day, month, year = parts
+    # Two-digit years are in 1969-2068, like strptime's %y
+    full_year = int(year) + (1900 if int(year) >= 69 else 2000)  # ruff:ignore[magic-value-comparison] The %y pivot year
+    return date(full_year, DUTCH_MONTHS[month.lower()], int(day))
+
+
+def parse_listing_date(
+    listing: ListingResponse,
+    today: date | None = None,
+) -> date | None:
+    """
+    Parse the date of a listing from a search response.
+
+    Relative dates like "Vandaag" are relative to today, which defaults to the
+    current date. Pass it when parsing many listings, so it's looked up once.
+    An unknown date format is reported and parsed as None.
+
+    Returns:
+        The date of the listing, or None if its format is unknown.
+
+    """
+    days_ago = RELATIVE_DAYS.get(listing["date"])
+    if days_ago is not None:
+        return (today or date.today()) - timedelta(days=days_ago)
+    try:
+        return parse_date(listing["date"])
+    except ValueError:
+        instrumentation = active_instrumentation()
+        if instrumentation is not None:
+            instrumentation.unknown_value("date", listing["date"])
+        logger.warning(
+            "Marktplaats-py found an unknown date format for listing %s: '%s'. "
+            "This is not your fault. "
+            "Please create an issue on %s and include this log message.",
+            listing["itemId"],
+            listing["date"],
+            ISSUE_LINK,
+        )
+        return None
+
+
+def parse_price_type(listing: ListingResponse) -> PriceType:
+    """
+    Parse the price type of a listing from a search response.
+
+    An unknown price type is reported and parsed as PriceType.UNKNOWN.
+
+    Returns:
+        The price type of the listing.
+
+    """
+    try:
+        return PriceType(listing["priceInfo"]["priceType"])
+    except ValueError:
+        # this means marktplaats has a PriceType this library doesn't know about
+        instrumentation = active_instrumentation()
+        if instrumentation is not None:
+            instrumentation.unknown_value(
+                "price_type",
+                listing["priceInfo"]["priceType"],
+            )
+        logger.warning(
+            "Marktplaats-py found an unknown PriceType found for "
+            "listing %s: '%s'. "
+            "This is not your fault. "
+            "Please create an issue on %s and include this log message.",
+            listing["itemId"],
+            listing["priceInfo"]["priceType"],
+            ISSUE_LINK,
+        )
+        # set a fallback value
+        return PriceType.UNKNOWN
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from marktplaats.endpoints import endpoint_for_url
+from marktplaats.instrumentation import Instrumentation
+
+
+try:
+    from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+except ImportError as err:  # pragma: no cover
+    msg = (
+        "marktplaats.prometheus requires prometheus-client. "
+        "Install it with `pip install marktplaats[prometheus]`."
+    )
+    raise ImportError(msg) from err
+
+
+if TYPE_CHECKING:
+    from prometheus_client import CollectorRegistry
+
+    from marktplaats.endpoints import Endpoint
+    from marktplaats.instrumentation import RequestEvent
+    from marktplaats.retry import RetryEvent
+
+
+# Parsing and decoding take milliseconds, far less than the default buckets
+PARSE_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+
+class PrometheusInstrumentation(Instrumentation):
+    """
+    Reports the events of the library as Prometheus metrics.
+
+    All metrics are prefixed with the namespace and registered in the given
+    registry, the default one if there is none. Create only one per registry,
+    as Prometheus doesn't allow registering the same metric twice.
+    """
+
+    def __init__(
+        self,
+        *,
+        registry: CollectorRegistry = REGISTRY,
+        namespace: str = "marktplaats",
+    ) -> None:
+        self.requests = Counter(
+            "requests",
+            "Requests sent, by endpoint and status code",
+            ["endpoint", "status"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.requests_in_progress = Gauge(
+            "requests_in_progress",
+            "Requests that are waiting for a response",
+            ["endpoint"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.request_duration = Histogram(
+            "request_duration_seconds",
+            "Time until the response was received, including retries",
+            ["endpoint"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.response_size = Counter(
+            "response_size_bytes",
+            "Bytes received in response bodies",
+            ["endpoint"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.cache_hits = Counter(
+            "cache_hits",
+            "Requests answered from the response cache",
+            ["endpoint"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.retries = Counter(
+            "retries",
+            "Requests that were retried",
+            ["endpoint"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.decode_duration = Histogram(
+            "json_decode_duration_seconds",
+            "Time spent decoding JSON responses",
+            ["endpoint"],
+            namespace=namespace,
+            registry=registry,
+            buckets=PARSE_BUCKETS,
+        )
+        self.parse_duration = Histogram(
+            "page_parse_duration_seconds",
+            "Time spent parsing the listings of a search response",
+            namespace=namespace,
+            registry=registry,
+            buckets=PARSE_BUCKETS,
+        )
+        self.images_duration = Histogram(
+            "images_parse_duration_seconds",
+            "Time spent finding the images in a listing page, by parser",
+            ["parser"],
+            namespace=namespace,
+            registry=registry,
+            buckets=PARSE_BUCKETS,
+        )
+        self.unknown_values = Counter(
+            "unknown_values",
+            "Dates and price types this library doesn't know, by field",
+            ["field"],
+            namespace=namespace,
+            registry=registry,
+        )
+
+    @override
+    def request_started(self, endpoint: Endpoint, url: str) -> None:
+        self.requests_in_progress.labels(endpoint.value).inc()
+
+    @override
+    def request_finished(self, event: RequestEvent) -> None:
+        endpoint = event.endpoint.value
+        self.requests_in_progress.labels(endpoint).dec()
+        if event.from_cache:
+            self.cache_hits.labels(endpoint).inc()
+            return
+        status = "error" if event.status_code is None else str(event.status_code)
+        self.requests.labels(endpoint, status).inc()
+        self.request_duration.labels(endpoint).observe(event.duration)
+        if event.size is not None:
+            self.response_size.labels(endpoint).inc(event.size)
+
+    @override
+    def request_retried(self, event: RetryEvent) -> None:
+        self.retries.labels(endpoint_for_url(event.url).value).inc()
+
+    @override
+    def json_decoded(self, endpoint: Endpoint, size: int, duration: float) -> None:
+        self.decode_duration.labels(endpoint.value).observe(duration)
+
+    @override
+    def page_parsed(self, listings: int, duration: float) -> None:
+        self.parse_duration.observe(duration)
+
+    @override
+    def images_parsed(self, parser: str, duration: float) -> None:
+        self.images_duration.labels(parser).observe(duration)
+
+    @override
+    def unknown_value(self, field: str, value: str) -> None:
+        self.unknown_values.labels(field).inc()
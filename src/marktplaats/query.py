@@ -1,50 +1,55 @@
 from __future__ import annotations
 
-import logging
+import time
 import warnings
-from datetime import date, datetime, timedelta
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import KW_ONLY, dataclass, field, replace
+from datetime import date, datetime
 from enum import Enum
-from typing import TYPE_CHECKING, TypedDict
+from functools import cached_property
+from itertools import chain
+from typing import TYPE_CHECKING, TypedDict, overload
 
-from requests.exceptions import (  # ruff:ignore[banned-api] Not doing any requests
-    JSONDecodeError as requests_JSONDecodeError,
-)
-from typing_extensions import NotRequired
+from typing_extensions import NotRequired, Self
 
+from marktplaats.cache import cache_key
 from marktplaats.categories import L1Category, L2Category
-from marktplaats.config import ISSUE_LINK
+from marktplaats.endpoints import SEARCH_URL, Endpoint
+from marktplaats.instrumentation import active_instrumentation, timed_decode_json
 from marktplaats.models import (
     Listing,
     ListingFirstImage,
     ListingLocation,
     ListingSeller,
 )
-from marktplaats.models.price_type import PriceType
+from marktplaats.parsing import (
+    DUTCH_MONTHS as DUTCH_MONTHS,  # ruff:ignore[useless-import-alias] Re-exported, it used to live here
+    MONTH_MAPPING as MONTH_MAPPING,  # ruff:ignore[useless-import-alias] Re-exported, it used to live here
+    RELATIVE_DAYS as RELATIVE_DAYS,  # ruff:ignore[useless-import-alias] Re-exported, it used to live here
+    parse_date as parse_date,  # ruff:ignore[useless-import-alias] Re-exported, it used to live here
+    parse_listing_date,
+    parse_price_type,
+    replace_dutch_months as replace_dutch_months,  # ruff:ignore[useless-import-alias] Re-exported, it used to live here
+)
+from marktplaats.streaming import ListingsParser
 from marktplaats.utils import MessageObjectException, get_request
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
+    from types import TracebackType
 
-    from marktplaats.api_types import QueryResponse
+    from requests import Response  # ruff:ignore[banned-api] Not doing any requests
 
+    from marktplaats.api_types import Attribute, QueryResponse
+    from marktplaats.api_types.search import Listing as ListingResponse
+    from marktplaats.models.price_type import PriceType
+    from marktplaats.transport import Transport
 
-logger = logging.getLogger(__name__)
 
-MONTH_MAPPING = {
-    "jan": "Jan",
-    "feb": "Feb",
-    "mrt": "Mar",
-    "apr": "Apr",
-    "mei": "May",
-    "jun": "Jun",
-    "jul": "Jul",
-    "aug": "Aug",
-    "sep": "Sep",
-    "okt": "Oct",
-    "nov": "Nov",
-    "dec": "Dec",
-}
+# Bytes read from a streamed response at a time
+DEFAULT_CHUNK_SIZE = 16 * 1024
 
 
 class BadStatusCodeError(MessageObjectException):
@@ -93,30 +98,6 @@ def get_price_cents(price: int | None) -> str:
     return "null" if price is None else str(price * 100)
 
 
-def replace_dutch_months(date_str: str) -> str:
-    # marktplaats returns Dutch names for months
-    # so we need to convert them to english to be parsed
-    for dutch, english in MONTH_MAPPING.items():
-        date_str = date_str.replace(dutch, english)
-    return date_str
-
-
-def parse_date(date_str: str) -> date:
-    # marktplaats returns these relative words for the date
-    # OR a date like '10 mrt 24'
-    if date_str == "Eergisteren":
-        result = datetime.now() - timedelta(days=2)
-    elif date_str == "Gisteren":
-        result = datetime.now() - timedelta(days=1)
-    elif date_str == "Vandaag":
-        result = datetime.now()
-    else:
-        date_str = replace_dutch_months(date_str)
-        result = datetime.strptime(date_str, "%d %b %y")
-
-    return result.date()
-
-
 # Cannot use declarative syntax because of '[]'
 Params = TypedDict(
     "Params",
@@ -139,6 +120,360 @@ Params = TypedDict(
 )
 
 
+def _check_query_or_category(
+    query: str,
+    category: L1Category | L2Category | None,
+) -> None:
+    if not query and category is None:
+        msg = (
+            "Invalid arguments: When the query is empty, a category must be specified."
+        )
+        raise ValueError(msg)
+
+
+def warn_distance_deprecated() -> None:
+    warnings.warn(
+        "distance is deprecated. Use distance_km instead.",
+        category=DeprecationWarning,
+        stacklevel=3,  # Point at the query's constructor call
+    )
+
+
+def _check_status(response: Response) -> None:
+    # This catches HTTP 4xx and 5xx errors
+    response.raise_for_status()
+
+    # But if it's something else non-200, still fail fast.
+    if response.status_code != 200:  # ruff:ignore[magic-value-comparison] HTTP status codes are a universal constant
+        msg = "Received non-200 status code:"
+        raise BadStatusCodeError(msg, response)
+
+
+def build_params(  # ruff:ignore[too-many-arguments] too many arguments
+    query: str = "",
+    *,
+    zip_code: str = "",
+    distance: int | None = None,  # In meters, deprecated
+    distance_km: int | None = None,  # In kilometers
+    price_from: int | None = None,
+    price_to: int | None = None,
+    limit: int = 1,
+    offset: int = 0,
+    sort_by: SortBy = SortBy.OPTIMIZED,
+    sort_order: SortOrder = SortOrder.ASC,
+    condition: Condition | None = None,
+    offered_since: datetime | None = None,  # A datetime object
+    category: L1Category | L2Category | None = None,
+    extra_attributes: Iterable[int]
+    | None = None,  # EXPERIMENTAL: list of integers, just like Condition
+) -> Params:
+    """
+    Build the search API parameters, without sending any request.
+
+    Raises a ValueError if neither a query nor a category is given.
+
+    Returns:
+        The query parameters for the search endpoint.
+
+    """
+    _check_query_or_category(query, category)
+
+    distance_meters = (
+        distance_km * 1000
+        if distance_km is not None
+        else distance
+        if distance is not None
+        else 1_000_000  # Basically unlimited
+    )
+
+    params: Params = {
+        "limit": str(limit),
+        "offset": str(offset),
+        "query": str(query),
+        "searchInTitleAndDescription": "true",
+        "viewOptions": "list-view",
+        "distanceMeters": str(distance_meters),
+        "postcode": zip_code,
+        "sortBy": sort_by.value,
+        "sortOrder": sort_order.value,
+        "attributesById[]": [],
+    }
+
+    # Only add price parameters if any scoping is actually done,
+    #  to match the website's behavior.
+    if price_from is not None or price_to is not None:
+        params["attributeRanges[]"] = [
+            f"PriceCents:{get_price_cents(price_from)}:{get_price_cents(price_to)}",
+        ]
+
+    if condition is not None:
+        params["attributesById[]"].append(condition.value)
+
+    if extra_attributes is not None:
+        params["attributesById[]"].extend(extra_attributes)
+
+    if offered_since is not None:
+        params["attributesByKey[]"] = [
+            # Unix timestamp millis
+            f"offeredSince:{int(offered_since.timestamp()) * 1000}",
+        ]
+
+    if category:
+        # If it is an L2 category
+        if isinstance(category, L2Category):
+            params["l2CategoryId"] = str(category.id)
+            # Set the parent category as well
+            category = category.parent
+        # Set the L1 category in both cases
+        params["l1CategoryId"] = str(category.id)
+
+    return params
+
+
+def parse_listing(listing: ListingResponse, *, today: date | None = None) -> Listing:
+    """
+    Parse a single listing from a search response.
+
+    Relative dates like "Vandaag" are relative to today, which defaults to the
+    current date.
+
+    Returns:
+        The parsed listing.
+
+    """
+    return Listing(
+        listing["itemId"],
+        listing["title"],
+        listing["description"],
+        parse_listing_date(listing, today),
+        ListingSeller.parse(listing["sellerInformation"]),
+        ListingLocation.parse(listing["location"]),
+        listing["priceInfo"]["priceCents"] / 100,
+        parse_price_type(listing),
+        "https://link.marktplaats.nl/" + listing["itemId"],
+        ListingFirstImage.parse(listing.get("pictures")),
+        listing["categoryId"],
+        listing.get("attributes", []),
+        listing.get("extendedAttributes", []),
+    )
+
+
+def parse_listings(body_json: QueryResponse, limit: int) -> list[Listing]:
+    """
+    Parse the listings from a search response.
+
+    Returns:
+        At most `limit` parsed listings.
+
+    """
+    # Marktplaats pads small pages with extra listings (e.g. a limit=5
+    #  request sometimes returns 20). The first `limit` items are the actual page
+    #  window, so anything after that is cut off.
+    instrumentation = active_instrumentation()
+    started = time.perf_counter() if instrumentation is not None else 0.0
+    today = date.today()
+    listings = [
+        parse_listing(listing, today=today) for listing in body_json["listings"][:limit]
+    ]
+    if instrumentation is not None:
+        instrumentation.page_parsed(len(listings), time.perf_counter() - started)
+    return listings
+
+
+class LazyListing(Listing):
+    """
+    A Listing that is parsed from the raw search response field by field.
+
+    Only the ID is read up front. Every other field is parsed the first time
+    it is accessed, and then cached. Apart from that, it behaves exactly like
+    a Listing parsed by get_listings().
+    """
+
+    def __init__(self, listing: ListingResponse, *, today: date | None = None) -> None:
+        # No super().__init__(), the fields are filled in lazily
+        self._raw = listing
+        self._today = today
+        self.id = listing["itemId"]
+
+    @cached_property
+    def title(self) -> str:  # type: ignore[override] # Still a read/write attribute
+        return self._raw["title"]
+
+    @cached_property
+    def description(self) -> str:  # type: ignore[override] # Still a read/write attribute
+        return self._raw["description"]
+
+    @cached_property
+    def date(self) -> date | None:  # type: ignore[override] # Still a read/write attribute
+        return parse_listing_date(self._raw, self._today)
+
+    @cached_property
+    def seller(self) -> ListingSeller:  # type: ignore[override] # Still a read/write attribute
+        return ListingSeller.parse(self._raw["sellerInformation"])
+
+    @cached_property
+    def location(self) -> ListingLocation:  # type: ignore[override] # Still a read/write attribute
+        return ListingLocation.parse(self._raw["location"])
+
+    @cached_property
+    def price(self) -> float:  # type: ignore[override] # Still a read/write attribute
+        return self._raw["priceInfo"]["priceCents"] / 100
+
+    @cached_property
+    def price_type(self) -> PriceType:  # type: ignore[override] # Still a read/write attribute
+        return parse_price_type(self._raw)
+
+    @cached_property
+    def link(self) -> str:  # type: ignore[override] # Still a read/write attribute
+        return "https://link.marktplaats.nl/" + self.id
+
+    @cached_property
+    def _images(self) -> list[ListingFirstImage]:  # type: ignore[override] # Still a read/write attribute
+        return ListingFirstImage.parse(self._raw.get("pictures"))
+
+    @cached_property
+    def category_id(self) -> int:  # type: ignore[override] # Still a read/write attribute
+        return self._raw["categoryId"]
+
+    @cached_property
+    def attributes(self) -> list[Attribute]:  # type: ignore[override] # Still a read/write attribute
+        return self._raw.get("attributes", [])
+
+    @cached_property
+    def extended_attributes(self) -> list[Attribute]:  # type: ignore[override] # Still a read/write attribute
+        return self._raw.get("extendedAttributes", [])
+
+
+class ListingsView(Sequence[Listing]):
+    """
+    A read-only sequence of the listings in a search response, parsed on demand.
+
+    Indexing creates a LazyListing the first time, and returns the same object
+    after that. Use ids() to get the listing IDs without parsing anything.
+    """
+
+    def __init__(self, listings: list[ListingResponse]) -> None:
+        self._raw = listings
+        self._parsed: list[LazyListing | None] = [None] * len(listings)
+        # Relative dates are relative to when the response was received
+        self._today = date.today()
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    @overload
+    def __getitem__(self, index: int) -> LazyListing: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[LazyListing]: ...  # type: ignore[explicit-any] # slice is generic over Any
+
+    def __getitem__(self, index: int | slice) -> LazyListing | list[LazyListing]:  # type: ignore[explicit-any] # slice is generic over Any
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        listing = self._parsed[index]
+        if listing is None:
+            listing = self._parsed[index] = LazyListing(
+                self._raw[index],
+                today=self._today,
+            )
+        return listing
+
+    def ids(self) -> list[str]:
+        return [listing["itemId"] for listing in self._raw]
+
+
+@dataclass(frozen=True)
+class SearchSpec:
+    """
+    A search query that hasn't been sent yet.
+
+    It takes the same arguments as SearchQuery, but building it doesn't do any
+    I/O: call execute() to send it. Specs are immutable and hashable, so they
+    can be compared, used as dictionary keys and scheduled or cached before
+    any request is made. Derive new specs with dataclasses.replace().
+    """
+
+    query: str = ""
+    _: KW_ONLY
+    zip_code: str = ""
+    distance_km: int | None = None  # In kilometers
+    price_from: int | None = None
+    price_to: int | None = None
+    limit: int = 1
+    offset: int = 0
+    sort_by: SortBy = SortBy.OPTIMIZED
+    sort_order: SortOrder = SortOrder.ASC
+    condition: Condition | None = None
+    offered_since: datetime | None = None  # A datetime object
+    category: L1Category | L2Category | None = None
+    extra_attributes: tuple[int, ...] = ()  # EXPERIMENTAL: just like Condition
+    # In meters, deprecated. Only here to support SearchQuery's distance argument.
+    distance: int | None = field(default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        _check_query_or_category(self.query, self.category)
+
+    def to_params(self) -> Params:
+        """
+        Build the search API parameters for this spec.
+
+        Returns:
+            The query parameters for the search endpoint.
+
+        """
+        return build_params(
+            self.query,
+            zip_code=self.zip_code,
+            distance=self.distance,
+            distance_km=self.distance_km,
+            price_from=self.price_from,
+            price_to=self.price_to,
+            limit=self.limit,
+            offset=self.offset,
+            sort_by=self.sort_by,
+            sort_order=self.sort_order,
+            condition=self.condition,
+            offered_since=self.offered_since,
+            category=self.category,
+            extra_attributes=self.extra_attributes,
+        )
+
+    @cached_property
+    def cache_key(self) -> str:
+        """
+        A stable key for this spec, based on the parameters it sends.
+
+        Two specs with the same key send exactly the same request. It's the
+        key the response cache uses for that request as well.
+        """
+        return cache_key(SEARCH_URL, self.to_params())
+
+    def execute(self, *, transport: Transport | None = None) -> SearchQuery:
+        """
+        Send this search query.
+
+        Returns:
+            The executed query.
+
+        """
+        return SearchQuery.from_spec(self, transport=transport)
+
+    def stream(
+        self,
+        *,
+        transport: Transport | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> ListingStream:
+        """
+        Send this search query, and parse the listings as they come in.
+
+        Returns:
+            The listings, to iterate over.
+
+        """
+        return ListingStream(self, transport=transport, chunk_size=chunk_size)
+
+
 class SearchQuery:
     """
     A search query for Marktplaats.
@@ -146,7 +481,7 @@ class SearchQuery:
     Raises a requests.HTTPError if the request fails.
     """
 
-    def __init__(  # ruff:ignore[too-many-arguments, complex-structure] too many arguments, too complex
+    def __init__(  # ruff:ignore[too-many-arguments] too many arguments
         self,
         query: str = "",
         *,
@@ -164,94 +499,71 @@ class SearchQuery:
         category: L1Category | L2Category | None = None,
         extra_attributes: Iterable[int]
         | None = None,  # EXPERIMENTAL: list of integers, just like Condition
+        transport: Transport | None = None,  # Defaults to the process-wide transport
     ) -> None:
-        if not query and category is None:
-            msg = (
-                "Invalid arguments: When the query is empty, "
-                "a category must be specified."
-            )
-            raise ValueError(msg)
-
         if distance is not None:
-            warnings.warn(
-                "distance is deprecated. Use distance_km instead.",
-                category=DeprecationWarning,
-                stacklevel=2,
-            )
-        distance_meters = (
-            distance_km * 1000
-            if distance_km is not None
-            else distance
-            if distance is not None
-            else 1_000_000  # Basically unlimited
+            warn_distance_deprecated()
+
+        spec = SearchSpec(
+            query,
+            zip_code=zip_code,
+            distance=distance,
+            distance_km=distance_km,
+            price_from=price_from,
+            price_to=price_to,
+            limit=limit,
+            offset=offset,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            condition=condition,
+            offered_since=offered_since,
+            category=category,
+            extra_attributes=tuple(extra_attributes or ()),
         )
 
-        params: Params = {
-            "limit": str(limit),
-            "offset": str(offset),
-            "query": str(query),
-            "searchInTitleAndDescription": "true",
-            "viewOptions": "list-view",
-            "distanceMeters": str(distance_meters),
-            "postcode": zip_code,
-            "sortBy": sort_by.value,
-            "sortOrder": sort_order.value,
-            "attributesById[]": [],
-        }
-
-        # Only add price parameters if any scoping is actually done,
-        #  to match the website's behavior.
-        if price_from is not None or price_to is not None:
-            params["attributeRanges[]"] = [
-                f"PriceCents:{get_price_cents(price_from)}:{get_price_cents(price_to)}",
-            ]
-
-        if condition is not None:
-            params["attributesById[]"].append(condition.value)
-
-        if extra_attributes is not None:
-            params["attributesById[]"].extend(extra_attributes)
-
-        if offered_since is not None:
-            params["attributesByKey[]"] = [
-                # Unix timestamp millis
-                f"offeredSince:{int(offered_since.timestamp()) * 1000}",
-            ]
+        self._execute(spec, transport)
 
-        # Kept around because the API can return more listings than requested
-        self.limit = limit
-
-        if category:
-            # If it is an L2 category
-            if isinstance(category, L2Category):
-                params["l2CategoryId"] = str(category.id)
-                # Set the parent category as well
-                category = category.parent
-            # Set the L1 category in both cases
-            params["l1CategoryId"] = str(category.id)
-
-        self.response = get_request(
-            "https://www.marktplaats.nl/lrp/api/search",
-            params=params,
-        )
+    @classmethod
+    def from_spec(cls, spec: SearchSpec, *, transport: Transport | None = None) -> Self:
+        """
+        Send the search query described by a spec.
 
-        # This catches HTTP 4xx and 5xx errors
-        self.response.raise_for_status()
+        Returns:
+            The executed query.
 
-        # But if it's something else non-200, still fail fast.
-        if self.response.status_code != 200:  # ruff:ignore[magic-value-comparison] HTTP status codes are a universal constant
-            msg = "Received non-200 status code:"
-            raise BadStatusCodeError(msg, self.response)
+        """
+        query = cls.__new__(cls)
+        query._execute(spec, transport)  # ruff:ignore[private-member-access] Same class
+        return query
+
+    def _execute(self, spec: SearchSpec, transport: Transport | None) -> None:
+        self.spec = spec
+        self.params = spec.to_params()
+        # Kept around because the API can return more listings than requested
+        self.limit = spec.limit
+        self.transport = transport
+
+        response = get_request(
+            SEARCH_URL,
+            params=self.params,
+            transport=transport,
+        )
+        _check_status(response)
+        # None once released
+        self.response: Response | None = response
 
         try:
-            self.body_json: QueryResponse = self.response.json()
-        except requests_JSONDecodeError as err:
+            # Decoded from the raw bytes, skipping requests' own text decoding
+            self.body_json: QueryResponse = timed_decode_json(
+                response.content,
+                Endpoint.SEARCH,
+            )
+        except ValueError as err:
             # Note: this is not the same error type. This will propagate as:
-            #  json.decoder.JSONDecodeError
-            #  -> requests.exceptions.JSONDecodeError
+            #  the JSON backend's error (a ValueError)
             #  -> marktplaats.JSONDecodeError
             msg = "Received invalid (non-json) response:"
-            raise JSONDecodeError(msg, self.response.text) from err
+            raise JSONDecodeError(msg, response.text) from err
 
         self._set_query_data()
 
@@ -260,56 +572,243 @@ class SearchQuery:
         # For now, this is a nice way to get the total result count
         #  when looping through pages.
         self.total_result_count = self.body_json.get("totalResultCount")
+        self._listing_count = len(self.body_json["listings"])
+
+    @cached_property
+    def listings(self) -> ListingsView:
+        """The listings on this page, parsed only when they're accessed."""
+        return ListingsView(self.body_json["listings"][: self.limit])
+
+    @cached_property
+    def _parsed_listings(self) -> list[Listing]:
+        return parse_listings(self.body_json, self.limit)
 
     def get_listings(self) -> list[Listing]:
-        listings = []
-        # Marktplaats pads small pages with extra listings (e.g. a limit=5
-        #  request sometimes returns 20). The first `limit` items are the actual page
-        #  window, so anything after that is cut off.
-        for listing in self.body_json["listings"][: self.limit]:
-            try:
-                listing_time = parse_date(listing["date"])
-            except ValueError:
-                logger.warning(
-                    "Marktplaats-py found an unknown date format for listing %s: '%s'. "
-                    "This is not your fault. "
-                    "Please create an issue on %s and include this log message.",
-                    listing["itemId"],
-                    listing["date"],
-                    ISSUE_LINK,
-                )
-                listing_time = None
-
-            try:
-                price_type = PriceType(listing["priceInfo"]["priceType"])
-            except ValueError:
-                # this means marktplaats has a PriceType this library doesn't know about
-                logger.warning(
-                    "Marktplaats-py found an unknown PriceType found for "
-                    "listing %s: '%s'. "
-                    "This is not your fault. "
-                    "Please create an issue on %s and include this log message.",
-                    listing["itemId"],
-                    listing["priceInfo"]["priceType"],
-                    ISSUE_LINK,
-                )
-                # set a fallback value
-                price_type = PriceType.UNKNOWN
-
-            listing_obj = Listing(
-                listing["itemId"],
-                listing["title"],
-                listing["description"],
-                listing_time,
-                ListingSeller.parse(listing["sellerInformation"]),
-                ListingLocation.parse(listing["location"]),
-                listing["priceInfo"]["priceCents"] / 100,
-                price_type,
-                "https://link.marktplaats.nl/" + listing["itemId"],
-                ListingFirstImage.parse(listing.get("pictures")),
-                listing["categoryId"],
-                listing.get("attributes", []),
-                listing.get("extendedAttributes", []),
-            )
-            listings.append(listing_obj)
-        return listings
+        # Parsed once; a copy is returned so changes don't leak into the cache
+        return list(self._parsed_listings)
+
+    def release(self) -> None:
+        """
+        Drop the response and the raw listings, keeping the parsed listings.
+
+        This frees most of the memory a page takes. get_listings(), the counts
+        and paging keep working, but afterwards response is None and listings
+        and body_json["listings"] are empty.
+        """
+        _ = self._parsed_listings  # Parses them while they're still there
+        self.__dict__.pop("listings", None)
+        self.body_json["listings"] = []
+        self.response = None
+
+    def _end_offset(self) -> int:
+        end = self.total_result_count or 0
+        # Marktplaats refuses to page past this, even when there are more results
+        max_page = self.body_json.get("maxAllowedPageNumber")
+        if max_page is not None:
+            end = min(end, max_page * self.limit)
+        return end
+
+    @property
+    def is_capped(self) -> bool:
+        """Whether there are more results than Marktplaats lets you page through."""
+        return (self.total_result_count or 0) > self._end_offset()
+
+    def _remaining_page_offsets(self) -> range:
+        if not self._listing_count:
+            # Nothing left, whatever the counts say
+            return range(0)
+        return range(
+            self.spec.offset + self.limit,
+            self._end_offset(),
+            self.limit,
+        )
+
+    def _page_at(self, offset: int) -> Self:
+        return self.from_spec(
+            replace(self.spec, offset=offset), transport=self.transport
+        )
+
+    def next_page(self) -> Self | None:
+        """
+        Fetch the next page of this query.
+
+        Returns:
+            The query for the next page, or None if this is the last page.
+
+        """
+        offsets = self._remaining_page_offsets()
+        return self._page_at(offsets[0]) if offsets else None
+
+    def iter_pages(self, *, prefetch: bool = False) -> Iterator[Self]:
+        """
+        Iterate over this page and all following pages.
+
+        Paging stops at totalResultCount or maxAllowedPageNumber, whichever
+        comes first. Only one page is kept in memory at a time. With prefetch,
+        the next page is fetched in the background while the current one is
+        being processed.
+
+        Yields:
+            The query for each page, starting with this one.
+
+        """
+        if not prefetch:
+            page: Self | None = self
+            while page is not None:
+                yield page
+                page = page.next_page()
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = self
+            while page is not None:
+                upcoming = executor.submit(page.next_page)
+                yield page
+                page = upcoming.result()
+
+    def iter_listings(self, *, prefetch: bool = False) -> Iterator[Listing]:
+        """
+        Iterate over the listings of this page and all following pages.
+
+        Every page is fetched with this query's limit (max 100),
+        so a bigger limit means fewer requests.
+
+        Yields:
+            Every listing, in the order Marktplaats returns them.
+
+        """
+        for page in self.iter_pages(prefetch=prefetch):
+            yield from page.get_listings()
+
+    def fetch_all(self, *, max_workers: int = 8) -> list[Listing]:
+        """
+        Fetch the listings of this page and all following pages concurrently.
+
+        The remaining pages are known from this page's totalResultCount and
+        maxAllowedPageNumber, so they are fetched in parallel on at most
+        max_workers threads. Keep in mind that all listings end up in memory;
+        use iter_listings() to go through them one page at a time instead.
+
+        Returns:
+            The listings of all pages in order, without the duplicates
+            Marktplaats pads pages with.
+
+        """
+        listings: dict[str, Listing] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pages = executor.map(self._page_at, self._remaining_page_offsets())
+            for page in chain([self], pages):
+                for listing in page.get_listings():
+                    listings.setdefault(listing.id, listing)
+        return list(listings.values())
+
+
+class ListingStream:
+    """
+    The listings of a search, parsed while the response comes in.
+
+    The request is sent when the stream is created, but the body is only read
+    while iterating over the stream. Every listing is yielded as soon as it has
+    been received, and the whole body is never in memory at once. Once all
+    listings have been read, total_result_count and body_json (without the
+    listings) are set, and the response is released. A stream can only be
+    iterated over once. When stopping early, close() it, or use it as a
+    context manager, to release the connection.
+
+    Raises a requests.HTTPError if the request fails.
+    """
+
+    def __init__(
+        self,
+        spec: SearchSpec,
+        *,
+        transport: Transport | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.spec = spec
+        self.limit = spec.limit
+        self.chunk_size = chunk_size
+        self.total_result_count: int | None = None
+        self.body_json: QueryResponse | None = None
+
+        response = get_request(
+            SEARCH_URL,
+            params=spec.to_params(),
+            transport=transport,
+            stream=True,
+        )
+        try:
+            _check_status(response)
+        except:
+            response.close()
+            raise
+        # None once the body has been read
+        self.response: Response | None = response
+
+    def __iter__(self) -> Iterator[Listing]:
+        today = date.today()
+        for listing in self.raw_listings():
+            yield parse_listing(listing, today=today)
+
+    def raw_listings(self) -> Iterator[ListingResponse]:
+        """
+        Iterate over the listings as they are in the response, without parsing.
+
+        Like iterating over the stream itself, this can only be done once.
+
+        Yields:
+            Every listing as a dict, up to the limit.
+
+        """
+        if self.response is None:
+            return
+        parser = ListingsParser()
+        count = 0
+        try:
+            for chunk in self.response.iter_content(self.chunk_size):
+                for listing in self._feed(parser, chunk):
+                    # Like parse_listings(), leaves out the padding after the limit
+                    if count < self.limit:
+                        count += 1
+                        yield listing
+            self.body_json = self._feed(parser, None)
+        finally:
+            self.close()
+        self.total_result_count = self.body_json.get("totalResultCount")
+
+    @overload
+    @staticmethod
+    def _feed(parser: ListingsParser, chunk: bytes) -> list[ListingResponse]: ...
+
+    @overload
+    @staticmethod
+    def _feed(parser: ListingsParser, chunk: None) -> QueryResponse: ...
+
+    @staticmethod
+    def _feed(
+        parser: ListingsParser,
+        chunk: bytes | None,
+    ) -> list[ListingResponse] | QueryResponse:
+        # Feeds the parser a chunk, or closes it when there are no chunks left
+        try:
+            return parser.close() if chunk is None else parser.feed(chunk)
+        except ValueError as err:
+            msg = "Received invalid (non-json) response:"
+            raise JSONDecodeError(msg, err) from err
+
+    def close(self) -> None:
+        """Release the response, without reading the rest of it."""
+        if self.response is not None:
+            self.response.close()
+            self.response = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
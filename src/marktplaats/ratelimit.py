@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
+
+from marktplaats.endpoints import Endpoint, endpoint_for_url
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+
+# Requests per second. Conservative guesses: the adaptive throttling finds out
+#  what Marktplaats actually accepts, but never goes above these.
+DEFAULT_RATES: Mapping[Endpoint, float] = {
+    Endpoint.SEARCH: 5,
+    Endpoint.SELLER_PROFILE: 10,
+    Endpoint.SELLER_LISTINGS: 5,
+    Endpoint.LISTING_PAGE: 10,
+    Endpoint.OTHER: 5,
+}
+
+# Marktplaats answers with these when it wants us to slow down
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header, which is either a number of seconds or a date.
+
+    Returns:
+        The number of seconds to wait, or None if there's no valid header.
+
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        until = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if until.tzinfo is None:
+        until = until.replace(tzinfo=timezone.utc)
+    return max(0.0, (until - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket, refilled at rate tokens per second up to burst.
+
+    Tokens are reserved rather than waited for: reserve() always takes a token
+    and returns how long the caller has to wait before using it. That way the
+    lock is never held while waiting, and threads and asyncio tasks can share
+    a bucket.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = burst
+        # Tokens are only added after this moment, which can be in the future
+        #  when the bucket is paused.
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            elapsed = now - self._updated
+            self._tokens = min(self.burst, self._tokens + elapsed * self._rate)
+            self._updated = now
+
+    def set_rate(self, rate: float) -> None:
+        with self._lock:
+            # Everything up to now is refilled at the old rate
+            self._refill(self._clock())
+            self._rate = rate
+
+    def pause(self, seconds: float) -> None:
+        """Don't hand out tokens for the coming seconds, like Retry-After asks."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0)
+            self._updated = max(self._updated, now + seconds)
+
+    def reserve(self) -> float:
+        """
+        Take a token.
+
+        Returns:
+            The number of seconds to wait before the token may be used.
+
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1
+            return max(0.0, self._updated - now) + max(0.0, -self._tokens) / self._rate
+
+
+class RateLimiter:
+    """
+    Paces the requests to every endpoint, and backs off when asked to.
+
+    Each endpoint has its own token bucket. The rates are the maximum number of
+    requests per second; bursts of up to a second's worth of requests are
+    allowed. Share one RateLimiter between transports (threads and asyncio) to
+    share the budgets.
+
+    When Marktplaats answers with 429 or 503, the endpoint's rate is halved
+    (down to min_fraction of its maximum) and a Retry-After header is obeyed.
+    Every successful response raises the rate again by recovery_step of its
+    maximum, so it ramps back up once the pressure is off.
+    """
+
+    def __init__(  # ruff:ignore[too-many-arguments] All configuration is keyword-only
+        self,
+        rates: Mapping[Endpoint, float] | None = None,
+        *,
+        backoff_factor: float = 0.5,
+        recovery_step: float = 0.05,
+        min_fraction: float = 0.05,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.max_rates = {**DEFAULT_RATES, **(rates or {})}
+        self.backoff_factor = backoff_factor
+        self.recovery_step = recovery_step
+        self.min_fraction = min_fraction
+        self._sleep = sleep
+        self._buckets = {
+            endpoint: TokenBucket(rate, max(1.0, rate), clock=clock)
+            for endpoint, rate in self.max_rates.items()
+        }
+        self._lock = threading.Lock()
+
+    def rate(self, endpoint: Endpoint) -> float:
+        """
+        Get the current rate of an endpoint, which is lower while backing off.
+
+        Returns:
+            The number of requests per second.
+
+        """
+        return self._buckets[endpoint].rate
+
+    def reserve(self, url: str) -> float:
+        """
+        Reserve a request to a URL.
+
+        Returns:
+            The number of seconds to wait before sending it.
+
+        """
+        return self._buckets[endpoint_for_url(url)].reserve()
+
+    def acquire(self, url: str) -> None:
+        """Wait until a request to the URL may be sent."""
+        delay = self.reserve(url)
+        if delay > 0:
+            self._sleep(delay)
+
+    async def acquire_async(self, url: str) -> None:
+        """Wait until a request to the URL may be sent, without blocking the loop."""
+        delay = self.reserve(url)
+        if delay > 0:
+            import asyncio  # ruff:ignore[import-outside-top-level] Only loaded by async users
+
+            await asyncio.sleep(delay)
+
+    def record(self, url: str, status_code: int, retry_after: str | None) -> None:
+        """Adapt the rate of the URL's endpoint to a response."""
+        endpoint = endpoint_for_url(url)
+        bucket = self._buckets[endpoint]
+        max_rate = self.max_rates[endpoint]
+        min_rate = max_rate * self.min_fraction
+        with self._lock:
+            if status_code in THROTTLE_STATUS_CODES:
+                rate = max(bucket.rate * self.backoff_factor, min_rate)
+            elif status_code < 400:  # ruff:ignore[magic-value-comparison] HTTP status codes are a universal constant
+                rate = min(max_rate, bucket.rate + max_rate * self.recovery_step)
+            else:
+                return
+            if rate != bucket.rate:
+                bucket.set_rate(rate)
+
+        if status_code in THROTTLE_STATUS_CODES:
+            delay = parse_retry_after(retry_after)
+            if delay:
+                bucket.pause(delay)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from marktplaats.instrumentation import active_instrumentation
+from marktplaats.ratelimit import parse_retry_after
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+logger = logging.getLogger(__name__)
+
+# Gateway errors and throttling are worth another try, other errors aren't
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class RetryEvent:
+    """Passed to RetryPolicy.on_retry before every retry."""
+
+    url: str
+    attempt: int  # The attempt that failed, starting at 1
+    delay: float  # Seconds until the next attempt
+    status_code: int | None = None  # Set if the response had a retryable status
+    error: BaseException | None = None  # Set if the request raised
+
+
+@dataclass
+class RetryCount:
+    """The retries of one request, counted by the transport while it's sent."""
+
+    retries: int = 0
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    When and how often a transport retries a failed request.
+
+    A request is retried when it raises one of exceptions, or gets a response
+    with one of status_codes, up to max_attempts attempts in total. Without
+    exceptions, the transport's network errors (connection errors and
+    timeouts) are retried.
+
+    The n-th retry waits a random time up to backoff * 2 ** (n - 1) seconds,
+    capped at max_backoff ("full jitter"), or as long as Retry-After asks if
+    that's longer. No retry is started that would end after deadline seconds
+    since the first attempt. After the last attempt, the last response is
+    returned or the last exception raised, as without a retry policy.
+    """
+
+    max_attempts: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 30
+    jitter: bool = True
+    status_codes: frozenset[int] = RETRY_STATUS_CODES
+    exceptions: tuple[type[BaseException], ...] | None = None
+    deadline: float | None = None
+    on_retry: Callable[[RetryEvent], None] | None = field(default=None, compare=False)
+    clock: Callable[[], float] = field(
+        default=time.monotonic,
+        repr=False,
+        compare=False,
+    )
+    sleep: Callable[[float], None] = field(
+        default=time.sleep,
+        repr=False,
+        compare=False,
+    )
+
+    def backoff_for(self, attempt: int) -> float:
+        """
+        Get the time to wait after a failed attempt.
+
+        Returns:
+            The number of seconds to wait before the next attempt.
+
+        """
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay  # ruff:ignore[suspicious-non-cryptographic-random-usage] Only for jitter
+
+    def next_delay(  # ruff:ignore[too-many-arguments] Describes the failed attempt
+        self,
+        url: str,
+        attempt: int,
+        started: float,
+        *,
+        status_code: int | None = None,
+        retry_after: str | None = None,
+        error: BaseException | None = None,
+    ) -> float | None:
+        """
+        Decide whether to retry a failed attempt, and report it if so.
+
+        Returns:
+            The number of seconds to wait before retrying, or None to give up.
+
+        """
+        if attempt >= self.max_attempts:
+            return None
+        delay = max(self.backoff_for(attempt), parse_retry_after(retry_after) or 0)
+        if self.deadline is not None and (
+            self.clock() + delay - started > self.deadline
+        ):
+            return None
+
+        logger.debug(
+            "Retrying %s in %.2f seconds after attempt %d failed (%s)",
+            url,
+            delay,
+            attempt,
+            error or status_code,
+        )
+        instrumentation = active_instrumentation()
+        if self.on_retry is not None or instrumentation is not None:
+            event = RetryEvent(url, attempt, delay, status_code, error)
+            if self.on_retry is not None:
+                self.on_retry(event)
+            if instrumentation is not None:
+                instrumentation.request_retried(event)
+        return delay
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from marktplaats.query import SearchQuery
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from marktplaats.query import SearchSpec
+    from marktplaats.transport import Transport
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class ScheduledSearch:
+    """
+    One upstream search, shared by all subscriptions with an identical spec.
+
+    It runs at the shortest interval and highest priority of its subscribers.
+    """
+
+    spec: SearchSpec
+    added_at: float
+    next_run: float
+    subscribers: dict[Callable[[SearchQuery], None], tuple[float, int]] = field(
+        default_factory=dict,
+    )  # The interval and priority every subscriber asked for
+    runs: int = 0
+    failures: int = 0
+    last_latency: float | None = None  # Seconds the last request took
+    last_success: float | None = None
+    last_error: BaseException | None = None
+
+    @property
+    def interval(self) -> float:
+        return min(interval for interval, _ in self.subscribers.values())
+
+    @property
+    def priority(self) -> int:
+        return max(priority for _, priority in self.subscribers.values())
+
+
+@dataclass(frozen=True)
+class ScheduledSearchStats:
+    """A snapshot of how a scheduled search is doing."""
+
+    spec: SearchSpec
+    subscribers: int
+    interval: float
+    priority: int
+    runs: int
+    failures: int
+    last_latency: float | None
+    # Seconds since the results were last refreshed, or since it was added
+    staleness: float
+
+
+class SearchScheduler:
+    """
+    Runs many saved searches, each at its own interval, in one process.
+
+    All searches share one transport, so they share its connection pool and,
+    when it has one, its rate limiter. Identical searches are coalesced into a
+    single request, of which every subscriber gets the result. The first run of
+    each search is spread over its interval, so searches added together don't
+    all run at once. When several are due, higher priorities go first.
+
+    Failed searches are counted and logged, and retried at their next run.
+    """
+
+    def __init__(
+        self,
+        *,
+        transport: Transport | None = None,
+        max_workers: int = 8,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.transport = transport
+        self.max_workers = max_workers
+        self._clock = clock
+        self._searches: dict[str, ScheduledSearch] = {}
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        spec: SearchSpec,
+        callback: Callable[[SearchQuery], None],
+        *,
+        interval: float,
+        priority: int = 0,
+    ) -> ScheduledSearch:
+        """
+        Run a search every interval seconds, and pass the results to callback.
+
+        Returns:
+            The scheduled search, which may be shared with other subscribers.
+
+        """
+        key = spec.cache_key
+        with self._lock:
+            search = self._searches.get(key)
+            if search is None:
+                now = self._clock()
+                # A stable offset within the interval, to spread the searches
+                offset = zlib.crc32(key.encode()) / 2**32 * interval
+                search = ScheduledSearch(spec, now, now + offset)
+                self._searches[key] = search
+            search.subscribers[callback] = (interval, priority)
+            search.next_run = min(search.next_run, search.added_at + interval)
+            return search
+
+    def remove(self, spec: SearchSpec, callback: Callable[[SearchQuery], None]) -> None:
+        """Stop passing the results of a search to callback."""
+        key = spec.cache_key
+        with self._lock:
+            search = self._searches.get(key)
+            if search is None:
+                return
+            search.subscribers.pop(callback, None)
+            if not search.subscribers:
+                del self._searches[key]
+
+    def _due(self) -> list[ScheduledSearch]:
+        now = self._clock()
+        with self._lock:
+            due = sorted(
+                (
+                    search
+                    for search in self._searches.values()
+                    if search.next_run <= now
+                ),
+                key=lambda search: (-search.priority, search.next_run),
+            )
+            for search in due:
+                # Skip runs that were missed, instead of running them all at once.
+                #  Whole intervals, so the searches stay spread over the interval.
+                missed = (now - search.next_run) // search.interval
+                search.next_run += (missed + 1) * search.interval
+        return due
+
+    def _run(self, search: ScheduledSearch) -> None:
+        started = self._clock()
+        search.runs += 1
+        try:
+            query = SearchQuery.from_spec(search.spec, transport=self.transport)
+        except Exception as err:  # ruff:ignore[blind-except] One failed search mustn't stop the others
+            search.failures += 1
+            search.last_error = err
+            logger.warning("Scheduled search %s failed: %r", search.spec, err)
+            return
+        search.last_latency = self._clock() - started
+        search.last_success = self._clock()
+
+        for callback in list(search.subscribers):
+            self._notify(search, callback, query)
+
+    @staticmethod
+    def _notify(
+        search: ScheduledSearch,
+        callback: Callable[[SearchQuery], None],
+        query: SearchQuery,
+    ) -> None:
+        try:
+            callback(query)
+        except Exception:  # Neither must a failing subscriber
+            logger.exception("Subscriber of scheduled search %s failed", search.spec)
+
+    def run_pending(self) -> int:
+        """
+        Run the searches that are due, highest priority first.
+
+        Returns:
+            The number of searches that were run.
+
+        """
+        due = self._due()
+        if due:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # Consumed to wait for them all
+                list(executor.map(self._run, due))
+        return len(due)
+
+    def seconds_until_next_run(self) -> float | None:
+        """
+        Get the time until the next search is due.
+
+        Returns:
+            The number of seconds, or None if there are no searches.
+
+        """
+        with self._lock:
+            if not self._searches:
+                return None
+            next_run = min(search.next_run for search in self._searches.values())
+        return max(0.0, next_run - self._clock())
+
+    def run(self, stop: threading.Event | None = None) -> None:
+        """Keep running searches when they're due, until stop is set."""
+        if stop is None:
+            stop = threading.Event()
+        while not stop.is_set():
+            self.run_pending()
+            # Checks again every second, for searches that were added meanwhile
+            delay = self.seconds_until_next_run()
+            stop.wait(1.0 if delay is None else min(delay, 1.0))
+
+    def stats(self) -> list[ScheduledSearchStats]:
+        """
+        Get the latency and staleness of every scheduled search.
+
+        Returns:
+            A snapshot per scheduled search.
+
+        """
+        now = self._clock()
+        with self._lock:
+            return [
+                ScheduledSearchStats(
+                    search.spec,
+                    len(search.subscribers),
+                    search.interval,
+                    search.priority,
+                    search.runs,
+                    search.failures,
+                    search.last_latency,
+                    now
+                    - (
+                        search.added_at
+                        if search.last_success is None
+                        else search.last_success
+                    ),
+                )
+                for search in self._searches.values()
+            ]
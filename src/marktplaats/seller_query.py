@@ -2,18 +2,30 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from marktplaats.endpoints import SELLER_LISTINGS_URL, SELLER_PROFILE_URL, Endpoint
+from marktplaats.instrumentation import timed_decode_json
 from marktplaats.utils import get_request
 
 
 if TYPE_CHECKING:
     from marktplaats.api_types import SellerDetailsResponse, SellerListingsResponse
+    from marktplaats.transport import Transport
+
+
+def seller_listings_params(seller_id: int) -> dict[str, int | str]:
+    return {
+        "sellerId": seller_id,
+        "itemId": "m0123456789",  # Any item ID will do.
+        "l2CategoryId": "1",  # Any L2 category ID will do.
+    }
 
 
 class SellerQuery:
     """Query a seller."""
 
-    def __init__(self, seller_id: int) -> None:
+    def __init__(self, seller_id: int, *, transport: Transport | None = None) -> None:
         self.seller_id = seller_id
+        self.transport = transport
         self._listings_raw: SellerListingsResponse | None = None
         self._details_raw: SellerDetailsResponse | None = None
 
@@ -26,10 +38,10 @@ class SellerQuery:
 
         """
         if self._details_raw is None:
-            url = f"https://www.marktplaats.nl/v/api/seller-profile/{self.seller_id}"
-            res = get_request(url)
+            url = SELLER_PROFILE_URL.format(seller_id=self.seller_id)
+            res = get_request(url, transport=self.transport)
             res.raise_for_status()
-            payload = res.json()
+            payload = timed_decode_json(res.content, Endpoint.SELLER_PROFILE)
             self._details_raw = payload
         return self._details_raw
 
@@ -42,14 +54,9 @@ class SellerQuery:
 
         """
         if self._listings_raw is None:
-            url = "https://www.marktplaats.nl/v/api/seller-other-items"
-            params = {
-                "sellerId": self.seller_id,
-                "itemId": "m0123456789",  # Any item ID will do.
-                "l2CategoryId": "1",  # Any L2 category ID will do.
-            }
-            res = get_request(url, params)
+            params = seller_listings_params(self.seller_id)
+            res = get_request(SELLER_LISTINGS_URL, params, transport=self.transport)
             res.raise_for_status()
-            payload = res.json()
+            payload = timed_decode_json(res.content, Endpoint.SELLER_LISTINGS)
             self._listings_raw = payload
         return self._listings_raw
@@ -0,0 +1,458 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from marktplaats.categories import L1Category, get_subcategories
+from marktplaats.models.price_type import PriceType
+from marktplaats.parsing import parse_listing_date, parse_price_type
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from marktplaats.api_types.search import Listing as ListingResponse
+    from marktplaats.categories import L2Category
+    from marktplaats.query import SearchQuery
+
+
+_SCHEMA = (
+    (
+        "CREATE TABLE IF NOT EXISTS listings ("
+        "id TEXT PRIMARY KEY, "
+        "title TEXT NOT NULL, "
+        "price_cents INTEGER NOT NULL, "
+        "price_type TEXT NOT NULL, "
+        "date TEXT, "
+        "seller_id INTEGER NOT NULL, "
+        "category_id INTEGER NOT NULL, "
+        "city TEXT, "
+        "latitude REAL, "
+        "longitude REAL, "
+        "first_seen REAL NOT NULL, "
+        "last_seen REAL NOT NULL, "
+        "active INTEGER NOT NULL)"
+    ),
+    "CREATE INDEX IF NOT EXISTS listings_category_id ON listings (category_id)",
+    "CREATE INDEX IF NOT EXISTS listings_seller_id ON listings (seller_id)",
+    "CREATE INDEX IF NOT EXISTS listings_date ON listings (date)",
+    "CREATE INDEX IF NOT EXISTS listings_last_seen ON listings (last_seen)",
+    # Every change of every listing, both of its price and of its status
+    (
+        "CREATE TABLE IF NOT EXISTS history ("
+        "id TEXT NOT NULL, "
+        "kind TEXT NOT NULL, "
+        "at REAL NOT NULL, "
+        "old_price_cents INTEGER, "
+        "price_cents INTEGER)"
+    ),
+    "CREATE INDEX IF NOT EXISTS history_at ON history (at)",
+    "CREATE INDEX IF NOT EXISTS history_id ON history (id, at)",
+)
+
+# The listings of an ingest, compared with the stored ones in a single query
+_INCOMING = (
+    "CREATE TEMP TABLE IF NOT EXISTS incoming ("
+    "id TEXT PRIMARY KEY, "
+    "title TEXT NOT NULL, "
+    "price_cents INTEGER NOT NULL, "
+    "price_type TEXT NOT NULL, "
+    "date TEXT, "
+    "seller_id INTEGER NOT NULL, "
+    "category_id INTEGER NOT NULL, "
+    "city TEXT, "
+    "latitude REAL, "
+    "longitude REAL)"
+)
+
+_LISTING_COLUMNS = (
+    "id, title, price_cents, price_type, date, seller_id, category_id, "
+    "city, latitude, longitude"
+)
+
+
+class ChangeKind(Enum):
+    NEW = "new"
+    PRICE_CHANGED = "price_changed"
+    GONE = "gone"  # No longer seen
+    RETURNED = "returned"  # Seen again after it was gone
+
+
+@dataclass(frozen=True)
+class ListingChange:
+    """A change of a stored listing, as recorded in its history."""
+
+    id: str
+    kind: ChangeKind
+    at: datetime
+    old_price_cents: int | None  # Only for price changes
+    price_cents: int | None  # The price after the change, None if it's gone
+
+
+@dataclass(frozen=True)
+class StoredListing:
+    """A listing as it was last seen."""
+
+    id: str
+    title: str
+    price_cents: int
+    price_type: PriceType
+    date: date | None
+    seller_id: int
+    category_id: int
+    city: str | None
+    latitude: float | None
+    longitude: float | None
+    first_seen: datetime
+    last_seen: datetime
+    active: bool  # False once it's gone
+
+
+def _datetime(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, timezone.utc)
+
+
+def _row(listing: ListingResponse, today: date) -> tuple[object, ...]:
+    listing_date = parse_listing_date(listing, today)
+    location = listing["location"]
+    return (
+        listing["itemId"],
+        listing["title"],
+        listing["priceInfo"]["priceCents"],
+        parse_price_type(listing).value,
+        listing_date.isoformat() if listing_date is not None else None,
+        listing["sellerInformation"]["sellerId"],
+        listing["categoryId"],
+        location.get("cityName"),
+        location["latitude"] or None,
+        location["longitude"] or None,
+    )
+
+
+def _category_ids(category: L1Category | L2Category) -> list[int]:
+    # Listings are in L2 categories, so an L1 category stands for its children
+    if isinstance(category, L1Category):
+        return [category.id, *(child.id for child in get_subcategories(category))]
+    return [category.id]
+
+
+class ListingStore:
+    """
+    Keeps the listings of searches in an SQLite database, across runs.
+
+    Ingesting listings adds the new ones and updates the ones that are
+    already stored, recording every new listing and price change in their
+    history. Listings that haven't been seen for a while are marked as gone
+    with mark_gone(), and come back when they're seen again. Listings are
+    ingested in a single transaction per call, so ingesting many at once is
+    a lot faster than ingesting them one by one.
+
+    Several processes can share the same database file.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        clock: Callable[[], float] = time.time,  # Wall clock, to survive restarts
+    ) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            # Safe with WAL: a crash can only lose the last transactions
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                self._connection.execute(statement)
+
+    def ingest(self, listings: Iterable[ListingResponse]) -> list[ListingChange]:
+        """
+        Add or update listings, as they are in search responses.
+
+        Keep in mind that Marktplaats pads small pages with extra listings, so
+        only pass the first `limit` listings of a response to leave those out.
+        When a listing is passed more than once, the last one counts.
+
+        Returns:
+            The changes: new listings, listings that came back and price
+            changes.
+
+        """
+        today = date.today()
+        rows = [_row(listing, today) for listing in listings]
+        now = self._clock()
+        with self._lock, self._connection:
+            connection = self._connection
+            connection.execute(_INCOMING)
+            connection.execute("DELETE FROM incoming")
+            connection.executemany(
+                f"INSERT OR REPLACE INTO incoming ({_LISTING_COLUMNS}) "  # ruff:ignore[hardcoded-sql-expression] Constant columns
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            changes = connection.execute(
+                "SELECT incoming.id, CASE "
+                "WHEN listings.id IS NULL THEN 'new' "
+                "WHEN NOT listings.active THEN 'returned' "
+                "ELSE 'price_changed' END, "
+                "listings.price_cents, incoming.price_cents "
+                "FROM incoming LEFT JOIN listings ON listings.id = incoming.id "
+                "WHERE listings.id IS NULL OR NOT listings.active "
+                "OR listings.price_cents != incoming.price_cents "
+                "ORDER BY incoming.rowid"
+            ).fetchall()
+            # A listing that came back with another price changed twice
+            history = []
+            for id_, kind, old_price_cents, price_cents in changes:
+                if kind != ChangeKind.PRICE_CHANGED.value:
+                    history.append((id_, kind, now, None, price_cents))
+                if old_price_cents is not None and old_price_cents != price_cents:
+                    history.append(
+                        (
+                            id_,
+                            ChangeKind.PRICE_CHANGED.value,
+                            now,
+                            old_price_cents,
+                            price_cents,
+                        ),
+                    )
+            connection.executemany(
+                "INSERT INTO history VALUES (?, ?, ?, ?, ?)",
+                history,
+            )
+            connection.execute(
+                f"INSERT INTO listings SELECT {_LISTING_COLUMNS}, ?, ?, 1 "  # ruff:ignore[hardcoded-sql-expression] Constant columns
+                "FROM incoming WHERE true ON CONFLICT (id) DO UPDATE SET "
+                "title = excluded.title, "
+                "price_cents = excluded.price_cents, "
+                "price_type = excluded.price_type, "
+                "date = excluded.date, "
+                "seller_id = excluded.seller_id, "
+                "category_id = excluded.category_id, "
+                "city = excluded.city, "
+                "latitude = excluded.latitude, "
+                "longitude = excluded.longitude, "
+                "last_seen = excluded.last_seen, "
+                "active = 1",
+                (now, now),
+            )
+            connection.execute("DELETE FROM incoming")
+        return [
+            ListingChange(
+                id_,
+                ChangeKind(kind),
+                _datetime(now),
+                old_price_cents,
+                price_cents,
+            )
+            for id_, kind, _, old_price_cents, price_cents in history
+        ]
+
+    def ingest_query(self, query: SearchQuery) -> list[ListingChange]:
+        """
+        Add or update the listings of a search, without its padding.
+
+        The query mustn't have been released yet.
+
+        Returns:
+            The changes, like ingest().
+
+        """
+        return self.ingest(query.body_json["listings"][: query.limit])
+
+    def mark_gone(
+        self,
+        not_seen_since: datetime,
+        *,
+        category: L1Category | L2Category | None = None,
+    ) -> list[ListingChange]:
+        """
+        Mark the listings that haven't been seen since a moment as gone.
+
+        Only the listings in a category are marked with category, e.g. when
+        only the searches in that category have been ingested since.
+
+        Returns:
+            The listings that are gone now.
+
+        """
+        query = "SELECT id FROM listings WHERE active AND last_seen < ?"
+        params: list[object] = [not_seen_since.timestamp()]
+        if category is not None:
+            ids = _category_ids(category)
+            query += f" AND category_id IN ({', '.join('?' * len(ids))})"
+            params += ids
+        now = self._clock()
+        with self._lock, self._connection:
+            gone = [id_ for (id_,) in self._connection.execute(query, params)]
+            self._connection.executemany(
+                "UPDATE listings SET active = 0 WHERE id = ?",
+                [(id_,) for id_ in gone],
+            )
+            self._connection.executemany(
+                "INSERT INTO history VALUES (?, ?, ?, NULL, NULL)",
+                [(id_, ChangeKind.GONE.value, now) for id_ in gone],
+            )
+        return [
+            ListingChange(id_, ChangeKind.GONE, _datetime(now), None, None)
+            for id_ in gone
+        ]
+
+    def get(self, id_: str) -> StoredListing | None:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT {_LISTING_COLUMNS}, first_seen, last_seen, active "  # ruff:ignore[hardcoded-sql-expression] Constant columns
+                "FROM listings WHERE id = ?",
+                (id_,),
+            ).fetchone()
+        if row is None:
+            return None
+        (
+            id_,
+            title,
+            price_cents,
+            price_type,
+            listing_date,
+            seller_id,
+            category_id,
+            city,
+            latitude,
+            longitude,
+            first_seen,
+            last_seen,
+            active,
+        ) = row
+        return StoredListing(
+            id_,
+            title,
+            price_cents,
+            PriceType(price_type),
+            date.fromisoformat(listing_date) if listing_date is not None else None,
+            seller_id,
+            category_id,
+            city,
+            latitude,
+            longitude,
+            _datetime(first_seen),
+            _datetime(last_seen),
+            bool(active),
+        )
+
+    def history(self, id_: str) -> list[ListingChange]:
+        """
+        Get the history of a listing.
+
+        Returns:
+            Its changes, oldest first.
+
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, kind, at, old_price_cents, price_cents "
+                "FROM history WHERE id = ? ORDER BY at, rowid",
+                (id_,),
+            ).fetchall()
+        return [self._change(row) for row in rows]
+
+    def changes(
+        self,
+        since: datetime,
+        *,
+        kind: ChangeKind | None = None,
+        category: L1Category | L2Category | None = None,
+        seller_id: int | None = None,
+        price_drops_only: bool = False,
+    ) -> list[ListingChange]:
+        """
+        Get the changes of all listings since a moment.
+
+        They can be filtered by their kind and by the category or the seller
+        of their listing. With price_drops_only, only price changes to a
+        lower price are returned.
+
+        Returns:
+            The changes, oldest first.
+
+        """
+        query = (
+            "SELECT history.id, history.kind, history.at, "
+            "history.old_price_cents, history.price_cents "
+            "FROM history JOIN listings ON listings.id = history.id "
+            "WHERE history.at >= ?"
+        )
+        params: list[object] = [since.timestamp()]
+        if price_drops_only:
+            kind = ChangeKind.PRICE_CHANGED
+            query += " AND history.price_cents < history.old_price_cents"
+        if kind is not None:
+            query += " AND history.kind = ?"
+            params.append(kind.value)
+        if category is not None:
+            ids = _category_ids(category)
+            query += f" AND listings.category_id IN ({', '.join('?' * len(ids))})"
+            params += ids
+        if seller_id is not None:
+            query += " AND listings.seller_id = ?"
+            params.append(seller_id)
+        query += " ORDER BY history.at, history.rowid"
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+        return [self._change(row) for row in rows]
+
+    def price_drops(
+        self,
+        since: datetime,
+        *,
+        category: L1Category | L2Category | None = None,
+    ) -> list[ListingChange]:
+        """
+        Get the price drops since a moment, e.g. of the last 24 hours.
+
+        Returns:
+            The price changes to a lower price, oldest first.
+
+        """
+        return self.changes(since, category=category, price_drops_only=True)
+
+    @staticmethod
+    def _change(row: tuple[str, str, float, int | None, int | None]) -> ListingChange:
+        id_, kind, at, old_price_cents, price_cents = row
+        return ListingChange(
+            id_,
+            ChangeKind(kind),
+            _datetime(at),
+            old_price_cents,
+            price_cents,
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM listings"
+            ).fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import TYPE_CHECKING
+
+from marktplaats.decoding import decode_json
+
+
+if TYPE_CHECKING:
+    from marktplaats.api_types import QueryResponse
+    from marktplaats.api_types.search import Listing as ListingResponse
+
+
+# Everything up to the next bracket, skipping over whole strings. A string
+#  that isn't complete yet stops it at its opening quote.
+_SKIP = re.compile(rb'(?:[^"\[\]{}\\]+|"(?:[^"\\]|\\.)*")*')
+_LISTINGS_KEY = re.compile(rb'"listings"\s*:\s*$')
+_BETWEEN_LISTINGS = re.compile(r"[\s,]*")
+
+_OPENING = frozenset(b"[{")
+_BRACKETS = frozenset(b"[]{}")
+
+# Decodes a single listing and tells where it ends, straight from the body
+_decoder = json.JSONDecoder()
+
+
+class ListingsParser:
+    """
+    Parses a search response body incrementally, as its chunks come in.
+
+    Every listing is decoded as soon as its last byte has been fed, so it can be
+    used before the rest of the body has even been received. Only the listing
+    being received is buffered; the rest of the body, which holds the counts,
+    is collected without the listings and decoded by close().
+    """
+
+    def __init__(self) -> None:
+        # Before and after the listings
+        self._buffer = bytearray()
+        self._pos = 0  # Where scanning the buffer continues
+        self._depth = 0
+        self._rest = bytearray()
+        # In the listings
+        self._in_listings = False
+        self._listings_done = False
+        self._text = ""
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+
+    def feed(self, chunk: bytes) -> list[ListingResponse]:
+        """
+        Feed the next chunk of the body.
+
+        Returns:
+            The listings that were completed by this chunk.
+
+        """
+        if self._listings_done:
+            self._rest += chunk
+            return []
+        if not self._in_listings:
+            self._buffer += chunk
+            if not self._find_listings():
+                return []
+            chunk = bytes(self._buffer)
+            self._buffer = bytearray()
+        return self._parse_listings(chunk)
+
+    def _find_listings(self) -> bool:
+        # Returns whether the listings were found, and moves the buffer past them
+        buffer = self._buffer
+        pos = self._pos
+        while True:
+            skipped = _SKIP.match(buffer, pos)
+            assert skipped is not None  # ruff:ignore[assert] It matches the empty string
+            if skipped.end() == len(buffer) or buffer[skipped.end()] not in _BRACKETS:
+                # Needs more data. Scanned again from the start once it's there,
+                #  as it may hold the key of the listings.
+                self._pos = pos
+                return False
+            pos = skipped.end()
+            if buffer[pos] not in _OPENING:
+                self._depth -= 1
+            else:
+                self._depth += 1
+                if self._depth == 2 and _LISTINGS_KEY.search(  # ruff:ignore[magic-value-comparison] The listings, in the body
+                    buffer, skipped.start(), pos
+                ):
+                    self._in_listings = True
+                    self._rest += buffer[: pos + 1]
+                    del buffer[: pos + 1]
+                    return True
+            pos += 1
+
+    def _parse_listings(self, chunk: bytes) -> list[ListingResponse]:
+        text = self._text + self._utf8.decode(chunk)
+        listings: list[ListingResponse] = []
+        pos = 0
+        while True:
+            pos = _BETWEEN_LISTINGS.match(text, pos).end()  # type: ignore[union-attr] # It matches the empty string
+            if pos == len(text):
+                break
+            if text[pos] == "]":
+                # The rest of the body is only decoded by close()
+                self._in_listings = False
+                self._listings_done = True
+                self._rest += text[pos:].encode() + self._utf8.getstate()[0]
+                text = ""
+                pos = 0
+                break
+            try:
+                listing, pos = _decoder.raw_decode(text, pos)
+            except ValueError:
+                break  # Not complete yet, or invalid, in which case close() fails
+            listings.append(listing)
+        self._text = text[pos:]
+        return listings
+
+    def close(self) -> QueryResponse:
+        """
+        Finish parsing, once the whole body has been fed.
+
+        Returns:
+            The body, with empty listings.
+
+        Raises:
+            ValueError: If the body isn't complete or isn't valid JSON.
+
+        """
+        if self._in_listings:
+            msg = "Response body ended in the listings, or has an invalid listing"
+            raise ValueError(msg)
+        rest = bytes(self._rest + self._buffer)
+        self._rest = bytearray()
+        self._buffer = bytearray()
+        body: QueryResponse = decode_json(rest)
+        return body
@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+from typing import TYPE_CHECKING, Any
+
+import requests  # ruff:ignore[banned-api] This is the only allowed use
+from requests.adapters import HTTPAdapter  # ruff:ignore[banned-api] Only configures the pool
+
+from marktplaats.cache import CachedResponse, cache_key
+from marktplaats.endpoints import endpoint_for_url
+from marktplaats.instrumentation import (
+    RequestEvent,
+    active_instrumentation,
+    content_length,
+)
+from marktplaats.retry import RetryCount
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from types import TracebackType
+
+    from requests import Response  # ruff:ignore[banned-api] Not doing any requests
+    from typing_extensions import Self
+
+    from marktplaats.cache import ResponseCache
+    from marktplaats.ratelimit import RateLimiter
+    from marktplaats.retry import RetryPolicy
+
+
+REQUEST_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/101.0.0.0 Safari/537.36"
+    ),
+    "Accept": "application/json",
+    "Sec-Fetch-Mode": "cors",
+    "Sec-Fetch-Site": "same-origin",
+}
+
+DEFAULT_TIMEOUT = 15
+
+# Retried when a RetryPolicy doesn't say otherwise
+RETRY_EXCEPTIONS: tuple[type[BaseException], ...] = (
+    requests.ConnectionError,
+    requests.Timeout,
+)
+
+
+class Transport:
+    """
+    A pooled HTTP transport for all requests to Marktplaats.
+
+    Connections are kept alive and reused through a single requests.Session.
+    The session is safe to share between threads: it only sends GET requests
+    and does not store cookies, so every request is as stateless as before.
+
+    pool_connections is the number of hosts to keep a pool for,
+    pool_maxsize the number of connections kept per host.
+    When pool_block is set, requests wait for a free connection
+    instead of opening a throwaway one once a host's pool is exhausted.
+
+    With a cache, successful responses are kept for the TTL of their endpoint
+    and identical requests are answered from it without touching the network.
+    With a rate limiter, requests are paced per endpoint.
+    With a retry policy, transient failures are retried.
+    Streamed responses, of which the body is read as it comes in, bypass the
+    cache.
+    """
+
+    def __init__(  # ruff:ignore[too-many-arguments] All configuration is keyword-only
+        self,
+        *,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        headers: Mapping[str, str] | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        cache: ResponseCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+    ) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.headers = dict(REQUEST_HEADERS if headers is None else headers)
+        if not keep_alive:
+            self.headers["Connection"] = "close"
+        self.timeout = timeout
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+
+        self._session: requests.Session | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        # Created lazily, so building a Transport never does any I/O
+        #  and unused transports don't hold on to a pool.
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    def _build_session(self) -> requests.Session:
+        session = requests.Session()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def get(  # type: ignore[explicit-any] # This is Any to avoid replicating the actual type of the `params` parameter
+        self,
+        url: str,
+        params: Mapping[str, Any] | None = None,
+        *,
+        stream: bool = False,
+    ) -> Response:
+        instrumentation = active_instrumentation()
+        if instrumentation is None:
+            return self._get(url, params, stream=stream)[0]
+
+        endpoint = endpoint_for_url(url)
+        instrumentation.request_started(endpoint, url)
+        started = time.perf_counter()
+        count = RetryCount()
+        try:
+            response, from_cache = self._get(
+                url,
+                params,
+                stream=stream,
+                count=count,
+            )
+        except BaseException as error:
+            # Cancellation too, so every started request is finished
+            instrumentation.request_finished(
+                RequestEvent(
+                    endpoint,
+                    url,
+                    time.perf_counter() - started,
+                    error=error,
+                    retries=count.retries,
+                ),
+            )
+            raise
+        instrumentation.request_finished(
+            RequestEvent(
+                endpoint,
+                url,
+                time.perf_counter() - started,
+                status_code=response.status_code,
+                # A streamed body hasn't been read yet
+                size=content_length(response.headers)
+                if stream
+                else len(response.content),
+                from_cache=from_cache,
+                retries=count.retries,
+            ),
+        )
+        return response
+
+    def _get(  # type: ignore[explicit-any] # This is Any to avoid replicating the actual type of the `params` parameter
+        self,
+        url: str,
+        params: Mapping[str, Any] | None,
+        *,
+        stream: bool,
+        count: RetryCount | None = None,
+    ) -> tuple[Response, bool]:
+        # Also returns whether the response came from the cache
+        ttl = self.cache.ttl_for(url) if self.cache is not None else 0
+        if self.cache is None or ttl <= 0 or stream:
+            return self._send(url, params, stream=stream, count=count), False
+
+        key = cache_key(url, params)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached.to_response(), True
+
+        response = self._send(url, params, count=count)
+        if response.status_code == 200:  # ruff:ignore[magic-value-comparison] HTTP status codes are a universal constant
+            self.cache.set(key, CachedResponse.from_response(response), ttl)
+        return response, False
+
+    def _send(  # type: ignore[explicit-any] # This is Any to avoid replicating the actual type of the `params` parameter
+        self,
+        url: str,
+        params: Mapping[str, Any] | None,
+        *,
+        stream: bool = False,
+        count: RetryCount | None = None,  # Counts the retries, for instrumentation
+    ) -> Response:
+        policy = self.retry
+        if policy is None:
+            return self._send_once(url, params, stream=stream)
+
+        exceptions = policy.exceptions or RETRY_EXCEPTIONS
+        started = policy.clock()
+        attempt = 1
+        while True:
+            try:
+                response = self._send_once(url, params, stream=stream)
+            except exceptions as error:
+                delay = policy.next_delay(url, attempt, started, error=error)
+                if delay is None:
+                    raise
+            else:
+                if response.status_code not in policy.status_codes:
+                    return response
+                delay = policy.next_delay(
+                    url,
+                    attempt,
+                    started,
+                    status_code=response.status_code,
+                    retry_after=response.headers.get("Retry-After"),
+                )
+                if delay is None:
+                    return response
+                response.close()  # Frees the connection of a streamed response
+            policy.sleep(delay)
+            attempt += 1
+            if count is not None:
+                count.retries += 1
+
+    def _send_once(  # type: ignore[explicit-any] # This is Any to avoid replicating the actual type of the `params` parameter
+        self,
+        url: str,
+        params: Mapping[str, Any] | None,
+        *,
+        stream: bool = False,
+    ) -> Response:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(url)
+        response = self.session.get(
+            url,
+            params=params,
+            # Some headers to make the request look legit
+            headers=self.headers,
+            timeout=self.timeout,
+            stream=stream,
+        )
+        if self.rate_limiter is not None:
+            self.rate_limiter.record(
+                url,
+                response.status_code,
+                response.headers.get("Retry-After"),
+            )
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+_default_transport: Transport | None = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport() -> Transport:
+    """
+    Get the process-wide transport, creating it on first use.
+
+    Returns:
+        The transport used when none is passed explicitly.
+
+    """
+    global _default_transport  # ruff:ignore[global-statement] Process-wide default
+    if _default_transport is None:
+        with _default_transport_lock:
+            if _default_transport is None:
+                _default_transport = Transport()
+    return _default_transport
+
+
+def set_default_transport(transport: Transport) -> None:
+    """Replace the process-wide transport used when none is passed explicitly."""
+    global _default_transport  # ruff:ignore[global-statement] Process-wide default
+    with _default_transport_lock:
+        _default_transport = transport
@@ -3,36 +3,30 @@ from __future__ import annotations
 from abc import ABC
 from typing import TYPE_CHECKING, Any
 
-import requests  # ruff:ignore[banned-api] This is the only allowed use
-from requests import Response  # ruff:ignore[banned-api] Not doing any requests
+from marktplaats.transport import (
+    REQUEST_HEADERS as REQUEST_HEADERS,  # ruff:ignore[useless-import-alias] Re-exported, it used to live here
+    get_default_transport,
+)
 
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
+    from requests import Response  # ruff:ignore[banned-api] Not doing any requests
 
-REQUEST_HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/101.0.0.0 Safari/537.36"
-    ),
-    "Accept": "application/json",
-    "Sec-Fetch-Mode": "cors",
-    "Sec-Fetch-Site": "same-origin",
-}
+    from marktplaats.transport import Transport
 
 
 def get_request(  # type: ignore[explicit-any] # This is Any to avoid replicating the actual type of the `params` parameter
     url: str,
     params: Mapping[str, Any] | None = None,
+    *,
+    transport: Transport | None = None,
+    stream: bool = False,
 ) -> Response:
-    return requests.get(
-        url,
-        params=params,
-        # Some headers to make the request look legit
-        headers=REQUEST_HEADERS,
-        timeout=15,
-    )
+    if transport is None:
+        transport = get_default_transport()
+    return transport.get(url, params, stream=stream)
 
 
 class MessageObjectException(Exception, ABC):  # ruff:ignore[error-suffix-on-exception-name] this is a base class, not an error itself
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from marktplaats.query import SearchQuery, SortBy, SortOrder, parse_listing
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from typing_extensions import Self
+
+    from marktplaats.api_types.search import Listing as ListingResponse
+    from marktplaats.models import Listing
+    from marktplaats.query import SearchSpec
+    from marktplaats.transport import Transport
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _utc(moment: datetime) -> datetime:
+    # Naive datetimes are in local time, like SearchSpec.offered_since treats them
+    return moment.astimezone(timezone.utc)
+
+
+@dataclass
+class WatcherState:
+    """
+    What a SearchWatcher has seen so far, to be saved between runs.
+
+    seen_ids holds the IDs of the most recently seen listings, newest first.
+    Its first ID is the high-water mark.
+    """
+
+    seen_ids: list[str] = field(default_factory=list)
+    last_poll: datetime | None = None
+
+    @property
+    def newest_id(self) -> str | None:
+        return self.seen_ids[0] if self.seen_ids else None
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "seen_ids": self.seen_ids,
+                "last_poll": self.last_poll.isoformat() if self.last_poll else None,
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, data: str) -> Self:
+        parsed = json.loads(data)
+        last_poll = parsed["last_poll"]
+        return cls(
+            parsed["seen_ids"],
+            datetime.fromisoformat(last_poll) if last_poll else None,
+        )
+
+
+class SearchWatcher:
+    """
+    Polls a search for listings that weren't there the last time.
+
+    The search is sent sorted by date, newest first, and only offered since
+    shortly before the last poll. Pages are fetched until one contains a
+    listing that was seen before, so a poll usually takes a single request.
+    Paid listings that are shown on top of every page don't count as seen.
+
+    The first poll only marks the current listings as seen, unless
+    emit_initial is set. With state_path, the state is loaded from and saved
+    to that file, so a watcher can pick up where the last run left off.
+    """
+
+    def __init__(  # ruff:ignore[too-many-arguments] All configuration is keyword-only
+        self,
+        spec: SearchSpec,
+        *,
+        state: WatcherState | None = None,
+        state_path: str | Path | None = None,
+        max_pages: int = 10,
+        max_seen: int = 1000,  # The number of IDs kept in the state
+        overlap: timedelta = timedelta(hours=1),
+        emit_initial: bool = False,
+        transport: Transport | None = None,
+        clock: Callable[[], datetime] = _now,
+    ) -> None:
+        self.spec = replace(
+            spec,
+            sort_by=SortBy.DATE,
+            sort_order=SortOrder.DESC,
+            offset=0,
+        )
+        self.state_path = Path(state_path) if state_path is not None else None
+        if state is None and self.state_path is not None and self.state_path.exists():
+            state = WatcherState.from_json(self.state_path.read_text(encoding="utf-8"))
+        self.state = state or WatcherState()
+        self.max_pages = max_pages
+        self.max_seen = max_seen
+        self.overlap = overlap
+        self.emit_initial = emit_initial
+        self.transport = transport
+        self._clock = clock
+
+    def _poll_spec(self) -> SearchSpec:
+        if self.state.last_poll is None:
+            return self.spec
+        offered_since = _utc(self.state.last_poll) - self.overlap
+        if self.spec.offered_since is not None:
+            offered_since = max(offered_since, _utc(self.spec.offered_since))
+        return replace(self.spec, offered_since=offered_since)
+
+    def poll(self) -> list[Listing]:
+        """
+        Fetch the listings that are new since the last poll.
+
+        Returns:
+            The new listings, newest first.
+
+        """
+        started = self._clock()
+        first_poll = self.state.last_poll is None
+        seen = set(self.state.seen_ids)
+        new: list[ListingResponse] = []
+
+        query = SearchQuery.from_spec(self._poll_spec(), transport=self.transport)
+        for number, page in enumerate(query.iter_pages(), start=1):
+            reached_seen = False
+            for listing in page.body_json["listings"][: page.limit]:
+                if listing["itemId"] not in seen:
+                    seen.add(listing["itemId"])
+                    new.append(listing)
+                elif listing.get("priorityProduct", "NONE") == "NONE":
+                    reached_seen = True
+            if reached_seen or number >= self.max_pages:
+                break
+            if first_poll and not self.emit_initial:
+                # Only the newest page is needed to know where to start
+                break
+
+        new_ids = [listing["itemId"] for listing in new]
+        self.state = WatcherState(
+            (new_ids + self.state.seen_ids)[: self.max_seen],
+            started,
+        )
+        if self.state_path is not None:
+            self.state_path.write_text(self.state.to_json(), encoding="utf-8")
+
+        if first_poll and not self.emit_initial:
+            return []
+        return [parse_listing(listing) for listing in new]
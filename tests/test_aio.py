@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from typing_extensions import override
+
+from marktplaats import BadStatusCodeError, JSONDecodeError, PriceType
+from marktplaats.aio import (
+    AsyncSearchQuery,
+    AsyncSellerQuery,
+    AsyncTransport,
+    fetch_listing_images,
+    fetch_listing_images_many,
+    get_async_request,
+    get_default_async_transport,
+    get_seller,
+)
+from marktplaats.categories import category_from_name
+from tests.utils import get_mock_file
+
+
+"""Tests for the asyncio API."""
+
+
+def _mock_transport(
+    status: int = 200,
+    query_body: str | None = None,
+) -> AsyncTransport:
+    bodies = {
+        "/lrp/api/search": query_body
+        if query_body is not None
+        else get_mock_file("query_response.json"),
+        "/v/api/seller-profile/7405065": get_mock_file("seller_response.json"),
+        "/m123456789": get_mock_file("image_response.html"),
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status, text=bodies[request.url.path])
+
+    return AsyncTransport(
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+def test_search_query() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, text=get_mock_file("query_response.json"))
+
+    async def run() -> AsyncSearchQuery:
+        async with AsyncTransport(
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ) as transport:
+            return await AsyncSearchQuery(
+                "fiets",
+                price_from=10,
+                price_to=200,
+                offered_since=datetime(2024, 12, 31, 14, 10, 0),
+                category=category_from_name("Beschrijfbare discs"),
+                extra_attributes=[1],
+                transport=transport,
+            )
+
+    query = asyncio.run(run())
+
+    assert query.total_result_count == 100
+    listings = query.get_listings()
+    assert len(listings) == 1
+    assert listings[0].price_type == PriceType.FIXED
+
+    (request,) = requests
+    assert request.headers["Sec-Fetch-Mode"] == "cors"
+    assert request.url.params.get_list("attributesById[]") == ["1"]
+    assert request.url.params["l1CategoryId"] == "322"
+    assert request.url.params["l2CategoryId"] == "1415"
+    assert request.url.params["attributeRanges[]"] == "PriceCents:1000:20000"
+
+
+def test_construction_does_not_send_a_request() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError(request)
+
+    transport = AsyncTransport(
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    query = AsyncSearchQuery("fiets", transport=transport)
+    assert query.params["query"] == "fiets"
+
+
+def test_many_queries_in_flight() -> None:
+    async def run() -> list[AsyncSearchQuery]:
+        transport = _mock_transport()
+        return await asyncio.gather(
+            *(
+                AsyncSearchQuery("fiets", offset=i, transport=transport).fetch()
+                for i in range(50)
+            ),
+        )
+
+    queries = asyncio.run(run())
+    assert all(query.total_result_count == 100 for query in queries)
+
+
+def test_http_error() -> None:
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(AsyncSearchQuery("fiets", transport=_mock_transport(400)).fetch())
+
+
+def test_non_200_status() -> None:
+    with pytest.raises(BadStatusCodeError):
+        asyncio.run(AsyncSearchQuery("fiets", transport=_mock_transport(204)).fetch())
+
+
+def test_invalid_json() -> None:
+    transport = _mock_transport(query_body="this is some invalid JSON")
+    with pytest.raises(JSONDecodeError):
+        asyncio.run(AsyncSearchQuery("fiets", transport=transport).fetch())
+
+
+def test_seller_and_images() -> None:
+    async def run() -> None:
+        transport = _mock_transport()
+        query = await AsyncSearchQuery("fiets", transport=transport)
+        listing = query.get_listings()[0]
+
+        seller, images = await asyncio.gather(
+            get_seller(listing.seller, transport=transport),
+            fetch_listing_images("m123456789", transport=transport),
+        )
+        assert seller.number_of_reviews == 175
+        assert len(images) == 9
+
+        details = await AsyncSellerQuery(7405065, transport=transport).fetch_details()
+        assert details["bankAccount"]
+
+    asyncio.run(run())
+
+
+def test_fetch_listing_images_many() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/m2":
+            return httpx.Response(404)
+        return httpx.Response(200, text=get_mock_file("image_response.html"))
+
+    transport = AsyncTransport(
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    result = asyncio.run(
+        fetch_listing_images_many(["m1", "m2", "m3"], transport=transport),
+    )
+
+    assert list(result.images) == ["m1", "m3"]
+    assert all(len(urls) == 9 for urls in result.images.values())
+    assert isinstance(result.errors["m2"], httpx.HTTPStatusError)
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keeps the connection open for the next request
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    @override
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def test_default_transport_per_event_loop() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+
+    async def run() -> AsyncTransport:
+        assert (await get_async_request(url)).status_code == 200
+        assert get_default_async_transport() is get_default_async_transport()
+        return get_default_async_transport()
+
+    try:
+        # Like a script that runs asyncio.run() more than once
+        first = asyncio.run(run())
+        second = asyncio.run(run())
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert first is not second
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+import responses
+
+from marktplaats import (
+    Endpoint,
+    MemoryResponseCache,
+    SearchQuery,
+    SQLiteResponseCache,
+    Transport,
+    TTLCache,
+)
+from marktplaats.aio import AsyncSearchQuery, AsyncTransport
+from marktplaats.cache import CachedResponse, cache_key
+from marktplaats.endpoints import endpoint_for_url
+from tests.utils import FakeClock, get_mock_file
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+"""Tests for the response cache."""
+
+
+def _response(content: bytes = b"{}") -> CachedResponse:
+    return CachedResponse("https://example.com", 200, (), content, "utf-8")
+
+
+def test_endpoint_for_url() -> None:
+    assert endpoint_for_url("https://www.marktplaats.nl/lrp/api/search") == (
+        Endpoint.SEARCH
+    )
+    assert endpoint_for_url(
+        "https://www.marktplaats.nl/v/api/seller-profile/123",
+    ) == (Endpoint.SELLER_PROFILE)
+    assert endpoint_for_url("https://link.marktplaats.nl/m123") == (
+        Endpoint.LISTING_PAGE
+    )
+    assert endpoint_for_url("https://example.com") == Endpoint.OTHER
+
+
+def test_cache_key_ignores_param_order() -> None:
+    url = "https://www.marktplaats.nl/lrp/api/search"
+    assert cache_key(url, {"a": 1, "b": [2, 3]}) == cache_key(
+        url,
+        {"b": [2, 3], "a": 1},
+    )
+    assert cache_key(url, {"a": 1, "b": None}) == cache_key(url, {"a": 1})
+    assert cache_key(url, {"a": 1}) != cache_key(url, {"a": 2})
+
+
+def test_ttl_cache_expiry_and_lru() -> None:
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(2, clock=clock)
+
+    cache.set("a", 1, ttl=10)
+    cache.set("b", 2, ttl=10)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.set("c", 3, ttl=10)
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 2
+    assert cache.stats.hit_rate == pytest.approx(0.5)
+
+
+def test_sqlite_cache_survives_reopening(tmp_path: Path) -> None:
+    clock = FakeClock()
+    path = tmp_path / "cache.sqlite"
+
+    cache = SQLiteResponseCache(path, clock=clock)
+    cache.set("key", _response(b"body"), ttl=10)
+    cache.close()
+
+    cache = SQLiteResponseCache(path, clock=clock)
+    assert cache.get("key") == _response(b"body")
+    clock.now = 10
+    assert cache.get("key") is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_sqlite_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    clock = FakeClock()
+    cache = SQLiteResponseCache(tmp_path / "cache.sqlite", 2, clock=clock)
+
+    cache.set("a", _response(), ttl=10)
+    clock.now = 1
+    cache.set("b", _response(), ttl=10)
+    clock.now = 2
+    assert cache.get("a") is not None
+    clock.now = 3
+    cache.set("c", _response(), ttl=10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+@responses.activate
+def test_transport_serves_repeated_searches_from_cache() -> None:
+    search = responses.get(
+        "https://www.marktplaats.nl/lrp/api/search",
+        body=get_mock_file("query_response.json"),
+    )
+    cache = MemoryResponseCache()
+    transport = Transport(cache=cache)
+
+    first = SearchQuery("fiets", transport=transport)
+    second = SearchQuery("fiets", transport=transport)
+    SearchQuery("auto", transport=transport)
+
+    assert search.call_count == 2
+    assert second.get_listings() == first.get_listings()
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+@responses.activate
+def test_transport_does_not_cache_errors_or_disabled_endpoints() -> None:
+    url = "https://www.marktplaats.nl/v/api/seller-profile/1"
+    profile = responses.get(url, status=500)
+    cache = MemoryResponseCache(ttls={Endpoint.SEARCH: 0})
+    transport = Transport(cache=cache)
+
+    transport.get(url)
+    transport.get(url)
+    assert profile.call_count == 2
+
+    search = responses.get(
+        "https://www.marktplaats.nl/lrp/api/search",
+        body=get_mock_file("query_response.json"),
+    )
+    SearchQuery("fiets", transport=transport)
+    SearchQuery("fiets", transport=transport)
+    assert search.call_count == 2
+
+
+def test_async_transport_shares_the_cache() -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, text=get_mock_file("query_response.json"))
+
+    async def run() -> AsyncSearchQuery:
+        transport = AsyncTransport(
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            cache=MemoryResponseCache(),
+        )
+        await AsyncSearchQuery("fiets", transport=transport)
+        return await AsyncSearchQuery("fiets", transport=transport)
+
+    query = asyncio.run(run())
+    assert len(requests) == 1
+    assert query.total_result_count == 100
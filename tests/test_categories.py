@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from marktplaats import (
+    L1Category,
+    L2Category,
+    category_data,
+    category_from_name,
+    get_l1_categories,
+    get_l2_categories,
+    get_l2_categories_by_parent,
+    get_subcategories,
+)
+from scripts.gen_category_data import generate
+
+
+"""Tests for looking up categories."""
+
+
+def test_lookups_return_the_same_category() -> None:
+    discs = category_from_name("Beschrijfbare discs")
+    assert isinstance(discs, L2Category)
+    assert discs is L2Category.from_name("beschrijfbare DISCS")
+    assert discs is L2Category.from_id(discs.id, discs.parent)
+    assert discs.parent is L1Category.from_id(322)
+    assert discs.parent is category_from_name("Computers en Software")
+    assert discs in get_subcategories(discs.parent)
+
+
+def test_unknown_categories() -> None:
+    with pytest.raises(ValueError, match="Unknown L2 category name: Nope"):
+        category_from_name("Nope")
+    with pytest.raises(ValueError, match="Unknown L1 category name: Nope"):
+        L1Category.from_name("Nope")
+
+    unknown = L1Category.from_id(-1)
+    assert (unknown.id, unknown.name) == (-1, "Unknown")
+    assert L2Category.from_id(-2, unknown, "Other").parent is unknown
+
+
+def test_l1_names_take_precedence() -> None:
+    # "Motoren" is both an L1 category and an L2 category of "Auto-onderdelen"
+    assert isinstance(category_from_name("Motoren"), L1Category)
+    assert isinstance(L2Category.from_name("Motoren"), L2Category)
+
+
+def test_categories_are_immutable() -> None:
+    category = L1Category.from_id(322)
+    with pytest.raises(AttributeError, match="immutable"):
+        category.name = "Other"  # type: ignore[misc]
+    assert copy.deepcopy(category) == category
+
+
+def test_tree() -> None:
+    by_parent = get_l2_categories_by_parent()
+    l2_categories = list(get_l2_categories())
+
+    assert sum(len(children) for children in by_parent.values()) == len(l2_categories)
+    assert set(by_parent) <= set(get_l1_categories())
+    for parent, children in by_parent.items():
+        assert list(get_subcategories(parent)) == children
+        assert all(child.parent is parent for child in children)
+
+
+def test_category_data_is_up_to_date() -> None:
+    root = Path(__file__).parent.parent
+    l1_categories = json.loads(
+        (root / "src/marktplaats/l1_categories.json").read_text(encoding="utf-8")
+    )
+    l2_categories = json.loads(
+        (root / "src/marktplaats/l2_categories.json").read_text(encoding="utf-8")
+    )
+
+    assert Path(category_data.__file__).read_text(encoding="utf-8") == generate(
+        l1_categories, l2_categories
+    ), "Run `python -m scripts.gen_category_data`"
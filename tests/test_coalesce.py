@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import responses
+
+from marktplaats import (
+    Condition,
+    SearchSpec,
+    group_specs,
+    search_coalesced,
+    spec_matches,
+)
+from marktplaats.endpoints import SEARCH_URL
+from marktplaats.query import parse_listing
+from tests.utils import get_mock_file
+
+
+if TYPE_CHECKING:
+    from marktplaats.api_types.search import Listing as ListingResponse
+
+
+"""Tests for merging searches that only differ in what can be filtered on."""
+
+
+def _listing(
+    item_id: str,
+    *,
+    price: int,
+    distance_meters: int = 1000,
+    condition: str = "Gebruikt",
+) -> ListingResponse:
+    (template,) = json.loads(get_mock_file("query_response.json"))["listings"]
+    listing: ListingResponse = {
+        **template,
+        "itemId": item_id,
+        "priceInfo": {"priceCents": price * 100, "priceType": "FIXED"},
+        "location": {**template["location"], "distanceMeters": distance_meters},
+        "attributes": [{"key": "condition", "value": condition, "values": [condition]}],
+    }
+    return listing
+
+
+def _add_page(
+    listings: list[ListingResponse],
+    params: dict[str, str],
+    *,
+    total_result_count: int,
+    max_allowed_page_number: int | None = None,
+) -> responses.BaseResponse:
+    body = json.loads(get_mock_file("query_response.json"))
+    body["listings"] = listings
+    body["totalResultCount"] = total_result_count
+    if max_allowed_page_number is not None:
+        body["maxAllowedPageNumber"] = max_allowed_page_number
+    return responses.get(
+        SEARCH_URL,
+        json=body,
+        match=[responses.matchers.query_param_matcher(params, strict_match=False)],
+    )
+
+
+def test_group_specs() -> None:
+    cheap = SearchSpec("fiets", price_to=100, limit=10)
+    near = SearchSpec("fiets", distance_km=10, zip_code="1234AB", limit=10)
+    new = SearchSpec("fiets", condition=Condition.NEW, price_from=50, limit=10)
+    other_query = SearchSpec("auto", price_to=100)
+    paged = SearchSpec("fiets", price_to=100, offset=30)
+
+    groups = group_specs([cheap, new, other_query, paged, near])
+
+    assert [group.members for group in groups] == [
+        (cheap, new),
+        (other_query,),
+        (paged,),
+        (near,),  # Another zip code
+    ]
+    merged = groups[0].merged
+    assert (merged.price_from, merged.price_to, merged.condition) == (None, None, None)
+    assert merged.limit == 100
+    assert groups[1].merged is other_query
+
+    widest = group_specs(
+        [
+            SearchSpec("fiets", price_from=10, price_to=50, distance_km=5),
+            SearchSpec("fiets", price_from=20, price_to=80, distance_km=15),
+        ],
+    )[0].merged
+    assert (widest.price_from, widest.price_to, widest.distance_km) == (10, 80, 15)
+
+
+def test_distance_is_compared_in_meters() -> None:
+    spec = SearchSpec("fiets", distance_km=10)
+
+    assert spec_matches(
+        spec, parse_listing(_listing("m1", price=1, distance_meters=10_000))
+    )
+    assert not spec_matches(
+        spec,
+        parse_listing(_listing("m2", price=1, distance_meters=10_500)),
+    )
+
+
+@responses.activate
+def test_merged_results_are_filtered_per_spec() -> None:
+    listings = [
+        _listing("m1", price=50),
+        _listing("m2", price=150, distance_meters=30_000),
+        _listing("m3", price=80, condition="Nieuw"),
+        _listing("m4", price=300, condition="Nieuw"),
+    ]
+    search = _add_page(listings, {"limit": "100"}, total_result_count=4)
+    cheap = SearchSpec("fiets", price_to=100, limit=10)
+    near = SearchSpec("fiets", distance_km=10, limit=10)
+    new = SearchSpec("fiets", condition=Condition.NEW, limit=1)
+
+    results = search_coalesced([cheap, near, new])
+
+    assert search.call_count == 1
+    assert [listing.id for listing in results[cheap]] == ["m1", "m3"]
+    assert [listing.id for listing in results[near]] == ["m1", "m3", "m4"]
+    assert [listing.id for listing in results[new]] == ["m3"]
+
+
+@responses.activate
+def test_falls_back_to_separate_requests_when_capped() -> None:
+    # Marktplaats won't page past the first page, so there may be more matches
+    merged = _add_page(
+        [_listing("m1", price=50), _listing("m2", price=500)],
+        {"limit": "100"},
+        total_result_count=1000,
+        max_allowed_page_number=1,
+    )
+    separate = _add_page(
+        [_listing("m3", price=40), _listing("m4", price=60)],
+        {"limit": "2", "attributeRanges[]": "PriceCents:null:10000"},
+        total_result_count=2,
+    )
+    cheap = SearchSpec("fiets", price_to=100, limit=2)
+    expensive = SearchSpec("fiets", price_from=400, limit=1)
+
+    results = search_coalesced([cheap, expensive])
+
+    assert merged.call_count == 1
+    assert separate.call_count == 1
+    assert [listing.id for listing in results[cheap]] == ["m3", "m4"]
+    assert [listing.id for listing in results[expensive]] == ["m2"]
+
+
+@responses.activate
+def test_stops_merging_when_it_cannot_save_a_request() -> None:
+    # Another merged page could need 2 separate requests after it: 4 in total
+    _add_page([_listing("m1", price=50)], {"limit": "100"}, total_result_count=1000)
+    _add_page(
+        [_listing("m2", price=250)],
+        {"limit": "1", "attributeRanges[]": "PriceCents:20000:30000"},
+        total_result_count=1,
+    )
+    _add_page(
+        [_listing("m3", price=500)],
+        {"limit": "1", "attributeRanges[]": "PriceCents:40000:null"},
+        total_result_count=1,
+    )
+    cheap = SearchSpec("fiets", price_to=100, limit=1)
+    middle = SearchSpec("fiets", price_from=200, price_to=300, limit=1)
+    expensive = SearchSpec("fiets", price_from=400, limit=1)
+
+    results = search_coalesced([cheap, middle, expensive])
+
+    assert len(responses.calls) == 3
+    assert [listing.id for listing in results[cheap]] == ["m1"]
+    assert [listing.id for listing in results[middle]] == ["m2"]
+    assert [listing.id for listing in results[expensive]] == ["m3"]
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+import responses
+
+from marktplaats import PriceType, SearchSpec
+from marktplaats.columnar import (
+    PRICE_TYPES,
+    ListingColumns,
+    arrow_schema,
+    record_batches,
+    write_parquet,
+)
+from marktplaats.endpoints import SEARCH_URL
+from marktplaats.query import parse_listing
+from tests.utils import get_mock_file, get_mock_query_response
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from marktplaats.api_types.search import Listing as ListingResponse
+
+
+"""Tests for building columns of listings without parsing them."""
+
+
+def _listings() -> list[ListingResponse]:
+    (template,) = json.loads(get_mock_file("query_response.json"))["listings"]
+    return [
+        template,
+        {
+            **template,
+            "itemId": "m2",
+            "date": "Gisteren",
+            "priceInfo": {"priceCents": 1250, "priceType": "MIN_BID"},
+            "location": {**template["location"], "latitude": 0, "longitude": 0},
+        },
+        {
+            **template,
+            "itemId": "m3",
+            "date": "Binnenkort",  # Unknown
+            "priceInfo": {"priceCents": 0, "priceType": "SWAP_ONLY"},  # Unknown
+            "location": {**template["location"], "distanceMeters": -1000},
+        },
+    ]
+
+
+def test_to_polars() -> None:
+    pytest.importorskip("polars")
+    listings = _listings()
+    columns = ListingColumns()
+    columns.add(listings)
+    assert len(columns) == 3
+
+    frame = columns.to_polars()
+
+    assert len(columns) == 0
+    assert str(frame.schema["price_type"]).startswith("Enum")
+    rows = frame.to_dicts()
+    # The same values as the parsed listings
+    parsed = [parse_listing(listing) for listing in listings]
+    assert [row["id"] for row in rows] == [listing.id for listing in parsed]
+    assert [row["price_cents"] / 100 for row in rows] == [
+        listing.price for listing in parsed
+    ]
+    assert [row["price_type"] for row in rows] == [
+        listing.price_type.name for listing in parsed
+    ]
+    assert [row["date"] for row in rows] == [listing.date for listing in parsed]
+    assert rows[1]["date"] == date.today() - timedelta(days=1)
+    assert [row["seller_id"] for row in rows] == [
+        listing.seller.id for listing in parsed
+    ]
+    assert [
+        (row["latitude"], row["longitude"], row["distance_km"]) for row in rows
+    ] == [
+        (
+            listing.location.latitude,
+            listing.location.longitude,
+            listing.location.distance_km,
+        )
+        for listing in parsed
+    ]
+    assert rows[2]["price_type"] == PriceType.UNKNOWN.name
+    assert rows[2]["date"] is None
+    assert rows[2]["distance_km"] is None
+    assert [row["category_id"] for row in rows] == [
+        listing.category_id for listing in parsed
+    ]
+
+
+def test_to_arrow(tmp_path: Path) -> None:
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    listings = _listings()
+    columns = ListingColumns()
+    columns.add(listings)
+    batch = columns.to_arrow()
+
+    assert batch.schema == arrow_schema()
+    assert batch.column("price_type").dictionary.to_pylist() == list(PRICE_TYPES)
+    assert batch.column("price_type").to_pylist() == ["FIXED", "BID_FROM", "UNKNOWN"]
+    assert batch.column("price_cents").to_pylist()[1] == 1250
+    # The builder can be used again once it has handed over its columns
+    columns.add(listings[:1])
+    assert columns.to_arrow().num_rows == 1
+
+    path = tmp_path / "listings.parquet"
+    assert write_parquet(listings * 3, path, batch_size=4) == 9
+    table = pq.read_table(path)
+    assert table.num_rows == 9
+    assert pa.Table.from_batches([batch]).equals(table.slice(0, 3))
+
+
+def test_to_pandas() -> None:
+    pytest.importorskip("pyarrow")
+    pd = pytest.importorskip("pandas")
+    columns = ListingColumns()
+    columns.add(_listings())
+
+    frame = columns.to_pandas()
+
+    assert list(frame.columns) == arrow_schema().names
+    assert isinstance(frame["price_cents"].dtype, pd.ArrowDtype)
+    assert frame["price_type"].tolist() == ["FIXED", "BID_FROM", "UNKNOWN"]
+    assert frame["price_cents"].tolist()[1] == 1250
+    assert len(columns) == 0
+
+
+def test_record_batches() -> None:
+    pytest.importorskip("pyarrow")
+
+    batches = list(record_batches(_listings() * 3, batch_size=4))
+
+    assert [batch.num_rows for batch in batches] == [4, 4, 1]
+
+
+@responses.activate
+def test_from_stream() -> None:
+    pytest.importorskip("polars")
+    responses.get(SEARCH_URL, body=get_mock_query_response(["m1", "m2", "m3"]))
+
+    columns = ListingColumns()
+    with SearchSpec("fiets", limit=2).stream(chunk_size=100) as stream:
+        columns.add(stream.raw_listings())
+
+    assert columns.to_polars()["id"].to_list() == ["m1", "m2"]
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+import responses
+
+from marktplaats import CompactListing, SearchQuery
+from marktplaats.models import CompactListingFirstImage
+from tests.utils import get_mock_file
+
+
+"""Tests for the compact listing models."""
+
+
+@pytest.fixture
+def query() -> SearchQuery:
+    body = json.loads(get_mock_file("query_response.json"))
+    (first,) = body["listings"]
+    body["listings"].append(
+        {**first, "itemId": "m2", "pictures": first["pictures"] * 2},
+    )
+
+    with responses.RequestsMock() as mock:
+        mock.get("https://www.marktplaats.nl/lrp/api/search", body=json.dumps(body))
+        return SearchQuery("fiets", limit=2)
+
+
+def test_compact_listing(query: SearchQuery) -> None:
+    listing = query.get_listings()[0]
+    compact = CompactListing.from_listing(listing)
+
+    assert not hasattr(compact, "__dict__")
+    assert compact.id == listing.id
+    assert compact.title == listing.title
+    assert compact.date == listing.date
+    assert compact.price == listing.price
+    assert compact.price_type == listing.price_type
+    assert compact.link == listing.link
+    assert compact.category_id == listing.category_id
+    assert compact.price_as_string(lang="nl") == listing.price_as_string(lang="nl")
+    assert compact.seller.id == listing.seller.id
+    assert compact.location.city == listing.location.city
+    assert compact.location.distance_km == listing.location.distance_km
+    assert compact.attributes == ()
+
+    assert listing.first_image is not None
+    assert compact.first_image is not None
+    assert compact.first_image.extra_small == listing.first_image.extra_small
+    assert compact.first_image.medium == listing.first_image.medium
+    assert compact.first_image.large == listing.first_image.large
+    assert compact.first_image.extra_large == listing.first_image.extra_large
+
+
+def test_strings_are_interned(query: SearchQuery) -> None:
+    first, second = (CompactListing.from_listing(listing) for listing in query.listings)
+
+    assert first.location.city is second.location.city
+    assert first.location.country is second.location.country
+
+
+def test_images_and_attributes(query: SearchQuery) -> None:
+    listing = query.get_listings()[1]
+
+    assert len(CompactListing.from_listing(listing).images) == 1
+
+    compact = CompactListing.from_listing(
+        listing,
+        first_image_only=False,
+        keep_attributes=True,
+    )
+    assert len(compact.images) == 2
+    assert compact.attributes == (("condition", "Gebruikt"), ("delivery", "Ophalen"))
+
+
+def test_image_urls_without_shared_template() -> None:
+    image = CompactListingFirstImage("a", "b", "c", "d")
+
+    assert (image.extra_small, image.medium, image.large, image.extra_large) == (
+        "a",
+        "b",
+        "c",
+        "d",
+    )
+    assert image == CompactListingFirstImage("a", "b", "c", "d")
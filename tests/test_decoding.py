@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+import responses
+
+from marktplaats import (
+    JSONDecodeError,
+    SearchQuery,
+    available_json_backends,
+    get_json_backend,
+    set_json_backend,
+)
+from marktplaats.decoding import decode_json
+from tests.utils import get_mock_file
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+"""Tests for the pluggable JSON decoding."""
+
+
+@pytest.fixture(params=available_json_backends())
+def backend(request: pytest.FixtureRequest) -> Iterator[str]:
+    set_json_backend(request.param)
+    yield request.param
+    set_json_backend(None)
+
+
+def test_json_is_always_available() -> None:
+    assert "json" in available_json_backends()
+    assert get_json_backend() == available_json_backends()[0]
+
+
+def test_unknown_backend() -> None:
+    with pytest.raises(ValueError, match=r"^JSON backend 'simdjson' is not available"):
+        set_json_backend("simdjson")
+
+
+def test_decode(backend: str) -> None:
+    content = get_mock_file("query_response.json")
+
+    assert get_json_backend() == backend
+    assert decode_json(content.encode()) == json.loads(content)
+
+
+@responses.activate
+def test_search_query(backend: str) -> None:
+    responses.get(
+        "https://www.marktplaats.nl/lrp/api/search",
+        body=get_mock_file("query_response.json"),
+    )
+
+    query = SearchQuery("fiets")
+
+    assert get_json_backend() == backend
+    assert query.total_result_count == 100
+    assert query.get_listings()[0].title == "Batavus damesfiets 26 inch"
+
+
+@responses.activate
+def test_invalid_json(backend: str) -> None:
+    responses.get(
+        "https://www.marktplaats.nl/lrp/api/search",
+        body="this is some invalid JSON",
+    )
+
+    assert get_json_backend() == backend
+    with pytest.raises(JSONDecodeError):
+        _query = SearchQuery("fiets")
+
+
+def test_backends_are_imported_when_used() -> None:
+    code = (
+        "import sys, marktplaats\n"
+        "print(sorted({'orjson', 'msgspec'} & sys.modules.keys()))\n"
+        "marktplaats.set_json_backend('json')\n"
+        "marktplaats.decoding.decode_json(b'{}')\n"
+        "print(sorted({'orjson', 'msgspec'} & sys.modules.keys()))\n"
+    )
+    output = subprocess.run(  # ruff:ignore[subprocess-without-shell-equals-true] Our own code
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+    assert output.splitlines() == ["[]", "[]"]
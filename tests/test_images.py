@@ -1,8 +1,19 @@
 from __future__ import annotations
 
+import subprocess
+import sys
+
+import pytest
+import requests
 import responses
 
-from marktplaats.models.listing_image import fetch_listing_images
+from marktplaats.models.listing_image import (
+    fetch_listing_images,
+    fetch_listing_images_many,
+    parse_listing_images,
+    scan_listing_images,
+    soup_listing_images,
+)
 from tests.utils import get_mock_file
 
 
@@ -35,3 +46,55 @@ def test_no_photos_returns_empty_list() -> None:
 
     urls = fetch_listing_images("m2404914283")
     assert urls == []
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["image_response.html", "image_response_no_photos.html"],
+)
+def test_scan_matches_soup(name: str) -> None:
+    html = get_mock_file(name)
+
+    assert scan_listing_images(html) == soup_listing_images(html)
+    assert scan_listing_images(html.encode()) == soup_listing_images(html)
+
+
+def test_scan_falls_back_to_soup() -> None:
+    html = "<html><body><p>No ld+json here</p></body></html>"
+
+    assert scan_listing_images(html) is None
+    assert parse_listing_images(html) == []
+
+
+@pytest.mark.parametrize("processes", [None, 2])
+@responses.activate
+def test_fetch_many_collects_failures(processes: int | None) -> None:
+    for listing_id in ["m1", "m2", "m3"]:
+        responses.get(
+            f"https://link.marktplaats.nl/{listing_id}",
+            body=get_mock_file("image_response.html"),
+        )
+    responses.get("https://link.marktplaats.nl/m4", status=404)
+
+    result = fetch_listing_images_many(
+        ["m3", "m4", "m1", "m2", "m1"],
+        max_workers=2,
+        processes=processes,
+    )
+
+    assert list(result.images) == ["m3", "m1", "m2"]
+    assert all(len(urls) == 9 for urls in result.images.values())
+    assert list(result.errors) == ["m4"]
+    assert isinstance(result.errors["m4"], requests.HTTPError)
+
+
+def test_processes_are_imported_when_used() -> None:
+    code = "import sys, marktplaats; print('multiprocessing' in sys.modules)"
+    output = subprocess.run(  # ruff:ignore[subprocess-without-shell-equals-true] Our own code
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+    assert output.strip() == "False"
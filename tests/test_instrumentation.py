@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+import responses
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from prometheus_client import CollectorRegistry
+from typing_extensions import override
+
+from marktplaats import (
+    Endpoint,
+    Instrumentation,
+    MemoryResponseCache,
+    RequestEvent,
+    RetryPolicy,
+    SearchQuery,
+    Transport,
+    get_instrumentation,
+    set_instrumentation,
+)
+from marktplaats.aio import AsyncTransport
+from marktplaats.endpoints import SEARCH_URL
+from marktplaats.otel import OpenTelemetryInstrumentation
+from marktplaats.prometheus import PrometheusInstrumentation
+from tests.utils import get_mock_file
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from marktplaats.retry import RetryEvent
+
+
+"""Tests for reporting metrics and traces."""
+
+
+class Recorder(Instrumentation):
+    def __init__(self) -> None:
+        self.events: list[tuple[str, object]] = []
+
+    @override
+    def request_started(self, endpoint: Endpoint, url: str) -> None:
+        self.events.append(("started", endpoint))
+
+    @override
+    def request_finished(self, event: RequestEvent) -> None:
+        self.events.append(("finished", event))
+
+    @override
+    def request_retried(self, event: RetryEvent) -> None:
+        self.events.append(("retried", event.attempt))
+
+    @override
+    def json_decoded(self, endpoint: Endpoint, size: int, duration: float) -> None:
+        self.events.append(("decoded", endpoint))
+
+    @override
+    def page_parsed(self, listings: int, duration: float) -> None:
+        self.events.append(("parsed", listings))
+
+    @override
+    def unknown_value(self, field: str, value: str) -> None:
+        self.events.append(("unknown", (field, value)))
+
+
+@pytest.fixture
+def recorder() -> Iterator[Recorder]:
+    recorder = Recorder()
+    set_instrumentation(recorder)
+    yield recorder
+    set_instrumentation(None)
+
+
+def _add_search(*, status: int = 200) -> None:
+    body = json.loads(get_mock_file("query_response.json"))
+    body["listings"][0]["priceInfo"]["priceType"] = "NEW_PRICE_TYPE"
+    responses.get(SEARCH_URL, status=status, json=body)
+
+
+def test_disabled_by_default() -> None:
+    assert type(get_instrumentation()) is Instrumentation
+
+
+@responses.activate
+def test_events(recorder: Recorder) -> None:
+    _add_search(status=503)
+    _add_search()
+    transport = Transport(
+        retry=RetryPolicy(jitter=False, backoff=0),
+        cache=MemoryResponseCache(),
+    )
+
+    SearchQuery("fiets", transport=transport).get_listings()
+    SearchQuery("fiets", transport=transport)
+
+    names = [name for name, _ in recorder.events]
+    assert names == [
+        "started",
+        "retried",
+        "finished",
+        "decoded",
+        "unknown",
+        "parsed",
+        "started",
+        "finished",  # From the cache
+        "decoded",
+    ]
+    finished = [event for name, event in recorder.events if name == "finished"]
+    assert isinstance(finished[0], RequestEvent)
+    assert (finished[0].endpoint, finished[0].status_code) == (Endpoint.SEARCH, 200)
+    assert finished[0].size == len(responses.calls[-1].response.content)
+    assert finished[0].retries == 1
+    assert isinstance(finished[1], RequestEvent)
+    assert finished[1].from_cache
+    assert finished[1].retries == 0
+    assert ("unknown", ("price_type", "NEW_PRICE_TYPE")) in recorder.events
+
+
+def test_retries_of_a_failed_async_request(recorder: Recorder) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        msg = "Unreachable"
+        raise httpx.ConnectError(msg, request=request)
+
+    async def main() -> None:
+        async with AsyncTransport(
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            retry=RetryPolicy(max_attempts=3, jitter=False, backoff=0),
+        ) as transport:
+            with pytest.raises(httpx.ConnectError):
+                await transport.get(SEARCH_URL)
+
+    asyncio.run(main())
+
+    names = [name for name, _ in recorder.events]
+    assert names == ["started", "retried", "retried", "finished"]
+    finished = recorder.events[-1][1]
+    assert isinstance(finished, RequestEvent)
+    assert isinstance(finished.error, httpx.ConnectError)
+    assert finished.retries == 2
+
+
+@responses.activate
+def test_prometheus() -> None:
+    registry = CollectorRegistry()
+    set_instrumentation(PrometheusInstrumentation(registry=registry))
+    _add_search()
+    responses.get(SEARCH_URL, status=404)
+    try:
+        SearchQuery("fiets").get_listings()
+        with pytest.raises(Exception, match="404"):
+            SearchQuery("fiets")
+    finally:
+        set_instrumentation(None)
+
+    def sample(name: str, **labels: str) -> float | None:
+        return registry.get_sample_value(f"marktplaats_{name}", labels)
+
+    assert sample("requests_total", endpoint="search", status="200") == 1
+    assert sample("requests_total", endpoint="search", status="404") == 1
+    assert sample("requests_in_progress", endpoint="search") == 0
+    assert sample("request_duration_seconds_count", endpoint="search") == 2
+    assert sample("json_decode_duration_seconds_count", endpoint="search") == 1
+    assert sample("page_parse_duration_seconds_count") == 1
+    assert sample("unknown_values_total", field="price_type") == 1
+
+
+@responses.activate
+def test_opentelemetry() -> None:
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    set_instrumentation(OpenTelemetryInstrumentation(provider.get_tracer("test")))
+    _add_search()
+    try:
+        SearchQuery("fiets").get_listings()
+    finally:
+        set_instrumentation(None)
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    assert set(spans) == {
+        "GET search",
+        "marktplaats.decode_json",
+        "marktplaats.parse_listings",
+    }
+    request = spans["GET search"]
+    assert request.attributes is not None
+    assert request.attributes["http.response.status_code"] == 200
+    parse = spans["marktplaats.parse_listings"]
+    assert parse.attributes is not None
+    assert parse.attributes["marktplaats.listings"] == 1
+
+
+def test_cancelled_async_request(recorder: Recorder) -> None:
+    started = asyncio.Event()
+
+    async def handler(_request: httpx.Request) -> httpx.Response:
+        started.set()
+        await asyncio.Event().wait()  # Never answers
+        raise AssertionError
+
+    async def main() -> None:
+        transport = AsyncTransport(
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        task = asyncio.create_task(transport.get(SEARCH_URL))
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+
+    names = [name for name, _ in recorder.events]
+    assert names == ["started", "finished"]
+    finished = recorder.events[1][1]
+    assert isinstance(finished, RequestEvent)
+    assert isinstance(finished.error, asyncio.CancelledError)
+    assert finished.status_code is None
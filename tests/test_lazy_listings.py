@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+
+import pytest
+import responses
+
+from marktplaats import LazyListing, SearchQuery
+from marktplaats.parsing import parse_date
+from tests.utils import get_mock_query_response
+
+
+"""Tests for parsing listings on demand."""
+
+
+@pytest.fixture
+def query() -> SearchQuery:
+    with responses.RequestsMock() as mock:
+        mock.get(
+            "https://www.marktplaats.nl/lrp/api/search",
+            body=get_mock_query_response(["m1", "m2", "m3", "m4"]),
+        )
+        return SearchQuery("fiets", limit=3)
+
+
+def test_ids_without_parsing(
+    query: SearchQuery, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fail(*args: object) -> None:
+        raise AssertionError(args)
+
+    monkeypatch.setattr("marktplaats.parsing.parse_date", fail)
+    monkeypatch.setattr("marktplaats.query.ListingLocation.parse", fail)
+
+    assert query.listings.ids() == ["m1", "m2", "m3"]
+    assert len(query.listings) == 3
+    assert [listing.id for listing in query.listings] == ["m1", "m2", "m3"]
+    assert query.listings[1].price == 75
+
+
+def test_fields_are_parsed_once(
+    query: SearchQuery, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[str] = []
+
+    def counting_parse_date(date_str: str) -> object:
+        calls.append(date_str)
+        return parse_date(date_str)
+
+    monkeypatch.setattr("marktplaats.parsing.parse_date", counting_parse_date)
+
+    listing = query.listings[0]
+    assert listing.date == listing.date
+    assert query.listings[0] is listing
+    assert calls == ["10 mrt 24"]
+
+
+def test_lazy_listing_matches_eager(query: SearchQuery) -> None:
+    for lazy, eager in zip(query.listings, query.get_listings(), strict=True):
+        assert isinstance(lazy, LazyListing)
+        assert lazy == eager
+        assert asdict(lazy) == asdict(eager)
+        assert lazy.first_image == eager.first_image
+
+
+def test_get_listings_is_memoized(
+    query: SearchQuery, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first = query.get_listings()
+
+    def fail(*args: object) -> None:
+        raise AssertionError(args)
+
+    monkeypatch.setattr("marktplaats.query.parse_listing", fail)
+    second = query.get_listings()
+
+    assert first == second
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second, strict=True))
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import pytest
+import responses
+
+from marktplaats import SearchQuery
+from tests.utils import get_mock_query_response
+
+
+"""Tests for paging through search results."""
+
+
+def _add_page(
+    offset: int,
+    item_ids: list[str],
+    *,
+    total_result_count: int,
+    max_allowed_page_number: int | None = None,
+) -> None:
+    responses.get(
+        "https://www.marktplaats.nl/lrp/api/search",
+        body=get_mock_query_response(
+            item_ids,
+            total_result_count=total_result_count,
+            max_allowed_page_number=max_allowed_page_number,
+        ),
+        match=[
+            responses.matchers.query_param_matcher(
+                {"offset": str(offset), "limit": "2"},
+                strict_match=False,
+            ),
+        ],
+    )
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+@responses.activate
+def test_iter_listings(prefetch: bool) -> None:
+    _add_page(0, ["m1", "m2", "m3"], total_result_count=5)  # Padded page
+    _add_page(2, ["m3", "m4"], total_result_count=5)
+    _add_page(4, ["m5"], total_result_count=5)
+
+    query = SearchQuery("fiets", limit=2)
+    listings = list(query.iter_listings(prefetch=prefetch))
+
+    assert [listing.id for listing in listings] == ["m1", "m2", "m3", "m4", "m5"]
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_iter_listings_stops_at_max_allowed_page() -> None:
+    for offset in (0, 2, 4):
+        _add_page(
+            offset,
+            [f"m{offset}", f"m{offset + 1}"],
+            total_result_count=1000,
+            max_allowed_page_number=2,
+        )
+
+    query = SearchQuery("fiets", limit=2)
+
+    assert len(list(query.iter_listings())) == 4
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_iter_listings_stops_at_empty_page() -> None:
+    _add_page(0, ["m1", "m2"], total_result_count=1000)
+    _add_page(2, [], total_result_count=1000)
+
+    query = SearchQuery("fiets", limit=2)
+
+    assert len(list(query.iter_listings())) == 2
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_next_page() -> None:
+    _add_page(0, ["m1", "m2"], total_result_count=3)
+    _add_page(2, ["m3"], total_result_count=3)
+
+    query = SearchQuery("fiets", limit=2)
+    next_page = query.next_page()
+
+    assert next_page is not None
+    assert next_page.params["offset"] == "2"
+    assert next_page.params["query"] == "fiets"
+    assert next_page.next_page() is None
+
+
+@responses.activate
+def test_fetch_all() -> None:
+    _add_page(0, ["m1", "m2", "m3"], total_result_count=7)  # Padded page
+    _add_page(2, ["m3", "m4"], total_result_count=7)
+    _add_page(4, ["m4", "m5"], total_result_count=7)  # Results shifted
+    _add_page(6, ["m6"], total_result_count=7)
+
+    query = SearchQuery("fiets", limit=2)
+    listings = query.fetch_all(max_workers=3)
+
+    assert [listing.id for listing in listings] == ["m1", "m2", "m3", "m4", "m5", "m6"]
+    assert len(responses.calls) == 4
+
+
+@responses.activate
+def test_fetch_all_honours_max_allowed_page() -> None:
+    for offset in (0, 2, 4):
+        _add_page(
+            offset,
+            [f"m{offset}", f"m{offset + 1}"],
+            total_result_count=1000,
+            max_allowed_page_number=2,
+        )
+
+    query = SearchQuery("fiets", limit=2)
+
+    assert len(query.fetch_all()) == 4
+    assert len(responses.calls) == 2
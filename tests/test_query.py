@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from dataclasses import replace
 from datetime import date, datetime
 
 import pytest
@@ -11,11 +12,16 @@ from marktplaats import (
     BadStatusCodeError,
     JSONDecodeError,
     ListingFirstImage,
+    MemoryResponseCache,
     PriceType,
     SearchQuery,
+    SearchSpec,
+    Transport,
 )
 from marktplaats.categories import category_from_name
+from marktplaats.endpoints import SEARCH_URL
 from marktplaats.models import ListingLocation
+from marktplaats.parsing import parse_date
 from tests.utils import get_mock_file
 
 
@@ -200,3 +206,121 @@ def test_listing_limit_is_respected() -> None:
     query = SearchQuery("fiets", limit=5)
 
     assert len(query.get_listings()) == 5
+
+
+def test_spec_does_not_send_a_request() -> None:
+    # responses isn't active, so any request would go out and fail
+    spec = SearchSpec("fiets", price_from=10, limit=5)
+
+    params = spec.to_params()
+    assert params["query"] == "fiets"
+    assert params["limit"] == "5"
+    assert params["attributeRanges[]"] == ["PriceCents:1000:null"]
+
+
+def test_spec_is_hashable() -> None:
+    category = category_from_name("Fietsen en Brommers")
+    spec = SearchSpec("fiets", category=category, extra_attributes=(1, 2))
+    same = SearchSpec("fiets", category=category, extra_attributes=(1, 2))
+
+    assert spec == same
+    assert len({spec, same}) == 1
+    assert spec.cache_key == same.cache_key
+    assert spec != replace(spec, offset=10)
+    assert spec.cache_key != replace(spec, offset=10).cache_key
+
+
+@responses.activate
+def test_spec_cache_key_is_the_response_cache_key() -> None:
+    responses.get(SEARCH_URL, body=get_mock_file("query_response.json"))
+    cache = MemoryResponseCache()
+    spec = SearchSpec("fiets", price_to=100, extra_attributes=(1, 2))
+
+    spec.execute(transport=Transport(cache=cache))
+
+    assert cache.get(spec.cache_key) is not None
+
+
+def test_spec_validation() -> None:
+    with pytest.raises(
+        ValueError,
+        match=r"^Invalid arguments: When the query is empty, a category must be specified.$",
+    ):
+        SearchSpec(price_to=10)
+
+
+@responses.activate
+def test_spec_execute() -> None:
+    responses.get(
+        "https://www.marktplaats.nl/lrp/api/search",
+        body=get_mock_file("query_response.json"),
+        match=[
+            responses.matchers.query_param_matcher(
+                {"query": "fiets", "limit": "3"},
+                strict_match=False,
+            ),
+        ],
+    )
+
+    spec = SearchSpec("fiets", limit=3)
+    query = spec.execute()
+
+    assert query.spec is spec
+    assert query.total_result_count == 100
+
+
+@responses.activate
+def test_constructor_builds_spec() -> None:
+    responses.get(
+        "https://www.marktplaats.nl/lrp/api/search",
+        body=get_mock_file("query_response.json"),
+    )
+
+    query = SearchQuery("fiets", distance_km=10, extra_attributes=[1])
+
+    assert query.spec == SearchSpec("fiets", distance_km=10, extra_attributes=(1,))
+
+
+@responses.activate
+def test_distance_is_deprecated() -> None:
+    responses.get(
+        "https://www.marktplaats.nl/lrp/api/search",
+        body=get_mock_file("query_response.json"),
+        match=[
+            responses.matchers.query_param_matcher(
+                {"distanceMeters": "1500"},
+                strict_match=False,
+            ),
+        ],
+    )
+
+    with pytest.warns(
+        DeprecationWarning,
+        match=r"^distance is deprecated. Use distance_km instead.$",
+    ) as record:
+        _query = SearchQuery("fiets", distance=1500)
+
+    assert record[0].filename == __file__
+
+
+@pytest.mark.parametrize(
+    ("date_str", "expected"),
+    [
+        ("10 mrt 24", date(2024, 3, 10)),
+        ("1 mei 99", date(1999, 5, 1)),
+        ("31 dec 68", date(2068, 12, 31)),
+        ("Vandaag", date(2024, 3, 10)),
+        ("Gisteren", date(2024, 3, 9)),
+        ("Eergisteren", date(2024, 3, 8)),
+    ],
+)
+def test_parse_date(date_str: str, expected: date) -> None:
+    assert parse_date(date_str, today=date(2024, 3, 10)) == expected
+
+
+@pytest.mark.parametrize(
+    "date_str", ["", "10 mrt", "10 xyz 24", "32 jan 24", "1 mrt 2024"]
+)
+def test_parse_date_unknown_format(date_str: str) -> None:
+    with pytest.raises(ValueError, match=r"date|day"):
+        parse_date(date_str)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import responses
+
+from marktplaats import Endpoint, RateLimiter, SearchQuery, TokenBucket, Transport
+from marktplaats.endpoints import SEARCH_URL
+from marktplaats.ratelimit import parse_retry_after
+from tests.utils import FakeClock, get_mock_file
+
+
+"""Tests for the rate limiter."""
+
+
+def test_token_bucket_paces_after_burst() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=2, clock=clock)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1)
+
+    clock.now = 10
+    assert bucket.reserve() == 0
+
+
+def test_token_bucket_pause() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1, burst=5, clock=clock)
+
+    bucket.pause(30)
+    assert bucket.reserve() == pytest.approx(31)
+    clock.now = 40
+    assert bucket.reserve() == 0
+
+
+def test_parse_retry_after() -> None:
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+    date = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60))
+    assert parse_retry_after(date) == pytest.approx(60, abs=2)
+
+
+def test_adaptive_backoff_and_recovery() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter({Endpoint.SEARCH: 10}, clock=clock, sleep=clock.sleep)
+
+    limiter.record(SEARCH_URL, 429, None)
+    limiter.record(SEARCH_URL, 429, None)
+    assert limiter.rate(Endpoint.SEARCH) == pytest.approx(2.5)
+    assert limiter.rate(Endpoint.LISTING_PAGE) == 10  # Other endpoints are untouched
+
+    for _ in range(100):
+        limiter.record(SEARCH_URL, 200, None)
+    assert limiter.rate(Endpoint.SEARCH) == 10
+
+
+def test_backoff_has_a_floor() -> None:
+    limiter = RateLimiter({Endpoint.SEARCH: 10}, min_fraction=0.1)
+
+    for _ in range(20):
+        limiter.record(SEARCH_URL, 429, None)
+    assert limiter.rate(Endpoint.SEARCH) == pytest.approx(1)
+
+
+@responses.activate
+def test_transport_obeys_retry_after() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter({Endpoint.SEARCH: 100}, clock=clock, sleep=clock.sleep)
+    transport = Transport(rate_limiter=limiter)
+
+    responses.get(SEARCH_URL, status=429, headers={"Retry-After": "30"})
+    responses.get(SEARCH_URL, body=get_mock_file("query_response.json"))
+
+    assert transport.get(SEARCH_URL).status_code == 429
+    assert clock.now == 0
+
+    SearchQuery("fiets", transport=transport)
+    assert clock.now >= 30
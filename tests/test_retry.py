@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+import requests
+import responses
+
+from marktplaats import RetryEvent, RetryPolicy, SearchQuery, Transport
+from marktplaats.aio import AsyncSearchQuery, AsyncTransport
+from marktplaats.endpoints import SEARCH_URL
+from marktplaats.models.listing_image import fetch_listing_images
+from tests.utils import FakeClock, get_mock_file
+
+
+"""Tests for retrying failed requests."""
+
+
+def _policy(clock: FakeClock, **kwargs: object) -> RetryPolicy:
+    return RetryPolicy(clock=clock, sleep=clock.sleep, **kwargs)  # type: ignore[arg-type]
+
+
+def test_backoff_without_jitter() -> None:
+    policy = RetryPolicy(backoff=1, max_backoff=5, jitter=False)
+    assert [policy.backoff_for(attempt) for attempt in range(1, 6)] == [
+        1,
+        2,
+        4,
+        5,
+        5,
+    ]
+
+
+def test_backoff_with_jitter() -> None:
+    policy = RetryPolicy(backoff=1)
+    assert all(0 <= policy.backoff_for(3) <= 4 for _ in range(100))
+
+
+@responses.activate
+def test_retries_status_codes_and_errors() -> None:
+    clock = FakeClock()
+    events: list[RetryEvent] = []
+    transport = Transport(
+        retry=_policy(clock, max_attempts=4, jitter=False, on_retry=events.append),
+    )
+    responses.get(SEARCH_URL, status=502)
+    responses.get(SEARCH_URL, body=requests.ConnectionError("reset"))
+    responses.get(SEARCH_URL, status=429, headers={"Retry-After": "10"})
+    responses.get(SEARCH_URL, body=get_mock_file("query_response.json"))
+
+    query = SearchQuery("fiets", transport=transport)
+
+    assert query.total_result_count == 100
+    assert clock.sleeps == [0.5, 1, 10]
+    assert [event.attempt for event in events] == [1, 2, 3]
+    assert [event.status_code for event in events] == [502, None, 429]
+    assert isinstance(events[1].error, requests.ConnectionError)
+
+
+@responses.activate
+def test_gives_up_after_max_attempts() -> None:
+    clock = FakeClock()
+    transport = Transport(retry=_policy(clock, max_attempts=3))
+    url = "https://link.marktplaats.nl/m1"
+    page = responses.get(url, status=503)
+
+    with pytest.raises(requests.HTTPError):
+        fetch_listing_images("m1", transport=transport)
+    assert page.call_count == 3
+    assert len(clock.sleeps) == 2
+
+
+@responses.activate
+def test_raises_last_error_after_deadline() -> None:
+    clock = FakeClock()
+    transport = Transport(
+        retry=_policy(clock, max_attempts=10, jitter=False, backoff=4, deadline=10),
+    )
+    responses.get(SEARCH_URL, body=requests.Timeout())
+
+    with pytest.raises(requests.Timeout):
+        transport.get(SEARCH_URL)
+    assert clock.sleeps == [4]  # Waiting another 8 seconds would pass the deadline
+
+
+@responses.activate
+def test_other_errors_are_not_retried() -> None:
+    clock = FakeClock()
+    transport = Transport(retry=_policy(clock))
+    search = responses.get(SEARCH_URL, status=404)
+
+    assert transport.get(SEARCH_URL).status_code == 404
+    assert search.call_count == 1
+    assert not clock.sleeps
+
+
+def test_async_transport_retries() -> None:
+    attempts = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            msg = "Connection reset"
+            raise httpx.ConnectError(msg, request=request)
+        if attempts == 2:
+            return httpx.Response(500)
+        return httpx.Response(200, text=get_mock_file("query_response.json"))
+
+    transport = AsyncTransport(
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        retry=RetryPolicy(backoff=0),
+    )
+    query = asyncio.run(AsyncSearchQuery("fiets", transport=transport).fetch())
+
+    assert attempts == 3
+    assert query.total_result_count == 100
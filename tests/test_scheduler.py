@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import responses
+
+from marktplaats import SearchQuery, SearchScheduler, SearchSpec
+from marktplaats.endpoints import SEARCH_URL
+from tests.utils import FakeClock, get_mock_file
+
+
+"""Tests for scheduling many searches."""
+
+
+def _add_search(query: str, *, status: int = 200) -> responses.BaseResponse:
+    return responses.get(
+        SEARCH_URL,
+        status=status,
+        body=get_mock_file("query_response.json"),
+        match=[
+            responses.matchers.query_param_matcher({"query": query}, strict_match=False)
+        ],
+    )
+
+
+@responses.activate
+def test_identical_searches_are_coalesced() -> None:
+    clock = FakeClock()
+    scheduler = SearchScheduler(clock=clock)
+    search = _add_search("fiets")
+    results: list[tuple[str, SearchQuery]] = []
+
+    first = scheduler.add(
+        SearchSpec("fiets"),
+        lambda query: results.append(("a", query)),
+        interval=60,
+    )
+    second = scheduler.add(
+        SearchSpec("fiets"),
+        lambda query: results.append(("b", query)),
+        interval=30,
+    )
+    assert first is second
+    assert first.interval == 30
+
+    clock.now = 30
+    assert scheduler.run_pending() == 1
+    assert search.call_count == 1
+    assert [name for name, _ in results] == ["a", "b"]
+    assert results[0][1] is results[1][1]
+
+
+@responses.activate
+def test_searches_run_at_their_interval() -> None:
+    clock = FakeClock()
+    scheduler = SearchScheduler(clock=clock)
+    fiets = _add_search("fiets")
+    auto = _add_search("auto")
+    scheduler.add(SearchSpec("fiets"), lambda _: None, interval=10)
+    scheduler.add(SearchSpec("auto"), lambda _: None, interval=25)
+
+    for second in range(101):
+        clock.now = second
+        scheduler.run_pending()
+
+    assert fiets.call_count == 10
+    assert auto.call_count == 4
+
+
+def test_first_runs_are_spread() -> None:
+    scheduler = SearchScheduler(clock=FakeClock())
+    searches = [
+        scheduler.add(SearchSpec(f"query {i}"), lambda _: None, interval=60)
+        for i in range(20)
+    ]
+
+    next_runs = [search.next_run for search in searches]
+    assert all(0 <= next_run < 60 for next_run in next_runs)
+    assert len(set(next_runs)) == len(next_runs)
+
+
+@responses.activate
+def test_missed_runs_are_skipped_in_phase() -> None:
+    clock = FakeClock()
+    scheduler = SearchScheduler(clock=clock)
+    _add_search("fiets")
+    searches = [
+        scheduler.add(SearchSpec("fiets", limit=i + 1), lambda _: None, interval=60)
+        for i in range(4)
+    ]
+    offsets = [search.next_run for search in searches]
+
+    clock.now = 250  # Stalled for a few intervals
+    scheduler.run_pending()
+    assert [search.runs for search in searches] == [1, 1, 1, 1]
+    # Their next runs are still spread like they were at first
+    for search, offset in zip(searches, offsets, strict=True):
+        assert 250 < search.next_run <= 310
+        assert (search.next_run - offset) % 60 == 0
+
+    clock.now = 251
+    scheduler.run_pending()
+    assert [search.runs for search in searches] == [1, 1, 1, 1]
+
+
+@responses.activate
+def test_failures_and_staleness() -> None:
+    clock = FakeClock()
+    scheduler = SearchScheduler(clock=clock)
+    _add_search("fiets", status=500)
+    received: list[SearchQuery] = []
+    spec = SearchSpec("fiets")
+    scheduler.add(spec, received.append, interval=10)
+
+    clock.now = 10
+    scheduler.run_pending()
+    (stats,) = scheduler.stats()
+
+    assert not received
+    assert (stats.runs, stats.failures) == (1, 1)
+    assert stats.staleness == 10
+    assert stats.last_latency is None
+
+    scheduler.remove(spec, received.append)
+    assert scheduler.stats() == []
+    assert scheduler.seconds_until_next_run() is None
+
+
+@responses.activate
+def test_failing_subscriber_does_not_affect_others() -> None:
+    clock = FakeClock()
+    scheduler = SearchScheduler(clock=clock)
+    _add_search("fiets")
+    received: list[SearchQuery] = []
+
+    def fail(_: SearchQuery) -> None:
+        raise RuntimeError
+
+    scheduler.add(SearchSpec("fiets"), fail, interval=10)
+    scheduler.add(SearchSpec("fiets"), received.append, interval=10)
+    clock.now = 10
+    scheduler.run_pending()
+
+    assert len(received) == 1
+    (stats,) = scheduler.stats()
+    assert stats.failures == 0
+    assert stats.staleness == 0
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+
+import responses
+
+from marktplaats import (
+    CompactListing,
+    Listing,
+    SellerCache,
+    enrich_sellers,
+)
+from marktplaats.query import parse_listing
+from tests.utils import get_mock_file
+
+
+"""Tests for the seller cache and batched seller enrichment."""
+
+PROFILE_URL = "https://www.marktplaats.nl/v/api/seller-profile/{}"
+
+
+def _listings(seller_ids: list[int]) -> list[Listing]:
+    (template,) = json.loads(get_mock_file("query_response.json"))["listings"]
+    return [
+        parse_listing(
+            {
+                **template,
+                "itemId": f"m{i}",
+                "sellerInformation": {
+                    **template["sellerInformation"],
+                    "sellerId": seller_id,
+                },
+            },
+        )
+        for i, seller_id in enumerate(seller_ids)
+    ]
+
+
+def _add_profiles(seller_ids: list[int]) -> list[responses.BaseResponse]:
+    return [
+        responses.get(
+            PROFILE_URL.format(seller_id),
+            body=get_mock_file("seller_response.json"),
+        )
+        for seller_id in seller_ids
+    ]
+
+
+@responses.activate
+def test_each_seller_is_fetched_once() -> None:
+    profiles = _add_profiles([1, 2, 3])
+    listings = _listings([1, 2, 1, 3, 2, 1])
+
+    result = enrich_sellers(listings, max_workers=4, cache=SellerCache())
+    sellers = result.sellers
+
+    assert list(sellers) == [1, 2, 3]
+    assert result.errors == {}
+    assert all(profile.call_count == 1 for profile in profiles)
+    assert sellers[2].number_of_reviews == 175
+    assert all(sellers[listing.seller.id] for listing in listings)
+
+
+@responses.activate
+def test_failed_sellers_are_collected() -> None:
+    _add_profiles([1, 3])
+    responses.get(PROFILE_URL.format(2), body="Not a profile")
+    cache = SellerCache()
+
+    result = enrich_sellers(_listings([1, 2, 3]), cache=cache)
+
+    assert list(result.sellers) == [1, 3]
+    assert list(result.errors) == [2]
+    assert isinstance(result.errors[2], ValueError)
+    assert cache.get(2) is None
+
+
+@responses.activate
+def test_cached_sellers_are_not_fetched_again() -> None:
+    (profile,) = _add_profiles([1])
+    cache = SellerCache()
+
+    first = enrich_sellers(_listings([1]), cache=cache)
+    second = enrich_sellers(
+        [CompactListing.from_listing(listing) for listing in _listings([1])],
+        cache=cache,
+    )
+
+    assert profile.call_count == 1
+    assert second == first
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+@responses.activate
+def test_cached_sellers_expire() -> None:
+    (profile,) = _add_profiles([1])
+    now = 0.0
+    cache = SellerCache(ttl=60, clock=lambda: now)
+    (listing,) = _listings([1])
+
+    listing.seller.get_seller(cache=cache)
+    listing.seller.get_seller(cache=cache)
+    assert profile.call_count == 1
+
+    now = 60
+    listing.seller.get_seller(cache=cache)
+    assert profile.call_count == 2
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+import responses
+
+from marktplaats import L1Category, L2Category, PriceType, SearchQuery
+from marktplaats.store import ChangeKind, ListingStore
+from tests.utils import get_mock_file, get_mock_query_response
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from marktplaats.api_types.search import Listing as ListingResponse
+
+
+"""Tests for keeping listings and their history across runs."""
+
+START = datetime(2024, 3, 10, 12, tzinfo=timezone.utc)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = START
+
+    def __call__(self) -> float:
+        return self.now.timestamp()
+
+    def advance(self, hours: float) -> None:
+        self.now += timedelta(hours=hours)
+
+
+def _listing(item_id: str, price: int, category_id: int = 447) -> ListingResponse:
+    (template,) = json.loads(get_mock_file("query_response.json"))["listings"]
+    listing: ListingResponse = {
+        **template,
+        "itemId": item_id,
+        "priceInfo": {"priceCents": price * 100, "priceType": "FIXED"},
+        "categoryId": category_id,
+    }
+    return listing
+
+
+def test_ingest_tracks_changes(tmp_path: Path) -> None:
+    clock = Clock()
+    store = ListingStore(tmp_path / "listings.db", clock=clock)
+
+    changes = store.ingest([_listing("m1", 100), _listing("m2", 50)])
+    assert [(change.id, change.kind) for change in changes] == [
+        ("m1", ChangeKind.NEW),
+        ("m2", ChangeKind.NEW),
+    ]
+
+    clock.advance(1)
+    # Unchanged listings aren't reported, and the last of duplicates counts
+    changes = store.ingest(
+        [_listing("m1", 100), _listing("m2", 60), _listing("m2", 40)]
+    )
+    assert [
+        (change.id, change.kind, change.old_price_cents, change.price_cents)
+        for change in changes
+    ] == [("m2", ChangeKind.PRICE_CHANGED, 5000, 4000)]
+
+    clock.advance(1)
+    store.ingest([_listing("m2", 40)])
+    gone = store.mark_gone(clock.now - timedelta(minutes=30))
+    assert [(change.id, change.kind) for change in gone] == [("m1", ChangeKind.GONE)]
+    stored = store.get("m1")
+    assert stored is not None
+    assert not stored.active
+    assert stored.last_seen == START + timedelta(hours=1)
+
+    clock.advance(1)
+    changes = store.ingest([_listing("m1", 80)])
+    assert [(change.id, change.kind) for change in changes] == [
+        ("m1", ChangeKind.RETURNED),
+        ("m1", ChangeKind.PRICE_CHANGED),
+    ]
+    assert [change.kind for change in store.history("m1")] == [
+        ChangeKind.NEW,
+        ChangeKind.GONE,
+        ChangeKind.RETURNED,
+        ChangeKind.PRICE_CHANGED,
+    ]
+    stored = store.get("m1")
+    assert stored is not None
+    assert stored.active
+    assert stored.price_cents == 8000
+    assert stored.price_type == PriceType.FIXED
+    assert stored.first_seen == START
+    assert stored.last_seen == clock.now
+    assert store.get("m3") is None
+    assert len(store) == 2
+    store.close()
+
+
+def test_persists_across_runs(tmp_path: Path) -> None:
+    path = tmp_path / "listings.db"
+    with ListingStore(path) as store:
+        store.ingest([_listing("m1", 100)])
+
+    with ListingStore(path) as store:
+        assert store.ingest([_listing("m1", 100)]) == []
+        assert len(store) == 1
+
+
+def test_price_drops(tmp_path: Path) -> None:
+    clock = Clock()
+    store = ListingStore(tmp_path / "listings.db", clock=clock)
+    fietsen = L1Category.from_name("Fietsen en Brommers")
+    bakfietsen = L2Category.from_name("Fietsen | Bakfietsen")
+    other = L2Category.from_name("Fietsendragers")
+    store.ingest(
+        [
+            _listing("m1", 100, bakfietsen.id),
+            _listing("m2", 100, other.id),
+            _listing("m3", 100, bakfietsen.id),
+        ],
+    )
+
+    clock.advance(48)
+    store.ingest([_listing("m1", 90, bakfietsen.id)])  # Too long ago
+    clock.advance(30)
+    store.ingest(
+        [
+            _listing("m1", 80, bakfietsen.id),
+            _listing("m2", 80, other.id),
+            _listing("m3", 120, bakfietsen.id),  # Not a drop
+        ],
+    )
+
+    since = clock.now - timedelta(hours=24)
+    assert [change.id for change in store.price_drops(since)] == ["m1", "m2"]
+    assert [
+        (change.id, change.old_price_cents, change.price_cents)
+        for change in store.price_drops(since, category=bakfietsen)
+    ] == [("m1", 9000, 8000)]
+    assert [change.id for change in store.price_drops(since, category=fietsen)] == [
+        "m1",
+    ]
+    assert [
+        change.id for change in store.changes(since, kind=ChangeKind.PRICE_CHANGED)
+    ] == ["m1", "m2", "m3"]
+    store.close()
+
+
+@responses.activate
+def test_ingest_query(tmp_path: Path) -> None:
+    responses.get(
+        "https://www.marktplaats.nl/lrp/api/search",
+        body=get_mock_query_response(["m1", "m2", "m3"]),  # Padded
+    )
+
+    with ListingStore(tmp_path / "listings.db") as store:
+        changes = store.ingest_query(SearchQuery("fiets", limit=2))
+
+    assert [change.id for change in changes] == ["m1", "m2"]
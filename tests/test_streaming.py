@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+import responses
+
+from marktplaats import JSONDecodeError, ListingsParser, SearchQuery, SearchSpec
+from marktplaats.endpoints import SEARCH_URL
+from tests.utils import get_mock_query_response
+
+
+"""Tests for parsing search responses while they come in."""
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000, 1_000_000])
+def test_parser_yields_every_listing(chunk_size: int) -> None:
+    body = json.loads(get_mock_query_response(["m1", "m2", "m3"]))
+    # Brackets and quotes in strings mustn't confuse it
+    body["listings"][1]["title"] = 'Fiets "[}'
+    body["listings"][2]["description"] = "Mooie fiets met één ] en \\"
+    content = json.dumps(body, ensure_ascii=False, indent=1).encode()
+
+    parser = ListingsParser()
+    listings = []
+    for start in range(0, len(content), chunk_size):
+        listings += parser.feed(content[start : start + chunk_size])
+
+    assert listings == body["listings"]
+    assert parser.close() == {**body, "listings": []}
+
+
+@responses.activate
+def test_stream() -> None:
+    responses.get(
+        SEARCH_URL,
+        body=get_mock_query_response(["m1", "m2", "m3"], total_result_count=42),
+    )
+
+    with SearchSpec("fiets", limit=2).stream(chunk_size=100) as stream:
+        assert stream.total_result_count is None
+        assert [listing.id for listing in stream] == ["m1", "m2"]
+
+    assert stream.total_result_count == 42
+    assert stream.body_json is not None
+    assert stream.body_json["listings"] == []
+    assert stream.response is None
+
+
+@responses.activate
+def test_stream_with_invalid_json() -> None:
+    responses.get(SEARCH_URL, body=get_mock_query_response(["m1"])[:-10])
+
+    stream = SearchSpec("fiets").stream()
+    with pytest.raises(JSONDecodeError):
+        list(stream)
+    assert stream.response is None
+
+
+@responses.activate
+def test_release() -> None:
+    responses.get(
+        SEARCH_URL,
+        body=get_mock_query_response(["m1", "m2"], total_result_count=4),
+    )
+    query = SearchQuery("fiets", limit=2)
+    query.release()
+
+    assert query.response is None
+    assert query.body_json["listings"] == []
+    assert [listing.id for listing in query.get_listings()] == ["m1", "m2"]
+    assert query.total_result_count == 4
+    assert query._remaining_page_offsets() == range(2, 4, 2)  # ruff:ignore[private-member-access] Paging keeps working
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import responses
+
+from marktplaats import (
+    SearchQuery,
+    SellerQuery,
+    Transport,
+    get_default_transport,
+    set_default_transport,
+)
+from marktplaats.models.listing_image import fetch_listing_images
+from marktplaats.transport import REQUEST_HEADERS
+from tests.utils import get_mock_file
+
+
+"""Tests for the pooled HTTP transport."""
+
+
+def test_default_transport_is_shared() -> None:
+    assert get_default_transport() is get_default_transport()
+
+
+def test_set_default_transport() -> None:
+    original = get_default_transport()
+    transport = Transport()
+    try:
+        set_default_transport(transport)
+        assert get_default_transport() is transport
+    finally:
+        set_default_transport(original)
+
+
+def test_pool_configuration() -> None:
+    transport = Transport(pool_maxsize=32, pool_block=True)
+    adapter = transport.session.get_adapter("https://www.marktplaats.nl")
+
+    assert adapter.poolmanager.connection_pool_kw == {"maxsize": 32, "block": True}
+
+
+def test_session_is_reused() -> None:
+    transport = Transport()
+    session = transport.session
+    assert transport.session is session
+
+    transport.close()
+    assert transport.session is not session
+
+
+@responses.activate
+def test_keep_alive_disabled() -> None:
+    responses.get(
+        "https://www.marktplaats.nl/v/api/seller-profile/1",
+        body=get_mock_file("seller_response.json"),
+        match=[
+            responses.matchers.header_matcher(
+                {**REQUEST_HEADERS, "Connection": "close"},
+            ),
+        ],
+    )
+
+    with Transport(keep_alive=False) as transport:
+        details = SellerQuery(1, transport=transport).fetch_details()
+
+    assert details["bankAccount"]
+
+
+@responses.activate
+def test_explicit_transport_is_used() -> None:
+    responses.get(
+        "https://www.marktplaats.nl/lrp/api/search",
+        body=get_mock_file("query_response.json"),
+        match=[responses.matchers.request_kwargs_matcher({"timeout": 3})],
+    )
+    responses.get(
+        "https://link.marktplaats.nl/m123456789",
+        body=get_mock_file("image_response.html"),
+        match=[responses.matchers.request_kwargs_matcher({"timeout": 3})],
+    )
+
+    transport = Transport(timeout=3)
+    query = SearchQuery("fiets", transport=transport)
+
+    assert query.total_result_count == 100
+    assert len(fetch_listing_images("m123456789", transport=transport)) == 9
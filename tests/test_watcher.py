@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+import responses
+
+from marktplaats import SearchSpec, SearchWatcher, SortBy, WatcherState
+from tests.utils import get_mock_query_response
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+"""Tests for watching a search for new listings."""
+
+START = datetime(2024, 12, 31, 12, 0, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = START
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def _add_page(
+    offset: int,
+    item_ids: list[str],
+    *,
+    paid_ids: tuple[str, ...] = (),
+) -> None:
+    body = json.loads(get_mock_query_response(item_ids, total_result_count=100))
+    for listing in body["listings"]:
+        if listing["itemId"] in paid_ids:
+            listing["priorityProduct"] = "DAGTOPPER"
+    responses.get(
+        "https://www.marktplaats.nl/lrp/api/search",
+        json=body,
+        match=[
+            responses.matchers.query_param_matcher(
+                {"offset": str(offset), "limit": "2", "sortBy": "SORT_INDEX"},
+                strict_match=False,
+            ),
+        ],
+    )
+
+
+def _watcher(clock: FakeClock, **kwargs: object) -> SearchWatcher:
+    return SearchWatcher(SearchSpec("fiets", limit=2), clock=clock, **kwargs)  # type: ignore[arg-type]
+
+
+@responses.activate
+def test_only_new_listings_are_returned() -> None:
+    clock = FakeClock()
+    watcher = _watcher(clock)
+
+    _add_page(0, ["m5", "m4"])
+    assert watcher.poll() == []  # The first poll only marks what's there
+    assert watcher.state.newest_id == "m5"
+    assert watcher.spec.sort_by == SortBy.DATE
+
+    clock.now += timedelta(minutes=1)
+    _add_page(0, ["m7", "m6"])
+    _add_page(2, ["m5", "m4"])
+    assert [listing.id for listing in watcher.poll()] == ["m7", "m6"]
+    assert watcher.state.seen_ids == ["m7", "m6", "m5", "m4"]
+    assert len(responses.calls) == 3
+
+    # Only listings offered since an hour before the last poll are asked for
+    offered_since = int((START - timedelta(hours=1)).timestamp()) * 1000
+    assert responses.calls[1].request.params["attributesByKey[]"] == (
+        f"offeredSince:{offered_since}"
+    )
+
+
+@responses.activate
+def test_naive_offered_since() -> None:
+    # In local time, like in the README
+    since = START.astimezone().replace(tzinfo=None) - timedelta(minutes=30)
+    clock = FakeClock()
+    watcher = SearchWatcher(
+        SearchSpec("fiets", limit=2, offered_since=since),
+        clock=clock,
+    )
+
+    _add_page(0, ["m5", "m4"])
+    watcher.poll()
+    clock.now += timedelta(minutes=1)
+    _add_page(0, ["m6", "m5"])
+    assert [listing.id for listing in watcher.poll()] == ["m6"]
+
+    # The later of the two, the spec's, is asked for
+    offered_since = int(since.timestamp()) * 1000
+    assert responses.calls[1].request.params["attributesByKey[]"] == (
+        f"offeredSince:{offered_since}"
+    )
+
+
+@responses.activate
+def test_paid_listings_do_not_stop_polling() -> None:
+    clock = FakeClock()
+    watcher = _watcher(clock, state=WatcherState(["m5", "m4", "m1"], START))
+
+    # m1 is a seen listing that's paid to be shown on top of every page
+    _add_page(0, ["m1", "m7"], paid_ids=("m1",))
+    _add_page(2, ["m6", "m5"])
+
+    assert [listing.id for listing in watcher.poll()] == ["m7", "m6"]
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_max_pages() -> None:
+    watcher = _watcher(FakeClock(), state=WatcherState(["m1"], START), max_pages=2)
+    _add_page(0, ["m9", "m8"])
+    _add_page(2, ["m7", "m6"])
+
+    assert len(watcher.poll()) == 4
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_emit_initial() -> None:
+    watcher = _watcher(FakeClock(), emit_initial=True, max_pages=1)
+    _add_page(0, ["m2", "m1"])
+
+    assert [listing.id for listing in watcher.poll()] == ["m2", "m1"]
+
+
+@responses.activate
+def test_state_is_saved_between_runs(tmp_path: Path) -> None:
+    clock = FakeClock()
+    path = tmp_path / "watcher.json"
+    _add_page(0, ["m2", "m1"])
+    _watcher(clock, state_path=path).poll()
+
+    watcher = _watcher(clock, state_path=path, max_seen=2)
+    assert watcher.state == WatcherState(["m2", "m1"], START)
+
+    _add_page(0, ["m3", "m2"])
+    assert [listing.id for listing in watcher.poll()] == ["m3"]
+    assert WatcherState.from_json(path.read_text(encoding="utf-8")).seen_ids == [
+        "m3",
+        "m2",
+    ]
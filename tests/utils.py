@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import os
 from pathlib import Path
 
@@ -7,3 +8,34 @@ from pathlib import Path
 def get_mock_file(name: str) -> str:
     here = Path(os.path.realpath(__file__)).parent
     return (here / "mock" / name).read_text(encoding="utf-8")
+
+
+def get_mock_query_response(
+    item_ids: list[str],
+    *,
+    total_result_count: int | None = None,
+    max_allowed_page_number: int | None = None,
+) -> str:
+    # A search response with a copy of the mock listing for every ID
+    body = json.loads(get_mock_file("query_response.json"))
+    (template,) = body["listings"]
+    body["listings"] = [{**template, "itemId": item_id} for item_id in item_ids]
+    if total_result_count is not None:
+        body["totalResultCount"] = total_result_count
+    if max_allowed_page_number is not None:
+        body["maxAllowedPageNumber"] = max_allowed_page_number
+    return json.dumps(body)
+
+
+class FakeClock:
+    # A monotonic clock that only moves when slept on
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds